@@ -2,6 +2,8 @@
 ASGI config for azubisc project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+Requests are routed with azubisc.asgi_urls, which serves the catalog and cart
+endpoints with async views, e.g. `uvicorn azubisc.asgi:application --workers 4`.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
@@ -11,6 +13,8 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'azubisc.settings')
+# uvicorn is the production entrypoint; set DJANGO_SETTINGS_MODULE to run it with other settings.
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'azubisc.settings.production')
+os.environ.setdefault('DJANGO_ROOT_URLCONF', 'azubisc.asgi_urls')
 
 application = get_asgi_application()
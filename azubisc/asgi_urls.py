@@ -0,0 +1,12 @@
+"""
+URL configuration used under ASGI (see asgi.py): the same routes as urls.py,
+with the store endpoints that have async views served by them.
+"""
+from django.urls import include, path
+
+from .urls import urlpatterns as wsgi_urlpatterns
+
+urlpatterns = [
+    path('api/v1/store/', include('core.store.async_urls')),
+    *wsgi_urlpatterns,
+]
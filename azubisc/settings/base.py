@@ -46,8 +46,11 @@ LOCAL_APPS = [
 INSTALLED_APPS = DJANGO_APPS + LOCAL_APPS + THIRD_PARTY_APPS
 
 MIDDLEWARE = [
+    'core.common.middleware.ServerTimingMiddleware',
+    'core.common.middleware.QueryInspectionMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
+    'core.common.middleware.ReplicaRoutingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -56,7 +59,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'azubisc.urls'
+ROOT_URLCONF = env('DJANGO_ROOT_URLCONF', default='azubisc.urls')
 
 TEMPLATES = [
     {
@@ -78,15 +81,64 @@ WSGI_APPLICATION = 'azubisc.wsgi.application'
 
 
 DATABASES = {'default': env.db('DATABASE_URL')}
+# Keep connections open between requests instead of reconnecting every time, and
+# check them before reuse so a restarted Postgres/PgBouncer does not surface as errors.
+DATABASES['default']['CONN_MAX_AGE'] = env.int('DB_CONN_MAX_AGE', default=60)
+DATABASES['default']['CONN_HEALTH_CHECKS'] = True
+# PgBouncer in transaction pooling mode may hand each transaction a different server
+# connection, which breaks the server-side cursors used by QuerySet.iterator().
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = env.bool('DB_PGBOUNCER_TRANSACTION_POOLING', default=False)
+
+# Read replicas, e.g. DATABASE_REPLICA_URLS=postgres://...@replica1/db,postgres://...@replica2/db
+# with DATABASE_REPLICA_WEIGHTS=2,1. Safe-method requests read from them in weighted round-robin.
+DATABASE_REPLICAS = {}
+_replica_weights = env.list('DATABASE_REPLICA_WEIGHTS', cast=int, default=[])
+for _index, _url in enumerate(env.list('DATABASE_REPLICA_URLS', default=[])):
+    _alias = f'replica_{_index}'
+    DATABASES[_alias] = {
+        **env.db_url_config(_url),
+        'CONN_MAX_AGE': DATABASES['default']['CONN_MAX_AGE'],
+        'CONN_HEALTH_CHECKS': True,
+        'DISABLE_SERVER_SIDE_CURSORS': DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'],
+        'TEST': {'MIRROR': 'default'},
+    }
+    DATABASE_REPLICAS[_alias] = _replica_weights[_index] if _index < len(_replica_weights) else 1
+
+DATABASE_ROUTERS = ['core.common.routers.ReplicaRouter']
+# Replicas further behind than this (seconds) are skipped until they catch up.
+REPLICA_MAX_LAG = env.float('REPLICA_MAX_LAG', default=2.0)
+REPLICA_LAG_CHECK_INTERVAL = 5
+# Seconds a client keeps reading from the primary after a write.
+REPLICA_STICKY_WINDOW = 5
+REPLICA_PIN_COOKIE = 'azubisc-pin-primary'
+
+# Fraction of requests timed and logged by ServerTimingMiddleware (staff can opt in
+# per request with an `X-Server-Timing: 1` header).
+SERVER_TIMING_SAMPLE_RATE = env.float('SERVER_TIMING_SAMPLE_RATE', default=0.0)
+
+# What QueryInspectionMiddleware does about N+1 patterns and views going over their
+# `max_queries` budget: 'log', 'raise' (the store tests) or 'off'.
+QUERY_INSPECTION = env('QUERY_INSPECTION', default='log')
+# How often one statement template may run in a request before it is reported.
+QUERY_INSPECTION_REPEAT_THRESHOLD = 5
 
 PASSWORD_HASHERS = [
-    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "core.users.hashers.ProfiledArgon2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2PasswordHasher",
     "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
     "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
     "django.contrib.auth.hashers.ScryptPasswordHasher",
 ]
 
+# Argon2 cost profiles. Changing the active profile rehashes passwords on the
+# next successful login. Compare profiles with `manage.py benchmark_password_hashing`.
+PASSWORD_HASHING_PROFILES = {
+    'interactive': {'time_cost': 2, 'memory_cost': 19456, 'parallelism': 1},
+    'balanced': {'time_cost': 2, 'memory_cost': 65536, 'parallelism': 2},
+    'strong': {'time_cost': 2, 'memory_cost': 102400, 'parallelism': 8},
+}
+PASSWORD_HASHING_PROFILE = env('PASSWORD_HASHING_PROFILE', default='strong')
+
 # Password validation
 # https://docs.djangoproject.com/en/3.2/ref/settings/#auth-password-validators
 
@@ -132,6 +184,12 @@ STATIC_ROOT = str(ROOT_DIR / 'staticfiles')
 MEDIA_URL = '/mediafiles/'
 MEDIA_ROOT = str(ROOT_DIR / 'mediafiles')
 
+# Access-controlled media is authorized by Django, then served by nginx from
+# the internal PROTECTED_MEDIA_INTERNAL_URL location via X-Accel-Redirect.
+PROTECTED_MEDIA_URL = '/api/v1/media/'
+PROTECTED_MEDIA_INTERNAL_URL = '/protected-media/'
+PROTECTED_MEDIA_DEFAULTS = ['default_profile_photo.jpg']
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/3.2/ref/settings/#default-auto-field
 
@@ -140,6 +198,29 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 CORS_URLS_REGEX = r'^api/.*$'
 AUTH_USER_MODEL = 'users.User'
 
+REDIS_URL = env('REDIS_URL', default='redis://redis:6379/1')
+REDIS_SOCKET_TIMEOUT = 0.25
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': REDIS_URL,
+        'KEY_PREFIX': 'azubisc',
+        'OPTIONS': {
+            'socket_connect_timeout': REDIS_SOCKET_TIMEOUT,
+            'socket_timeout': REDIS_SOCKET_TIMEOUT,
+        },
+    }
+}
+
+# Namespaces served through core.common.cache.TieredCache. `local_timeout` bounds how
+# long a process may serve an entry from memory, `version_check_interval` how long it
+# may take for an invalidation in another process to be seen.
+TIERED_CACHES = {
+    'categories': {'timeout': 60 * 60, 'local_timeout': 30, 'local_max_entries': 64},
+    'products': {'timeout': 60 * 10, 'local_timeout': 5, 'local_max_entries': 1024},
+}
+
 CELERY_BROKER_URL = env('CELERY_BROKER')
 CELERY_RESULT_BACKEND = CELERY_BROKER_URL
 CELERY_ACCEPT_CONTENT = ['json']
@@ -153,25 +234,44 @@ if USE_TZ:
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'dj_rest_auth.jwt_auth.JWTCookieAuthentication',
+        'core.users.authentication.CachedJWTCookieAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
          'rest_framework.permissions.IsAuthenticated',
     ],
+    'DEFAULT_RENDERER_CLASSES': [
+        'core.common.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'core.common.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
-        'rest_framework.throttling.AnonRateThrottle',
-        'rest_framework.throttling.UserRateThrottle'
+        'core.common.throttling.AnonRedisRateThrottle',
+        'core.common.throttling.UserRedisRateThrottle',
+        'core.common.throttling.ScopedRedisRateThrottle',
     ],
     'DEFAULT_THROTTLE_RATES': {
         'anon': '300/day',
-        'user': '500/day'
+        'user': '500/day',
+        'cart': '60/min',
+        'login': '10/min',
+        'search': '120/min',
+        'feed': '60/hour',
+        'dj_rest_auth': '30/min',
     }
 
 }
 
+# Render JSON byte-identical to DRF's JSONRenderer (Decimals as floats). Turn off
+# to render Decimals as exact strings once clients no longer depend on that.
+ORJSON_RENDERER_COMPAT = True
+
 SIMPLE_JWT = {
     'AUTH_HEADER_TYPES': ('Bearer',),
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=30),
@@ -182,6 +282,11 @@ SIMPLE_JWT = {
     'USER_ID_CLAIM': 'user_id',
 }
 
+# Seconds an authenticated user (with profile) stays cached between requests.
+AUTH_USER_CACHE_TIMEOUT = 60
+# Seconds the serialized /auth/user/ representation stays cached.
+USER_DETAIL_CACHE_TIMEOUT = 60 * 15
+
 REST_AUTH = {
     'USE_JWT': True,
     'JWT_AUTH_COOKIE': 'azubisc-access-token',
@@ -223,3 +328,39 @@ LOGGING = {
         'handlers': ['console']
     },
 }
+
+# Bulk product updates /////////////
+PRODUCT_BULK_UPDATE_CHUNK_SIZE = 1000
+
+# Product delta feed /////////////
+PRODUCT_FEED_CHUNK_SIZE = 2000
+# Seconds changes are held back so transactions still committing are not skipped.
+PRODUCT_FEED_SETTLE_TIME = 5
+# Entries per response under ASGI, where the feed is buffered instead of streamed.
+PRODUCT_FEED_ASYNC_LIMIT = 5000
+
+# Wishlist notifications /////////////
+WISHLIST_NOTIFICATION_EMAIL_BACKEND = env(
+    'WISHLIST_NOTIFICATION_EMAIL_BACKEND', default='djcelery_email.backends.CeleryEmailBackend'
+)
+WISHLIST_NOTIFICATION_CHUNK_SIZE = 1000
+WISHLIST_NOTIFICATION_THROTTLE = 60 * 60
+CELERY_EMAIL_CHUNK_SIZE = 500
+
+# Product image derivatives (longest edge in pixels) /////////////
+PRODUCT_IMAGE_DERIVATIVE_SIZES = {
+    'thumb': 200,
+    'card': 600,
+    'zoom': 1600,
+}
+PRODUCT_IMAGE_DERIVATIVE_QUALITY = 80
+
+# Upload limits /////////////
+# Keep PRODUCT_IMAGE_UPLOAD_MAX_REQUEST_SIZE in step with nginx's client_max_body_size.
+PRODUCT_IMAGE_UPLOAD_MAX_FILE_SIZE = 10 * 1024 * 1024
+PRODUCT_IMAGE_UPLOAD_MAX_REQUEST_SIZE = 20 * 1024 * 1024
+CHUNKED_UPLOAD_MAX_SIZE = 100 * 1024 * 1024
+CHUNKED_UPLOAD_MAX_CHUNK_SIZE = 5 * 1024 * 1024
+CHUNKED_UPLOAD_DIR = env('CHUNKED_UPLOAD_DIR', default=str(ROOT_DIR / 'chunked_uploads'))
+# Unfinished uploads idle for this many seconds are deleted by purge_chunked_uploads.
+CHUNKED_UPLOAD_EXPIRY = 60 * 60 * 24
@@ -5,8 +5,9 @@ from django.conf import settings
 from drf_yasg import openapi
 from drf_yasg.views import get_schema_view
 from rest_framework import permissions
-from dj_rest_auth.views import PasswordResetConfirmView
+from dj_rest_auth.views import LoginView, PasswordResetConfirmView
 from core.users.views import CustomUserDetailsView
+from core.common.views import MetricsView, ProtectedMediaView
 
 schema_view = get_schema_view(
     openapi.Info(
@@ -25,12 +26,15 @@ urlpatterns = [
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0)),
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0)),
     path('api/v1/auth/user/', CustomUserDetailsView.as_view(), name='user_details'),
+    path('api/v1/auth/login/', LoginView.as_view(throttle_scope='login'), name='rest_login'),
     path('api/v1/auth/', include('dj_rest_auth.urls')),
     path('api/v1/auth/registration/', include('dj_rest_auth.registration.urls')),
     path('api/v1/auth/password/reset/confirm<uidb64>/<token>',
          PasswordResetConfirmView.as_view(), name='password_reset_confirm'),
     path('api/v1/users/', include('core.users.urls')),
-    path('api/v1/store/', include('core.store.urls'))
+    path('api/v1/store/', include('core.store.urls')),
+    path('api/v1/media/<path:path>', ProtectedMediaView.as_view(), name='protected_media'),
+    path('api/v1/metrics/', MetricsView.as_view(), name='metrics'),
 ]
 
 admin.site.site_header = 'Azubi Shopping Cart API'
@@ -1,3 +1,26 @@
-from django.contrib import admin
+from django.db.models import Q
 
-# Register your models here.
+from core.utils.pagination import EstimatedCountPaginator
+
+
+class LargeTableAdminMixin:
+    """
+    Changelist defaults for tables with millions of rows: estimated counts,
+    no second COUNT(*) for filtered results, and case-insensitive prefix
+    search, which can use an UPPER(column) text_pattern_ops index on
+    PostgreSQL where a contains search has to scan the table.
+    """
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+
+    def get_search_results(self, request, queryset, search_term):
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+
+        query = Q()
+        for field in self.get_search_fields(request):
+            # istartswith becomes `UPPER(column) LIKE UPPER('term%')`, unlike the default icontains.
+            query |= Q(**{f'{field.lstrip("^=@")}__istartswith': search_term})
+        return queryset.filter(query), False
@@ -5,3 +5,6 @@ class CommonConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core.common'
     verbose_name = _('Common')
+
+    def ready(self):
+        from core.common import signals
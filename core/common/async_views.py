@@ -0,0 +1,134 @@
+import asyncio
+import math
+
+from asgiref.sync import sync_to_async
+from django.http import Http404, HttpResponse
+from django.views import View
+from rest_framework import exceptions, status
+from rest_framework.permissions import AllowAny
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from core.common.timing import timed
+
+
+class AsyncAPIView(View):
+    """
+    Async counterpart of APIView for hot endpoints served over ASGI.
+
+    DRF 3.14 views are synchronous, so this view does the parts of the APIView
+    request cycle these endpoints need: authentication, permissions and
+    throttling with the REST_FRAMEWORK defaults, JSON parsing and rendering, and
+    DRF-style error responses. Handlers are coroutines that return `respond()`.
+    Methods without an async handler are served by `sync_view`, the regular
+    APIView for the same URL.
+    """
+    authentication_classes = api_settings.DEFAULT_AUTHENTICATION_CLASSES
+    permission_classes = [AllowAny]
+    throttle_classes = api_settings.DEFAULT_THROTTLE_CLASSES
+    parser_classes = api_settings.DEFAULT_PARSER_CLASSES
+    renderer = api_settings.DEFAULT_RENDERER_CLASSES[0]()
+    sync_view = None
+    sync_handler = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Share the query budget of the sync view, see QueryInspectionMiddleware.
+        if cls.sync_view is not None and 'max_queries' not in cls.__dict__:
+            cls.max_queries = getattr(cls.sync_view, 'max_queries', None)
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        if cls.sync_view is not None:
+            initkwargs.setdefault('sync_handler', sync_to_async(cls.sync_view.as_view()))
+        view = super().as_view(**initkwargs)
+        # Like APIView.as_view: CSRF is enforced by session authentication, not
+        # by the middleware. Set directly, since csrf_exempt() would hide the coroutine.
+        view.csrf_exempt = True
+        return view
+
+    def get_permissions(self):
+        return [permission() for permission in self.permission_classes]
+
+    def respond(self, data, status=status.HTTP_200_OK, headers=None):
+        with timed('render'):
+            content = self.renderer.render(data)
+        return HttpResponse(content, status=status, content_type='application/json', headers=headers)
+
+    async def dispatch(self, request, *args, **kwargs):
+        method = request.method.lower()
+        handler = getattr(self, method, None) if method in self.http_method_names else None
+        if not asyncio.iscoroutinefunction(handler):
+            if self.sync_handler is not None:
+                return await self.sync_handler(request, *args, **kwargs)
+            handler = None
+
+        request = Request(
+            request,
+            parsers=[parser() for parser in self.parser_classes],
+            authenticators=[auth() for auth in self.authentication_classes],
+        )
+        self.request = request
+        try:
+            await self.initial(request)
+            if handler is None:
+                raise exceptions.MethodNotAllowed(request.method)
+            return await handler(request, *args, **kwargs)
+        except Http404:
+            return self.handle_exception(exceptions.NotFound())
+        except exceptions.APIException as exc:
+            return self.handle_exception(exc)
+
+    async def initial(self, request):
+        # Authenticates (the JWT user lookup is cached, see CachedJWTCookieAuthentication).
+        await sync_to_async(lambda: request.user)()
+
+        for permission in self.get_permissions():
+            if not permission.has_permission(request, self):
+                if request.authenticators and not request.successful_authenticator:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied(getattr(permission, 'message', None))
+
+        waits = []
+        for throttle in [throttle() for throttle in self.throttle_classes]:
+            if hasattr(throttle, 'aallow_request'):
+                allowed = await throttle.aallow_request(request, self)
+            else:
+                allowed = await sync_to_async(throttle.allow_request)(request, self)
+            if not allowed:
+                waits.append(throttle.wait())
+        if waits:
+            raise exceptions.Throttled(max((wait for wait in waits if wait is not None), default=None))
+
+    def handle_exception(self, exc):
+        headers = {}
+        if isinstance(exc, (exceptions.NotAuthenticated, exceptions.AuthenticationFailed)):
+            authenticators = self.request.authenticators
+            auth_header = authenticators[0].authenticate_header(self.request) if authenticators else None
+            if auth_header:
+                headers['WWW-Authenticate'] = auth_header
+            else:
+                exc.status_code = status.HTTP_403_FORBIDDEN
+        if getattr(exc, 'wait', None):
+            headers['Retry-After'] = str(math.ceil(exc.wait))
+
+        data = exc.detail if isinstance(exc.detail, (list, dict)) else {'detail': exc.detail}
+        return self.respond(data, exc.status_code, headers)
+
+
+async def apaginate(request, queryset, page_size):
+    """
+    Async version of PageNumberPagination.paginate_queryset returning
+    (count, objects). One COUNT query and one page query, both on the async ORM.
+    """
+    try:
+        page = int(request.query_params.get('page', 1))
+    except ValueError:
+        raise exceptions.NotFound('Invalid page.')
+
+    count = await queryset.acount()
+    if page < 1 or (page > 1 and (page - 1) * page_size >= count):
+        raise exceptions.NotFound('Invalid page.')
+
+    offset = (page - 1) * page_size
+    return count, [obj async for obj in queryset[offset:offset + page_size]]
@@ -0,0 +1,28 @@
+import math
+
+
+def percentile(samples, q):
+    """
+    Nearest-rank percentile of `samples` for `q` between 0 and 100.
+    """
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    rank = max(math.ceil(q / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
+
+
+def summarize(samples):
+    """
+    Summarize latencies given in seconds as milliseconds.
+    """
+    if not samples:
+        return {'count': 0, 'mean': None, 'p50': None, 'p95': None, 'p99': None, 'max': None}
+    return {
+        'count': len(samples),
+        'mean': sum(samples) / len(samples) * 1000,
+        'p50': percentile(samples, 50) * 1000,
+        'p95': percentile(samples, 95) * 1000,
+        'p99': percentile(samples, 99) * 1000,
+        'max': max(samples) * 1000,
+    }
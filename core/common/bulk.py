@@ -0,0 +1,111 @@
+import io
+from itertools import islice
+
+from django.core.management.color import no_style
+from django.db import connections
+from django.utils import timezone
+
+
+def batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _copy_value(value):
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+    return str(value)
+
+
+def _default_getters(model, fields, connection):
+    """
+    Return (column, getter) pairs for the concrete fields left out of `fields`,
+    so COPY rows carry the same defaults a model instance would.
+    """
+    getters = []
+    for field in model._meta.concrete_fields:
+        if field.attname in fields or field.name in fields or field.primary_key:
+            continue
+        if getattr(field, 'auto_now', False) or getattr(field, 'auto_now_add', False):
+            getters.append((field.column, timezone.now))
+        elif field.has_default() and callable(field.default):
+            getters.append((field.column, lambda field=field: field.get_db_prep_save(field.get_default(), connection)))
+        else:
+            value = field.get_default()
+            if value is None and not field.null:
+                raise ValueError(f'{model.__name__}.{field.name} has no default, pass it in fields.')
+            value = field.get_db_prep_save(value, connection)
+            getters.append((field.column, lambda value=value: value))
+    return getters
+
+
+def copy_rows(model, fields, rows, using='default', batch_size=50000):
+    """
+    Insert `rows`, tuples of database-ready values in `fields` order, in
+    batches and return the number of rows inserted.
+
+    PostgreSQL loads each batch with COPY; other backends fall back to
+    bulk_create. Either way signals are not sent and save() is not called.
+    Fields left out get their model default; with bulk_create, auto_now and
+    auto_now_add fields are always set to the current time.
+    """
+    connection = connections[using]
+    inserted = 0
+
+    if connection.vendor != 'postgresql':
+        for batch in batched(rows, batch_size):
+            model.objects.using(using).bulk_create([model(**dict(zip(fields, row))) for row in batch])
+            inserted += len(batch)
+        return inserted
+
+    getters = _default_getters(model, fields, connection)
+    columns = [model._meta.get_field(field).column for field in fields] + [column for column, _ in getters]
+    for batch in batched(rows, batch_size):
+        copy_into(
+            model._meta.db_table, columns,
+            ((*row, *(getter() for _, getter in getters)) for row in batch),
+            using=using
+        )
+        inserted += len(batch)
+    return inserted
+
+
+def copy_into(table, columns, rows, using='default'):
+    """
+    Load `rows` into a PostgreSQL table, e.g. a temporary staging table,
+    with a single COPY.
+    """
+    connection = connections[using]
+    quote = connection.ops.quote_name
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write('\t'.join(map(_copy_value, row)))
+        buffer.write('\n')
+    buffer.seek(0)
+    with connection.cursor() as cursor:
+        cursor.copy_expert(
+            f'COPY {quote(table)} ({", ".join(quote(column) for column in columns)}) FROM STDIN', buffer
+        )
+
+
+def next_id(model, using='default'):
+    """
+    First primary key after the existing rows, for loads that assign their own keys.
+    """
+    last = model.objects.using(using).order_by('-pk').values_list('pk', flat=True).first()
+    return (last or 0) + 1
+
+
+def reset_sequences(*models, using='default'):
+    """
+    Move primary key sequences past explicitly inserted keys.
+    """
+    connection = connections[using]
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
@@ -0,0 +1,211 @@
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+import redis
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+class TieredCache:
+    """
+    Namespaced two-tier cache for small, very hot objects.
+
+    Reads go to a bounded in-process LRU first, then to the shared Redis-backed
+    Django cache. Shared keys embed a namespace version stored in Redis;
+    `invalidate()` replaces that version, which orphans every shared entry of
+    the namespace and, within `version_check_interval` seconds, every local
+    entry in every other process too. Redis errors are treated as misses.
+    """
+
+    def __init__(self, namespace, timeout=300, local_timeout=5, local_max_entries=256,
+                 version_check_interval=1.0, lock_timeout=10, alias='default'):
+        self.namespace = namespace
+        self.timeout = timeout
+        self.local_timeout = local_timeout
+        self.local_max_entries = local_max_entries
+        self.version_check_interval = version_check_interval
+        self.lock_timeout = lock_timeout
+        self.alias = alias
+        self.version_key = f'tiered:{namespace}:version'
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    def reset(self):
+        with self._lock:
+            self._local.clear()
+            self._version = None
+            self._version_checked_at = 0
+            self.local_hits = self.shared_hits = self.misses = 0
+
+    def _current_version(self):
+        now = time.monotonic()
+        if self._version is not None and now - self._version_checked_at < self.version_check_interval:
+            return self._version
+
+        try:
+            version = self.shared.get(self.version_key)
+            if version is None:
+                self.shared.add(self.version_key, uuid.uuid4().hex, None)
+                version = self.shared.get(self.version_key)
+        except redis.RedisError as error:
+            logger.warning(f'Shared cache unavailable for namespace {self.namespace}: {error}')
+            version = self._version
+
+        with self._lock:
+            if version != self._version:
+                self._local.clear()
+            self._version = version
+            self._version_checked_at = now
+        return version
+
+    def _shared_key(self, key, version):
+        return f'tiered:{self.namespace}:{version}:{key}'
+
+    def _set_local(self, key, value):
+        with self._lock:
+            self._local[key] = (time.monotonic() + self.local_timeout, value)
+            self._local.move_to_end(key)
+            while len(self._local) > self.local_max_entries:
+                self._local.popitem(last=False)
+
+    def _get_local(self, key):
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return MISSING
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._local[key]
+                return MISSING
+            self._local.move_to_end(key)
+            return value
+
+    def get(self, key, default=None):
+        version = self._current_version()
+        value = self._get_local(key)
+        if value is not MISSING:
+            self.local_hits += 1
+            return value
+
+        try:
+            value = self.shared.get(self._shared_key(key, version), MISSING)
+        except redis.RedisError as error:
+            logger.warning(f'Shared cache unavailable for namespace {self.namespace}: {error}')
+            value = MISSING
+
+        if value is MISSING:
+            self.misses += 1
+            return default
+
+        self.shared_hits += 1
+        self._set_local(key, value)
+        return value
+
+    def set(self, key, value, timeout=None):
+        version = self._current_version()
+        self._set_local(key, value)
+        try:
+            self.shared.set(self._shared_key(key, version), value, self.timeout if timeout is None else timeout)
+        except redis.RedisError as error:
+            logger.warning(f'Shared cache unavailable for namespace {self.namespace}: {error}')
+
+    def get_or_set(self, key, producer, timeout=None):
+        """
+        Return the cached value, computing it with `producer()` on a miss.
+        Only one process recomputes a missing key at a time; the others wait
+        up to `lock_timeout` seconds for its result instead of stampeding.
+        """
+        value = self.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        version = self._current_version()
+        shared_key = self._shared_key(key, version)
+        lock_key = f'{shared_key}:lock'
+        try:
+            acquired = self.shared.add(lock_key, True, self.lock_timeout)
+        except redis.RedisError:
+            acquired = True
+
+        if not acquired:
+            deadline = time.monotonic() + self.lock_timeout
+            while time.monotonic() < deadline:
+                time.sleep(0.05)
+                try:
+                    value = self.shared.get(shared_key, MISSING)
+                except redis.RedisError:
+                    break
+                if value is not MISSING:
+                    self._set_local(key, value)
+                    return value
+
+        try:
+            value = producer()
+            self.set(key, value, timeout)
+        finally:
+            if acquired:
+                try:
+                    self.shared.delete(lock_key)
+                except redis.RedisError:
+                    pass
+        return value
+
+    def invalidate(self):
+        """
+        Invalidate the whole namespace in every process.
+        """
+        version = uuid.uuid4().hex
+        try:
+            self.shared.set(self.version_key, version, None)
+        except redis.RedisError as error:
+            logger.warning(f'Could not invalidate namespace {self.namespace}: {error}')
+        with self._lock:
+            self._local.clear()
+            self._version = version
+            self._version_checked_at = time.monotonic()
+
+    def stats(self):
+        lookups = self.local_hits + self.shared_hits + self.misses
+        return {
+            'local_hits': self.local_hits,
+            'shared_hits': self.shared_hits,
+            'misses': self.misses,
+            'local_entries': len(self._local),
+            'hit_ratio': (self.local_hits + self.shared_hits) / lookups if lookups else None,
+        }
+
+
+_tiered_caches = {}
+_registry_lock = threading.Lock()
+
+
+def get_tiered_cache(namespace):
+    """
+    Return the process-wide TieredCache for a namespace, configured from
+    settings.TIERED_CACHES[namespace].
+    """
+    with _registry_lock:
+        if namespace not in _tiered_caches:
+            _tiered_caches[namespace] = TieredCache(namespace, **settings.TIERED_CACHES.get(namespace, {}))
+        return _tiered_caches[namespace]
+
+
+def tiered_cache_stats():
+    return {namespace: tiered.stats() for namespace, tiered in _tiered_caches.items()}
+
+
+def reset_tiered_caches():
+    for tiered in _tiered_caches.values():
+        tiered.reset()
@@ -0,0 +1,68 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+from django.core.management.base import BaseCommand
+
+from core.common.benchmark import summarize
+
+
+def fetch_until(url, headers, deadline):
+    samples, errors = [], 0
+    while time.monotonic() < deadline:
+        start = time.perf_counter()
+        try:
+            with urlopen(Request(url, headers=headers), timeout=30) as response:
+                response.read()
+        except (HTTPError, URLError, OSError):
+            errors += 1
+            continue
+        samples.append(time.perf_counter() - start)
+    return samples, errors
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare throughput of running servers under concurrent connections, e.g. gunicorn sync workers '
+        '(`gunicorn azubisc.wsgi:application -w 4 -b :8000`) against uvicorn '
+        '(`uvicorn azubisc.asgi:application --workers 4 --port 8001`): '
+        '`benchmark_concurrency http://localhost:8000/api/v1/store/products/ '
+        'http://localhost:8001/api/v1/store/products/ --concurrency 1 10 50 100`. '
+        'Start both with the same DJANGO_SETTINGS_MODULE, and raise the throttle rates on the servers under test.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('urls', nargs='+', help='Full URLs to request, one run per URL.')
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 10, 50])
+        parser.add_argument('--duration', type=float, default=10, help='Seconds per run.')
+        parser.add_argument(
+            '--header', action='append', default=[],
+            help='Extra request header, e.g. "Authorization: Bearer <token>". Repeatable.'
+        )
+
+    def handle(self, *args, **options):
+        headers = dict(header.split(':', 1) for header in options['header'])
+        headers = {name.strip(): value.strip() for name, value in headers.items()}
+
+        self.stdout.write(
+            f'{"url":<50} {"conc":>5} {"req/s":>8} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"errors":>7}'
+        )
+        for url in options['urls']:
+            for concurrency in options['concurrency']:
+                samples, errors = self.run(url, headers, concurrency, options['duration'])
+                stats = summarize(samples)
+                if not samples:
+                    self.stdout.write(f'{url:<50} {concurrency:>5} {0:>8.1f} {"-":>8} {"-":>8} {"-":>8} {errors:>7}')
+                    continue
+                self.stdout.write(
+                    f'{url:<50} {concurrency:>5} {len(samples) / options["duration"]:>8.1f} '
+                    f'{stats["p50"]:>8.2f} {stats["p95"]:>8.2f} {stats["p99"]:>8.2f} {errors:>7}'
+                )
+
+    def run(self, url, headers, concurrency, duration):
+        deadline = time.monotonic() + duration
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            results = list(executor.map(lambda _: fetch_until(url, headers, deadline), range(concurrency)))
+        samples = [sample for worker_samples, _ in results for sample in worker_samples]
+        return samples, sum(errors for _, errors in results)
@@ -0,0 +1,72 @@
+import time
+from unittest import mock
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.test import Client
+from rest_framework.views import APIView
+
+from core.common.benchmark import summarize
+from core.common.metrics import database_metrics
+
+
+class Command(BaseCommand):
+    help = (
+        'Request an endpoint in-process and report latency percentiles for each CONN_MAX_AGE value, '
+        'e.g. `benchmark_endpoint /api/v1/store/products/ --conn-max-age 0 60`.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='/api/v1/store/products/')
+        parser.add_argument('--requests', type=int, default=200, help='Timed requests per run.')
+        parser.add_argument('--warmup', type=int, default=10, help='Untimed requests before each run.')
+        parser.add_argument(
+            '--conn-max-age', type=int, nargs='+', default=[0, 60],
+            help='CONN_MAX_AGE values to compare (0 reconnects on every request).'
+        )
+        parser.add_argument('--database', default=DEFAULT_DB_ALIAS)
+        parser.add_argument('--host', default='localhost', help='Host header, must be in ALLOWED_HOSTS.')
+
+    def handle(self, *args, **options):
+        connection = connections[options['database']]
+        original_max_age = connection.settings_dict['CONN_MAX_AGE']
+        client = Client(HTTP_HOST=options['host'])
+
+        self.stdout.write(f'{"conn_max_age":>12} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8} {"connections":>12}')
+        # Throttling is bypassed so the anonymous rate does not cap the number of requests.
+        with mock.patch.object(APIView, 'get_throttles', lambda view: []):
+            try:
+                for max_age in options['conn_max_age']:
+                    connection.close()
+                    connection.settings_dict['CONN_MAX_AGE'] = max_age
+                    samples, opened = self.run(client, options)
+                    stats = summarize(samples)
+                    self.stdout.write(
+                        f'{max_age:>12} {stats["p50"]:>8.2f} {stats["p95"]:>8.2f} {stats["p99"]:>8.2f} {opened:>12}'
+                    )
+            finally:
+                connection.close()
+                connection.settings_dict['CONN_MAX_AGE'] = original_max_age
+
+    def request(self, client, path):
+        # The test client disconnects close_old_connections from request_started
+        # and request_finished, so do what the request handler would around it.
+        close_old_connections()
+        response = client.get(path)
+        close_old_connections()
+        return response
+
+    def run(self, client, options):
+        path = options['path']
+        for _ in range(options['warmup']):
+            self.request(client, path)
+
+        opened_before = database_metrics.opened[options['database']]
+        samples = []
+        for _ in range(options['requests']):
+            start = time.perf_counter()
+            response = self.request(client, path)
+            samples.append(time.perf_counter() - start)
+            if response.status_code != 200:
+                raise CommandError(f'{path} returned {response.status_code}.')
+        return samples, database_metrics.opened[options['database']] - opened_before
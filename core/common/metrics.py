@@ -0,0 +1,50 @@
+import os
+import threading
+import time
+from collections import Counter
+
+from django.db import connections
+
+
+class DatabaseConnectionMetrics:
+    """
+    Per-process counters showing how often requests have to open a new
+    database connection instead of reusing a persistent one.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.opened = Counter()
+            self.last_opened_at = {}
+            self.requests = 0
+
+    def connection_opened(self, alias):
+        with self._lock:
+            self.opened[alias] += 1
+            self.last_opened_at[alias] = time.time()
+
+    def request_finished(self):
+        with self._lock:
+            self.requests += 1
+
+    def snapshot(self):
+        databases = {}
+        for alias in connections:
+            settings_dict = connections[alias].settings_dict
+            opened = self.opened[alias]
+            databases[alias] = {
+                'connections_opened': opened,
+                'connections_per_request': opened / self.requests if self.requests else None,
+                'last_opened_at': self.last_opened_at.get(alias),
+                'conn_max_age': settings_dict.get('CONN_MAX_AGE'),
+                'conn_health_checks': settings_dict.get('CONN_HEALTH_CHECKS'),
+                'server_side_cursors': not settings_dict.get('DISABLE_SERVER_SIDE_CURSORS'),
+            }
+        return {'pid': os.getpid(), 'requests': self.requests, 'databases': databases}
+
+
+database_metrics = DatabaseConnectionMetrics()
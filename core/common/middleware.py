@@ -0,0 +1,174 @@
+import asyncio
+import logging
+import random
+import time
+
+from django.conf import settings
+from django.utils.deprecation import MiddlewareMixin
+from rest_framework.permissions import SAFE_METHODS
+
+from core.common.queries import QueryInspectionError, QueryLog, current_query_log, query_budget
+from core.common.routers import read_from_replica
+from core.common.timing import Timings, current_timings
+
+logger = logging.getLogger(__name__)
+
+
+class ReplicaRoutingMiddleware(MiddlewareMixin):
+    """
+    Let safe-method requests read from replicas. A client that has just made
+    a successful write gets a cookie pinning it to the primary for
+    REPLICA_STICKY_WINDOW seconds, so it reads its own writes.
+    Works in both sync and async middleware chains.
+    """
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.acall(request)
+
+        token = read_from_replica.set(self.use_replica(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            read_from_replica.reset(token)
+        return self.pin_writer(request, response)
+
+    async def acall(self, request):
+        token = read_from_replica.set(self.use_replica(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            read_from_replica.reset(token)
+        return self.pin_writer(request, response)
+
+    def use_replica(self, request):
+        return request.method in SAFE_METHODS and settings.REPLICA_PIN_COOKIE not in request.COOKIES
+
+    def pin_writer(self, request, response):
+        if settings.DATABASE_REPLICAS and request.method not in SAFE_METHODS and response.status_code < 400:
+            response.set_cookie(
+                settings.REPLICA_PIN_COOKIE, '1', max_age=settings.REPLICA_STICKY_WINDOW,
+                httponly=True, samesite='Lax'
+            )
+        return response
+
+
+class ServerTimingMiddleware(MiddlewareMixin):
+    """
+    Record DB, filter, serialize and render time for a sample of requests
+    (SERVER_TIMING_SAMPLE_RATE) and for requests sending `X-Server-Timing: 1`.
+    Results are logged keyed by URL name, and returned in a Server-Timing
+    header for sampled requests and staff. Other requests are not instrumented.
+    """
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.acall(request)
+
+        timings = self.start(request)
+        if timings is None:
+            return self.get_response(request)
+
+        token = current_timings.set(timings)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    async def acall(self, request):
+        timings = self.start(request)
+        if timings is None:
+            return await self.get_response(request)
+
+        token = current_timings.set(timings)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_timings.reset(token)
+        return self.finish(request, response, timings)
+
+    def start(self, request):
+        sampled = random.random() < settings.SERVER_TIMING_SAMPLE_RATE
+        if not sampled and request.headers.get('X-Server-Timing') != '1':
+            return None
+        return Timings(sampled=sampled)
+
+    def process_template_response(self, request, response):
+        # DRF responses are rendered after the view returns, right after this hook.
+        timings = current_timings.get()
+        if timings is not None:
+            start = time.perf_counter()
+            response.add_post_render_callback(lambda rendered: timings.add('render', time.perf_counter() - start))
+        return response
+
+    def finish(self, request, response, timings):
+        user = getattr(request, 'user', None)
+        if not timings.sampled and not (user and user.is_staff):
+            return response
+
+        url_name = request.resolver_match.url_name if request.resolver_match else None
+        fields = timings.as_fields()
+        logger.info(
+            f'url_name={url_name} method={request.method} status={response.status_code} '
+            + ' '.join(f'{name}={value}' for name, value in fields.items()),
+            extra={'url_name': url_name, 'status': response.status_code, 'timings': fields}
+        )
+        response['Server-Timing'] = timings.header()
+        return response
+
+
+class QueryInspectionMiddleware(MiddlewareMixin):
+    """
+    Flag N+1 patterns, i.e. a statement template repeated more than
+    QUERY_INSPECTION_REPEAT_THRESHOLD times in one request, and requests
+    running more queries than the view's `max_queries` budget.
+    QUERY_INSPECTION is 'log' (warn), 'raise' (tests) or 'off'.
+    """
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self.get_response):
+            return self.acall(request)
+        if settings.QUERY_INSPECTION == 'off':
+            return self.get_response(request)
+
+        query_log = QueryLog()
+        token = current_query_log.set(query_log)
+        try:
+            response = self.get_response(request)
+        finally:
+            current_query_log.reset(token)
+        return self.inspect(request, response, query_log)
+
+    async def acall(self, request):
+        if settings.QUERY_INSPECTION == 'off':
+            return await self.get_response(request)
+
+        query_log = QueryLog()
+        token = current_query_log.set(query_log)
+        try:
+            response = await self.get_response(request)
+        finally:
+            current_query_log.reset(token)
+        return self.inspect(request, response, query_log)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request.query_budget = query_budget(getattr(view_func, 'view_class', None), request.method)
+
+    def inspect(self, request, response, query_log):
+        problems = [
+            f'{count} x {template}'
+            for template, count in query_log.repeated(settings.QUERY_INSPECTION_REPEAT_THRESHOLD)
+        ]
+        budget = getattr(request, 'query_budget', None)
+        if budget is not None and query_log.count > budget:
+            problems.append(f'{query_log.count} queries, the view allows {budget}')
+        if not problems:
+            return response
+
+        url_name = request.resolver_match.url_name if request.resolver_match else None
+        message = f'{request.method} {request.path} ({url_name}): ' + '; '.join(problems)
+        if settings.QUERY_INSPECTION == 'raise':
+            raise QueryInspectionError(message)
+        logger.warning(message, extra={'url_name': url_name, 'queries': query_log.count})
+        return response
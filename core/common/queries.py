@@ -0,0 +1,72 @@
+import contextvars
+import re
+from collections import Counter
+
+# The QueryLog of the current request, None when queries are not inspected.
+current_query_log = contextvars.ContextVar('current_query_log', default=None)
+
+STRING = re.compile(r"'(?:[^']|'')*'")
+NUMBER = re.compile(r'\b\d+\b')
+IN_LIST = re.compile(r'\bIN \((?:%s|\?)(?:,\s*(?:%s|\?))*\)', re.IGNORECASE)
+WHITESPACE = re.compile(r'\s+')
+TRANSACTION_CONTROL = re.compile(r'^(SAVEPOINT|RELEASE SAVEPOINT|ROLLBACK TO SAVEPOINT)\b', re.IGNORECASE)
+
+
+class QueryInspectionError(Exception):
+    """
+    Raised instead of logging when QUERY_INSPECTION is 'raise', e.g. in tests.
+    """
+
+
+def normalize_sql(sql):
+    """
+    Reduce a statement to its template: literals become `?` and IN lists of
+    any length become `IN (...)`, so queries differing only by values match.
+    """
+    sql = STRING.sub('?', sql)
+    sql = NUMBER.sub('?', sql)
+    sql = IN_LIST.sub('IN (...)', sql)
+    return WHITESPACE.sub(' ', sql).strip()
+
+
+class QueryLog:
+    """
+    Statements run during one request. Raw SQL is counted while the request
+    runs and only normalized when it is inspected.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.statements = Counter()
+
+    def add(self, sql):
+        self.count += 1
+        self.statements[sql] += 1
+
+    def repeated(self, threshold):
+        templates = Counter()
+        for sql, count in self.statements.items():
+            if not TRANSACTION_CONTROL.match(sql):
+                templates[normalize_sql(sql)] += count
+        return [(template, count) for template, count in templates.most_common() if count > threshold]
+
+
+def record_statement(execute, sql, params, many, context):
+    """
+    Execute wrapper installed on every database connection (see signals.py).
+    """
+    query_log = current_query_log.get()
+    if query_log is not None:
+        query_log.add(sql)
+    return execute(sql, params, many, context)
+
+
+def query_budget(view_class, method):
+    """
+    The `max_queries` a view declares for a method: either one number for
+    every method or a dict by method, e.g. {'GET': 5}.
+    """
+    max_queries = getattr(view_class, 'max_queries', None)
+    if isinstance(max_queries, dict):
+        return max_queries.get(method)
+    return max_queries
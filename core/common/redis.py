@@ -0,0 +1,38 @@
+import asyncio
+import weakref
+from functools import lru_cache
+
+import redis
+import redis.asyncio
+from django.conf import settings
+
+
+@lru_cache(maxsize=None)
+def get_redis():
+    """
+    Shared Redis client for the process. Connections are pooled by redis-py.
+    """
+    return redis.Redis.from_url(
+        settings.REDIS_URL,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+    )
+
+
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def get_async_redis():
+    """
+    asyncio Redis client for the running event loop. Its connections belong
+    to that loop, so each loop gets its own client.
+    """
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = _async_clients[loop] = redis.asyncio.Redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        )
+    return client
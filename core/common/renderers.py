@@ -0,0 +1,70 @@
+import decimal
+
+import orjson
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils import encoders
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def has_incompatible_floats(obj):
+    """
+    Return True if `obj` holds a float that orjson would not render like
+    json.dumps: NaN and infinities (rendered as null instead of raising) and
+    magnitudes outside [1e-4, 1e16), where repr() switches to exponent notation.
+    """
+    if isinstance(obj, float):
+        return not (obj == 0 or 1e-4 <= abs(obj) < 1e16)
+    if isinstance(obj, dict):
+        return any(map(has_incompatible_floats, obj.values()))
+    if isinstance(obj, (list, tuple)):
+        return any(map(has_incompatible_floats, obj))
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that serializes with orjson. Datetimes, UUIDs, dicts and
+    lists are handled natively; anything else goes through DRF's encoder.
+
+    With ORJSON_RENDERER_COMPAT (the default) the output is byte-identical to
+    JSONRenderer: Decimals are rendered as floats and U+2028/U+2029 are
+    escaped. Payloads holding floats orjson formats differently, NaN or
+    infinities are found with one pass over the data and rendered by
+    JSONRenderer instead. Without it Decimals are rendered as exact strings,
+    the way serializers already coerce them, floats are not checked and the
+    escaping is skipped. Pretty-printed, ASCII-only or non-compact output,
+    and anything orjson cannot encode (e.g. non-string keys), falls back to
+    JSONRenderer.
+    """
+    encoder = encoders.JSONEncoder()
+
+    def default(self, obj):
+        if isinstance(obj, decimal.Decimal) and not settings.ORJSON_RENDERER_COMPAT:
+            return str(obj)
+        value = self.encoder.default(obj)
+        if settings.ORJSON_RENDERER_COMPAT and has_incompatible_floats(value):
+            raise TypeError(f'{value!r} is rendered by JSONRenderer')
+        return value
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if (
+            indent is not None or self.ensure_ascii or not self.compact
+            or settings.ORJSON_RENDERER_COMPAT and has_incompatible_floats(data)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            content = orjson.dumps(data, default=self.default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Both separators start with these bytes, so most content is scanned only once.
+        if settings.ORJSON_RENDERER_COMPAT and b'\xe2\x80' in content:
+            content = content.replace('\u2028'.encode(), b'\\u2028').replace('\u2029'.encode(), b'\\u2029')
+        return content
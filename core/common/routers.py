@@ -0,0 +1,115 @@
+import contextvars
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connections
+
+logger = logging.getLogger(__name__)
+
+# Set by ReplicaRoutingMiddleware for requests whose reads may go to a replica.
+read_from_replica = contextvars.ContextVar('read_from_replica', default=False)
+
+LAG_QUERY = """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+    END
+"""
+
+
+def replica_lag(alias):
+    """
+    Seconds the replica is behind the primary. Only PostgreSQL reports lag,
+    other backends are assumed to be up to date.
+    """
+    connection = connections[alias]
+    if connection.vendor != 'postgresql':
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(LAG_QUERY)
+        lag = cursor.fetchone()[0]
+    return float(lag or 0)
+
+
+class ReplicaSelector:
+    """
+    Smooth weighted round-robin over the replicas that are currently healthy.
+    A replica is healthy when its lag, checked at most every `check_interval`
+    seconds, is within `max_lag` seconds.
+    """
+
+    def __init__(self, weights, max_lag, check_interval, lag=replica_lag):
+        self.weights = dict(weights)
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self.lag = lag
+        self.current = {alias: 0 for alias in self.weights}
+        self.healthy = {}
+        self.checked_at = {}
+        self._lock = threading.Lock()
+
+    def is_healthy(self, alias):
+        now = time.monotonic()
+        if now - self.checked_at.get(alias, -math.inf) < self.check_interval:
+            return self.healthy[alias]
+
+        try:
+            lag = self.lag(alias)
+            healthy = lag <= self.max_lag
+            if not healthy:
+                logger.warning(f'Replica {alias} is {lag:.1f}s behind, reading from the primary.')
+        except DatabaseError as error:
+            healthy = False
+            logger.warning(f'Replica {alias} is unavailable, reading from the primary: {error}')
+
+        self.healthy[alias] = healthy
+        self.checked_at[alias] = now
+        return healthy
+
+    def choose(self):
+        """
+        Return the alias of the next replica to read from, or None when no
+        replica is healthy.
+        """
+        with self._lock:
+            candidates = [alias for alias in self.weights if self.is_healthy(alias)]
+            if not candidates:
+                return None
+
+            total = sum(self.weights[alias] for alias in candidates)
+            for alias in candidates:
+                self.current[alias] += self.weights[alias]
+            chosen = max(candidates, key=self.current.get)
+            self.current[chosen] -= total
+            return chosen
+
+
+class ReplicaRouter:
+    """
+    Send reads to replicas for requests flagged by ReplicaRoutingMiddleware,
+    and everything else to the primary.
+    """
+
+    def __init__(self):
+        self.selector = ReplicaSelector(
+            settings.DATABASE_REPLICAS, settings.REPLICA_MAX_LAG, settings.REPLICA_LAG_CHECK_INTERVAL
+        )
+
+    def db_for_read(self, model, **hints):
+        # Reads inside a transaction must see that transaction's writes.
+        if not read_from_replica.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return self.selector.choose() or DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Replicas hold the same data as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in self.selector.weights
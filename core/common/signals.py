@@ -0,0 +1,21 @@
+from django.core.signals import request_finished
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+from core.common.metrics import database_metrics
+from core.common.queries import record_statement
+from core.common.timing import record_query
+
+
+@receiver(connection_created)
+def count_connection(sender, connection, **kwargs):
+    database_metrics.connection_opened(connection.alias)
+    # Connection objects are reused across reconnects, so install the wrappers once.
+    for wrapper in [record_query, record_statement]:
+        if wrapper not in connection.execute_wrappers:
+            connection.execute_wrappers.append(wrapper)
+
+
+@receiver(request_finished)
+def count_request(sender, **kwargs):
+    database_metrics.request_finished()
@@ -0,0 +1,18 @@
+from django.conf import settings
+from django.core.files.storage import FileSystemStorage
+
+
+class ProtectedMediaStorage(FileSystemStorage):
+    """
+    Stores files alongside regular media, but hands out URLs that go through
+    Django for authorization before nginx serves the bytes via X-Accel-Redirect.
+    """
+
+    def __init__(self, **kwargs):
+        kwargs.setdefault('location', settings.MEDIA_ROOT)
+        kwargs.setdefault('base_url', settings.PROTECTED_MEDIA_URL)
+        super().__init__(**kwargs)
+
+
+def protected_media_storage():
+    return ProtectedMediaStorage()
@@ -0,0 +1,112 @@
+import pytest
+import redis
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from core.common.cache import TieredCache
+from core.store.models import Category, Product
+
+
+def test_local_tier_is_shared_tier_backed():
+    tiered = TieredCache('test')
+    tiered.set('key', {'value': 1})
+    assert tiered.get('key') == {'value': 1}
+
+    # A fresh process starts with an empty local tier and reads through to Redis.
+    other = TieredCache('test')
+    assert other.get('key') == {'value': 1}
+    assert other.get('key') == {'value': 1}
+    assert other.stats()['shared_hits'] == 1
+    assert other.stats()['local_hits'] == 1
+
+
+def test_invalidate_reaches_other_processes():
+    tiered = TieredCache('test', version_check_interval=0)
+    other = TieredCache('test', version_check_interval=0)
+    tiered.set('key', 'old')
+    assert other.get('key') == 'old'
+
+    tiered.invalidate()
+    assert other.get('key') is None
+    assert other.stats()['misses'] == 1
+
+
+def test_local_tier_is_bounded():
+    tiered = TieredCache('test', local_max_entries=2)
+    for key in ['a', 'b', 'c']:
+        tiered.set(key, key)
+    assert tiered.stats()['local_entries'] == 2
+
+
+def test_get_or_set_computes_once_and_caches_none():
+    tiered = TieredCache('test')
+    calls = []
+
+    def producer():
+        calls.append(1)
+        return None
+
+    assert tiered.get_or_set('key', producer) is None
+    assert tiered.get_or_set('key', producer) is None
+    assert len(calls) == 1
+
+
+def test_get_or_set_waits_for_lock_holder(monkeypatch):
+    tiered = TieredCache('test', lock_timeout=1)
+    version = tiered._current_version()
+    shared_key = tiered._shared_key('key', version)
+    cache.add(f'{shared_key}:lock', True, 1)
+
+    # Another process finishes computing the value while we wait.
+    monkeypatch.setattr('core.common.cache.time.sleep', lambda seconds: cache.set(shared_key, 'computed'))
+    assert tiered.get_or_set('key', lambda: 'recomputed') == 'computed'
+
+
+def test_redis_errors_are_misses(monkeypatch):
+    tiered = TieredCache('test')
+    tiered.set('key', 'value')
+
+    def unavailable(*args, **kwargs):
+        raise redis.ConnectionError('down')
+
+    monkeypatch.setattr(cache, 'get', unavailable)
+    monkeypatch.setattr(cache, 'add', unavailable)
+    monkeypatch.setattr(cache, 'set', unavailable)
+    monkeypatch.setattr(cache, 'delete', unavailable)
+
+    other = TieredCache('test')
+    assert other.get('key') is None
+    assert other.get_or_set('key', lambda: 'fresh') == 'fresh'
+
+
+@pytest.mark.django_db
+def test_product_detail_is_cached_until_product_changes(django_capture_on_commit_callbacks):
+    category = Category.objects.create(name='Phones')
+    product = Product.objects.create(name='Phone', price=100, stock=3, category=category)
+    client = APIClient()
+    url = f'http://localhost:9090/api/v1/store/products/{product.id}/'
+
+    assert client.get(url).data['name'] == 'Phone'
+    with CaptureQueriesContext(connection) as queries:
+        assert client.get(url).data['name'] == 'Phone'
+    assert len(queries) == 0
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.name = 'Smartphone'
+        product.save()
+    assert client.get(url).data['name'] == 'Smartphone'
+
+
+@pytest.mark.django_db
+def test_category_cache_key_ignores_unknown_and_reordered_params():
+    Category.objects.create(name='Phones')
+    client = APIClient()
+    url = 'http://localhost:9090/api/v1/store/categories/'
+
+    assert client.get(url, {'keyword': 'pho', 'page': 1}).data['categoryCount'] == 1
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get(f'{url}?page=1&x=random&keyword=pho')
+    assert response.data['categoryCount'] == 1
+    assert len(queries) == 0
@@ -0,0 +1,49 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+User = get_user_model()
+
+
+@pytest.fixture
+def owner():
+    user = User.objects.create_user(
+        first_name="Ama", last_name="Mensah", email="ama@example.com", password="password"
+    )
+    user.profile.profile_photo = 'profile/photos/ama.jpg'
+    user.profile.save()
+    return user
+
+
+@pytest.fixture
+def stranger():
+    return User.objects.create_user(
+        first_name="Kofi", last_name="Boateng", email="kofi@example.com", password="password"
+    )
+
+
+@pytest.mark.django_db
+def test_profile_photo_url_goes_through_django(owner):
+    assert owner.profile.profile_photo.url == '/api/v1/media/profile/photos/ama.jpg'
+
+
+@pytest.mark.django_db
+def test_owner_is_handed_off_to_nginx(owner):
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    response = client.get('/api/v1/media/profile/photos/ama.jpg')
+
+    assert response.status_code == 200
+    assert response['X-Accel-Redirect'] == '/protected-media/profile/photos/ama.jpg'
+    assert response['Content-Type'] == 'image/jpeg'
+    assert response.content == b''
+
+
+@pytest.mark.django_db
+def test_other_users_cannot_read_protected_media(owner, stranger):
+    client = APIClient()
+    client.force_authenticate(user=stranger)
+
+    assert client.get('/api/v1/media/profile/photos/ama.jpg').status_code == 404
+    assert client.get('/api/v1/media/../settings.py').status_code == 404
+    assert client.get('/api/v1/media/default_profile_photo.jpg').status_code == 200
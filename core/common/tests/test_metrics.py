@@ -0,0 +1,54 @@
+from unittest import mock
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+
+from core.common.benchmark import percentile, summarize
+from core.common.metrics import database_metrics
+
+User = get_user_model()
+
+
+def test_percentile_uses_nearest_rank():
+    samples = [0.005, 0.001, 0.004, 0.002, 0.003]
+    assert percentile(samples, 50) == 0.003
+    assert percentile(samples, 99) == 0.005
+    assert summarize(samples)['p50'] == pytest.approx(3)
+    assert summarize([])['p95'] is None
+
+
+@pytest.mark.django_db
+def test_metrics_are_staff_only():
+    user = User.objects.create_user(
+        first_name="Ama", last_name="Mensah", email="ama@example.com", password="password"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    assert client.get('http://localhost:9090/api/v1/metrics/').status_code == 403
+
+    user.is_staff = True
+    user.save()
+    database_metrics.reset()
+    response = client.get('http://localhost:9090/api/v1/metrics/')
+
+    assert response.status_code == 200
+    assert response.data['databases']['default']['conn_health_checks'] is True
+    assert 'caches' in response.data
+
+
+@pytest.mark.django_db(transaction=True)
+def test_benchmark_endpoint_reports_each_conn_max_age(capsys):
+    with mock.patch(
+        'core.common.management.commands.benchmark_endpoint.close_old_connections'
+    ) as close_old_connections:
+        call_command(
+            'benchmark_endpoint', '--host', 'testserver', '--requests', '3', '--warmup', '1',
+            '--conn-max-age', '0', '60'
+        )
+    # Called before and after every request, as request_started and request_finished would.
+    assert close_old_connections.call_count == 2 * (3 + 1) * 2
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split()[0] == 'conn_max_age'
+    assert [line.split()[0] for line in lines[1:]] == ['0', '60']
@@ -0,0 +1,57 @@
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+from core.common.middleware import QueryInspectionMiddleware
+from core.common.queries import QueryInspectionError, QueryLog, normalize_sql
+from core.store.models import Category
+from core.store.views import CategoryView
+
+
+def test_normalize_sql():
+    assert normalize_sql(
+        'SELECT "a"."id" FROM "a"  WHERE ("a"."name" = \'x\' AND "a"."id" IN (%s, %s, %s)) LIMIT 21'
+    ) == 'SELECT "a"."id" FROM "a" WHERE ("a"."name" = ? AND "a"."id" IN (...)) LIMIT ?'
+
+
+def test_repeated_templates():
+    query_log = QueryLog()
+    for index in range(6):
+        query_log.add(f'SELECT * FROM "store_product" WHERE "id" = {index}')
+        query_log.add(f'SAVEPOINT "s{index}"')
+    assert query_log.repeated(5) == [('SELECT * FROM "store_product" WHERE "id" = ?', 6)]
+    assert query_log.repeated(6) == []
+
+
+def n_plus_one_view(request):
+    for index in range(6):
+        Category.objects.filter(pk=index).first()
+    return HttpResponse()
+
+
+@pytest.mark.django_db
+def test_n_plus_one_raises_or_logs(settings, caplog):
+    middleware = QueryInspectionMiddleware(n_plus_one_view)
+    request = RequestFactory().get('/api/v1/store/categories/')
+
+    settings.QUERY_INSPECTION = 'raise'
+    with pytest.raises(QueryInspectionError, match='6 x SELECT'):
+        middleware(request)
+
+    settings.QUERY_INSPECTION = 'log'
+    assert middleware(request).status_code == 200
+    assert '6 x SELECT' in caplog.text
+
+    settings.QUERY_INSPECTION = 'off'
+    caplog.clear()
+    middleware(request)
+    assert caplog.text == ''
+
+
+@pytest.mark.django_db
+def test_view_query_budget(settings, monkeypatch):
+    settings.QUERY_INSPECTION = 'raise'
+    monkeypatch.setattr(CategoryView, 'max_queries', {'GET': 1})
+    with pytest.raises(QueryInspectionError, match='the view allows 1'):
+        APIClient().get('http://localhost:9090/api/v1/store/categories/')
@@ -0,0 +1,78 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.common.parsers import ORJSONParser
+from core.common.renderers import ORJSONRenderer
+from core.store.models import Category, Product, ProductImage
+from core.store.serializers import ProductSerializer
+
+PAYLOAD = {
+    'id': uuid.UUID('12345678-1234-5678-1234-567812345678'),
+    'price': Decimal('12.50'),
+    'created_at': datetime.datetime(2024, 5, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+    'date': datetime.date(2024, 5, 1),
+    'label': gettext_lazy('Male'),
+    'text': 'naïve   line   separators',
+    'items': [{'quantity': 2, 'ratio': 0.25, 'missing': None, 'active': True}],
+    'nested': ({'tuple': (1, 2)},),
+}
+
+
+@pytest.mark.parametrize('value', [
+    1e-05, 1e+16, -2.5e-07, 1.5e300, 0.0001, 9999999999999998.0, -0.0, Decimal('0.00001'), Decimal('1E+16'),
+])
+def test_compat_output_matches_json_renderer(value):
+    assert ORJSONRenderer().render(PAYLOAD) == JSONRenderer().render(PAYLOAD)
+    data = {'value': value, 'items': [{'ratio': value}]}
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+@pytest.mark.parametrize('value', [float('nan'), float('inf'), Decimal('-Infinity')])
+def test_compat_mode_rejects_non_finite_floats(value):
+    with pytest.raises(ValueError):
+        JSONRenderer().render({'value': value})
+    with pytest.raises(ValueError):
+        ORJSONRenderer().render({'value': value})
+
+
+def test_fast_mode_renders_exact_decimals(settings):
+    settings.ORJSON_RENDERER_COMPAT = False
+    content = ORJSONRenderer().render(PAYLOAD)
+    assert b'"price":"12.50"' in content
+    assert ' '.encode() in content
+
+
+def test_falls_back_for_indent_and_non_string_keys():
+    renderer = ORJSONRenderer()
+    assert renderer.render(PAYLOAD, 'application/json; indent=4') == JSONRenderer().render(
+        PAYLOAD, 'application/json; indent=4'
+    )
+    assert renderer.render({1: 'a'}) == b'{"1":"a"}'
+    assert renderer.render(None) == b''
+
+
+@pytest.mark.django_db
+def test_product_serializer_output_matches():
+    category = Category.objects.create(name='Phones')
+    product = Product.objects.create(name='Phone', description='Naïve', price=100, stock=3, category=category)
+    ProductImage.objects.create(product=product, image='/mediafiles/products/images/phone.jpg', alt_text='Front')
+    data = ProductSerializer([product], many=True).data
+    assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+
+def test_parser_matches_json_parser():
+    content = JSONRenderer().render(PAYLOAD)
+    assert ORJSONParser().parse(io.BytesIO(content)) == JSONParser().parse(io.BytesIO(content))
+
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(io.BytesIO(b'{"price": NaN}'))
+    with pytest.raises(ParseError):
+        ORJSONParser().parse(io.BytesIO(b'{broken'))
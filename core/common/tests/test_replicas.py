@@ -0,0 +1,86 @@
+from collections import Counter
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, OperationalError, transaction
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.common.middleware import ReplicaRoutingMiddleware
+from core.common.routers import ReplicaRouter, ReplicaSelector, read_from_replica
+from core.store.models import Product
+
+
+def test_weighted_round_robin():
+    selector = ReplicaSelector({'replica_0': 2, 'replica_1': 1}, max_lag=2, check_interval=60, lag=lambda alias: 0)
+    chosen = [selector.choose() for _ in range(6)]
+    assert Counter(chosen) == {'replica_0': 4, 'replica_1': 2}
+    # Smooth round-robin interleaves instead of sending bursts to one replica.
+    assert chosen[:3] == ['replica_0', 'replica_1', 'replica_0']
+
+
+def test_lagging_or_failing_replicas_are_skipped():
+    lags = {'replica_0': 30, 'replica_1': 0}
+
+    def lag(alias):
+        if lags[alias] is None:
+            raise OperationalError('could not connect')
+        return lags[alias]
+
+    selector = ReplicaSelector({'replica_0': 1, 'replica_1': 1}, max_lag=2, check_interval=0, lag=lag)
+    assert {selector.choose() for _ in range(4)} == {'replica_1'}
+
+    lags.update({'replica_0': 0, 'replica_1': None})
+    assert {selector.choose() for _ in range(4)} == {'replica_0'}
+
+    lags['replica_0'] = 5
+    assert selector.choose() is None
+
+
+def test_router_only_reads_from_replicas_when_flagged():
+    router = ReplicaRouter()
+    router.selector = ReplicaSelector({'replica_0': 1}, max_lag=2, check_interval=60, lag=lambda alias: 0)
+
+    assert router.db_for_read(Product) == DEFAULT_DB_ALIAS
+    token = read_from_replica.set(True)
+    try:
+        assert router.db_for_read(Product) == 'replica_0'
+        assert router.db_for_write(Product) == DEFAULT_DB_ALIAS
+    finally:
+        read_from_replica.reset(token)
+    assert not router.allow_migrate('replica_0', 'store')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_router_reads_from_primary_inside_transactions():
+    router = ReplicaRouter()
+    router.selector = ReplicaSelector({'replica_0': 1}, max_lag=2, check_interval=60, lag=lambda alias: 0)
+    token = read_from_replica.set(True)
+    try:
+        assert router.db_for_read(Product) == 'replica_0'
+        with transaction.atomic():
+            assert router.db_for_read(Product) == DEFAULT_DB_ALIAS
+    finally:
+        read_from_replica.reset(token)
+
+
+def test_middleware_pins_writers_to_primary(settings):
+    settings.DATABASE_REPLICAS = {'replica_0': 1}
+    seen = []
+
+    def view(request):
+        seen.append(read_from_replica.get())
+        return HttpResponse()
+
+    middleware = ReplicaRoutingMiddleware(view)
+    factory = RequestFactory()
+
+    middleware(factory.get('/api/v1/store/products/'))
+    response = middleware(factory.post('/api/v1/store/cart/'))
+    assert settings.REPLICA_PIN_COOKIE in response.cookies
+
+    pinned = factory.get('/api/v1/store/products/')
+    pinned.COOKIES[settings.REPLICA_PIN_COOKIE] = '1'
+    middleware(pinned)
+
+    assert seen == [True, False, False]
+    assert read_from_replica.get() is False
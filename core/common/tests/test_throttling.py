@@ -0,0 +1,55 @@
+import pytest
+import redis
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from core.common.throttling import RedisRateThrottle
+
+User = get_user_model()
+
+
+@pytest.fixture
+def client_user():
+    user = User.objects.create_user(
+        first_name="Ama", last_name="Mensah", email="ama@example.com", password="password"
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.fixture
+def script(monkeypatch):
+    calls = []
+
+    def run(keys, args):
+        calls.append(keys[0])
+        # Deny only the cart scope, reporting a 1.5s wait.
+        return [0, 1500] if keys[0].startswith('throttle_cart_') else [1, 0]
+
+    monkeypatch.setattr(RedisRateThrottle, 'unavailable_until', 0)
+    monkeypatch.setattr(RedisRateThrottle, 'get_script', classmethod(lambda cls: run))
+    return calls
+
+
+@pytest.mark.django_db
+def test_scope_applies_to_cart_writes_only(client_user, script):
+    response = client_user.get('/api/v1/store/cart/')
+    assert response.status_code == 200
+    assert not any(key.startswith('throttle_cart_') for key in script)
+
+    response = client_user.post('/api/v1/store/cart/', {'products': [{'product': 1}]}, format='json')
+    assert response.status_code == 429
+    assert response['Retry-After'] == '2'
+
+
+@pytest.mark.django_db
+def test_redis_outage_fails_open(client_user, monkeypatch):
+    def unavailable(cls):
+        raise redis.ConnectionError('Connection refused')
+
+    monkeypatch.setattr(RedisRateThrottle, 'unavailable_until', 0)
+    monkeypatch.setattr(RedisRateThrottle, 'get_script', classmethod(unavailable))
+
+    assert client_user.get('/api/v1/store/cart/').status_code == 200
+    assert RedisRateThrottle.unavailable_until > 0
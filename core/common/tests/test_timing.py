@@ -0,0 +1,73 @@
+import logging
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from core.common.timing import Timings, current_timings, timed
+from core.store.models import Category, Product
+
+User = get_user_model()
+
+
+@pytest.fixture
+def product():
+    category = Category.objects.create(name='Phones')
+    return Product.objects.create(name='Phone', price=100, stock=3, category=category)
+
+
+def client_for(is_staff):
+    user = User.objects.create_user(
+        first_name="Ama", last_name="Mensah", email=f"ama{int(is_staff)}@example.com",
+        password="password", is_staff=is_staff
+    )
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def test_timed_is_a_noop_without_timings():
+    with timed('serialize'):
+        pass
+    assert current_timings.get() is None
+
+
+def test_nested_phases_count_once():
+    timings = Timings()
+    token = current_timings.set(timings)
+    try:
+        with timed('serialize'):
+            with timed('serialize'):
+                pass
+    finally:
+        current_timings.reset(token)
+    assert list(timings.durations) == ['serialize']
+
+
+@pytest.mark.django_db
+def test_staff_opt_in_gets_server_timing(product, caplog):
+    client = client_for(is_staff=True)
+    with caplog.at_level(logging.INFO, logger='core.common.middleware'):
+        response = client.get('http://localhost:9090/api/v1/store/products/', HTTP_X_SERVER_TIMING='1')
+
+    header = response['Server-Timing']
+    for metric in ['db;dur=', 'filter;dur=', 'serialize;dur=', 'render;dur=', 'total;dur=']:
+        assert metric in header
+    record = next(record for record in caplog.records if getattr(record, 'url_name', None) == 'product-list')
+    assert record.timings['db_queries'] > 0
+
+
+@pytest.mark.django_db
+def test_timing_is_not_exposed_to_other_users(product):
+    client = client_for(is_staff=False)
+    response = client.get('http://localhost:9090/api/v1/store/products/', HTTP_X_SERVER_TIMING='1')
+    assert 'Server-Timing' not in response
+    response = client.get('http://localhost:9090/api/v1/store/products/')
+    assert 'Server-Timing' not in response
+
+
+@pytest.mark.django_db
+def test_sampled_requests_are_timed(product, settings):
+    settings.SERVER_TIMING_SAMPLE_RATE = 1.0
+    response = APIClient().get(f'http://localhost:9090/api/v1/store/products/{product.id}/')
+    assert 'db;dur=' in response['Server-Timing']
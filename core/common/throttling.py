@@ -0,0 +1,138 @@
+import logging
+import time
+
+import redis
+from rest_framework.throttling import (
+    AnonRateThrottle, ScopedRateThrottle, SimpleRateThrottle, UserRateThrottle
+)
+
+from .redis import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+# Generic cell rate algorithm (GCRA). A single key per client stores the
+# "theoretical arrival time" of the next request, so memory is O(1) per key
+# and the check-and-update is atomic across every worker and node.
+GCRA_SCRIPT = """
+local interval = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = time[1] * 1000 + math.floor(time[2] / 1000)
+local tat = tonumber(redis.call('GET', KEYS[1]) or now)
+if tat < now then
+    tat = now
+end
+local allow_at = tat - burst
+if now < allow_at then
+    return {0, allow_at - now}
+end
+local new_tat = tat + interval
+redis.call('SET', KEYS[1], new_tat, 'PX', math.ceil(new_tat - now))
+return {1, 0}
+"""
+
+# Seconds to skip Redis after a connection failure, so an outage doesn't add a
+# connect timeout to every request.
+BACKOFF_SECONDS = 5
+
+
+class RedisRateThrottle(SimpleRateThrottle):
+    """
+    Rate throttle backed by an atomic GCRA script in Redis. `rate` allows
+    `num_requests` in a burst, refilling evenly over `duration`.
+    Fails open (and logs) when Redis is unavailable.
+    """
+    unavailable_until = 0
+    _script = None
+
+    @classmethod
+    def get_script(cls):
+        if RedisRateThrottle._script is None:
+            RedisRateThrottle._script = get_redis().register_script(GCRA_SCRIPT)
+        return RedisRateThrottle._script
+
+    @classmethod
+    def get_async_script(cls):
+        return get_async_redis().register_script(GCRA_SCRIPT)
+
+    def prepare(self, request, view):
+        """
+        Return the GCRA arguments for this request, or None if it is not limited.
+        """
+        if self.rate is None:
+            return None
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return None
+
+        if time.monotonic() < RedisRateThrottle.unavailable_until:
+            return None
+
+        interval = self.duration * 1000 / self.num_requests
+        burst = self.duration * 1000 - interval
+        return [interval, burst]
+
+    def fail_open(self, error):
+        RedisRateThrottle.unavailable_until = time.monotonic() + BACKOFF_SECONDS
+        logger.warning(f'Throttling disabled for {BACKOFF_SECONDS}s, Redis is unavailable: {error}')
+        return True
+
+    def allow_request(self, request, view):
+        args = self.prepare(request, view)
+        if args is None:
+            return True
+
+        try:
+            allowed, self.retry_after = self.get_script()(keys=[self.key], args=args)
+        except redis.RedisError as error:
+            return self.fail_open(error)
+        return bool(allowed)
+
+    async def aallow_request(self, request, view):
+        """
+        Same check as `allow_request` for async views, on the asyncio client.
+        """
+        args = self.prepare(request, view)
+        if args is None:
+            return True
+
+        try:
+            allowed, self.retry_after = await self.get_async_script()(keys=[self.key], args=args)
+        except redis.RedisError as error:
+            return self.fail_open(error)
+        return bool(allowed)
+
+    def wait(self):
+        return self.retry_after / 1000
+
+
+class AnonRedisRateThrottle(AnonRateThrottle, RedisRateThrottle):
+    pass
+
+
+class UserRedisRateThrottle(UserRateThrottle, RedisRateThrottle):
+    pass
+
+
+class ScopedRedisRateThrottle(ScopedRateThrottle, RedisRateThrottle):
+    """
+    Limits views by their `throttle_scope`. Views can restrict the scope to
+    some methods with `throttle_scope_methods`, e.g. cart writes only.
+    """
+
+    def prepare(self, request, view):
+        methods = getattr(view, 'throttle_scope_methods', None)
+        if methods is not None and request.method not in methods:
+            return None
+
+        # The scope set-up of ScopedRateThrottle.allow_request, which is bypassed below.
+        self.scope = getattr(view, self.scope_attr, None)
+        if not self.scope:
+            return None
+        self.rate = self.get_rate()
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+        return super().prepare(request, view)
+
+    def allow_request(self, request, view):
+        return RedisRateThrottle.allow_request(self, request, view)
@@ -0,0 +1,78 @@
+import contextvars
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+# The Timings of the current request, None when the request is not instrumented.
+current_timings = contextvars.ContextVar('current_timings', default=None)
+
+
+class Timings:
+    """
+    Durations (seconds) recorded for one request, by phase.
+    """
+
+    def __init__(self, sampled=False):
+        self.sampled = sampled
+        self.started = time.perf_counter()
+        self.durations = defaultdict(float)
+        self.db_queries = 0
+        self.active = set()
+
+    def add(self, name, seconds):
+        self.durations[name] += seconds
+
+    def total(self):
+        return time.perf_counter() - self.started
+
+    def as_fields(self):
+        fields = {f'{name}_ms': round(seconds * 1000, 2) for name, seconds in self.durations.items()}
+        fields['db_queries'] = self.db_queries
+        fields['total_ms'] = round(self.total() * 1000, 2)
+        return fields
+
+    def header(self):
+        metrics = [f'db;dur={self.durations["db"] * 1000:.2f};desc="{self.db_queries} queries"']
+        metrics += [
+            f'{name};dur={seconds * 1000:.2f}'
+            for name, seconds in self.durations.items() if name != 'db'
+        ]
+        metrics.append(f'total;dur={self.total() * 1000:.2f}')
+        return ', '.join(metrics)
+
+
+@contextmanager
+def timed(name):
+    """
+    Add the time spent in the block to the current request's `name` phase.
+    Nested blocks of the same phase count once; a no-op when not instrumented.
+    """
+    timings = current_timings.get()
+    if timings is None or name in timings.active:
+        yield
+        return
+
+    timings.active.add(name)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.add(name, time.perf_counter() - start)
+        timings.active.discard(name)
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Execute wrapper installed on every database connection (see signals.py).
+    Only looks at a context variable when the request is not instrumented.
+    """
+    timings = current_timings.get()
+    if timings is None:
+        return execute(sql, params, many, context)
+
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        timings.add('db', time.perf_counter() - start)
+        timings.db_queries += 1
@@ -1,3 +1,50 @@
-from django.shortcuts import render
+import mimetypes
+import posixpath
+from urllib.parse import quote
 
-# Create your views here.
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework import permissions, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.common.cache import tiered_cache_stats
+from core.common.metrics import database_metrics
+from core.profiles.models import Profile
+
+
+class ProtectedMediaView(APIView):
+    """
+    Authorize access to protected media, then hand the file off to nginx with
+    X-Accel-Redirect so no Python worker streams the bytes.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def has_access(self, user, path):
+        if user.is_staff or path in settings.PROTECTED_MEDIA_DEFAULTS:
+            return True
+        return Profile.objects.filter(user=user, profile_photo=path).exists()
+
+    def get(self, request, path):
+        path = posixpath.normpath(path).lstrip('/')
+        if path.startswith('..') or not self.has_access(request.user, path):
+            return Response({'error': 'File not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        content_type, _ = mimetypes.guess_type(path)
+        response = HttpResponse(content_type=content_type or 'application/octet-stream')
+        response['X-Accel-Redirect'] = f'{settings.PROTECTED_MEDIA_INTERNAL_URL}{quote(path)}'
+        response['Cache-Control'] = 'private, max-age=3600'
+        return response
+
+
+class MetricsView(APIView):
+    """
+    Staff-only view of this worker process's connection and cache statistics.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        return Response({
+            **database_metrics.snapshot(),
+            'caches': tiered_cache_stats(),
+        })
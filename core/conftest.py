@@ -0,0 +1,19 @@
+import pytest
+from django.core.cache import cache
+
+from core.common.cache import reset_tiered_caches
+
+
+@pytest.fixture(autouse=True)
+def local_cache(settings):
+    # Tests run without Redis, so the shared tier is an in-memory cache that starts empty.
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+    cache.clear()
+    reset_tiered_caches()
+    yield
+    cache.clear()
+    reset_tiered_caches()
@@ -1,10 +1,14 @@
 from django.contrib import admin
 
+from core.common.admin import LargeTableAdminMixin
 from .models import Profile
 
 @admin.register(Profile)
-class ProfileAdmin(admin.ModelAdmin):
+class ProfileAdmin(LargeTableAdminMixin, admin.ModelAdmin):
     list_display = ['pkid', 'id', 'user', 'gender', 'phone_number', 'country', 'city']
     list_display_links = ['pkid', 'id', 'user']
-    list_filter = ['id', 'pkid']
-
+    list_select_related = ['user']
+    list_filter = ['gender']
+    ordering = ['-pkid']
+    raw_id_fields = ['user']
+    search_fields = ['user__email']
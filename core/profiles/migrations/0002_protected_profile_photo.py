@@ -0,0 +1,23 @@
+# Generated by Django 4.1.7 on 2026-10-19 17:02
+
+import core.common.storage
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("profiles", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="profile",
+            name="profile_photo",
+            field=models.ImageField(
+                default="default_profile_photo.jpg",
+                storage=core.common.storage.protected_media_storage,
+                upload_to="profile/photos",
+                verbose_name="profile photo",
+            ),
+        ),
+    ]
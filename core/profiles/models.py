@@ -4,6 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from django_countries.fields import CountryField
 from phonenumber_field.modelfields import PhoneNumberField
 from core.common.models import TimeStampedModel
+from core.common.storage import protected_media_storage
 
 User = get_user_model()
 
@@ -19,7 +20,10 @@ class Profile(TimeStampedModel):
     gender = models.CharField(verbose_name=_('gender'), choices=Gender.choices, default=Gender.MALE, max_length=20)
     country = CountryField(verbose_name=_('country'), default='Gh')
     city = models.CharField(verbose_name=_('city'), max_length=255, default='Accra')
-    profile_photo = models.ImageField(verbose_name=_('profile photo'), upload_to='profile/photos', default='default_profile_photo.jpg')
+    profile_photo = models.ImageField(
+        verbose_name=_('profile photo'), upload_to='profile/photos', default='default_profile_photo.jpg',
+        storage=protected_media_storage
+    )
 
     def __str__(self):
         return f'{self.user.first_name}\'s profile'
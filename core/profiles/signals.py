@@ -1,14 +1,29 @@
 import logging
 
-from django.db.models.signals import post_save
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from azubisc.settings.base import AUTH_USER_MODEL
 from core.profiles.models import Profile
+from core.users.cache import invalidate_user_cache
 logger = logging.getLogger(__name__)
 
+User = get_user_model()
+
 @receiver(post_save, sender=AUTH_USER_MODEL)
 def create_user_profile(sender, instance, created, **kwargs):
     if created:
         Profile.objects.create(user=instance)
         logger.info(f'{instance}\'s profile has been created.')
-        
\ No newline at end of file
+
+
+@receiver(post_save, sender=Profile)
+@receiver(post_delete, sender=Profile)
+def invalidate_cached_profile_user(sender, instance, **kwargs):
+    # Avoid fetching the user (which may already be deleted in a cascade) when it isn't loaded.
+    if Profile._meta.get_field('user').is_cached(instance):
+        user_id = instance.user.id
+    else:
+        user_id = User.objects.filter(pkid=instance.user_id).values_list('id', flat=True).first()
+    if user_id:
+        invalidate_user_cache(user_id)
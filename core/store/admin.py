@@ -1,7 +1,77 @@
+from functools import partial
+
 from django.contrib import admin
+from django.db import transaction
+
+from core.common.admin import LargeTableAdminMixin
 from . import models
+from .tasks import run_catalog_import
 
 
 @admin.register(models.Category)
 class CategoryAdmin(admin.ModelAdmin):
     list_display = ['id', 'name', 'description']
+
+
+@admin.register(models.Product)
+class ProductAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ['id', 'name', 'category', 'price', 'stock', 'updated_at']
+    list_select_related = ['category']
+    list_filter = ['category']
+    ordering = ['-id']
+    search_fields = ['name']
+
+
+class OrderItemInline(admin.TabularInline):
+    model = models.OrderItem
+    raw_id_fields = ['product']
+    extra = 0
+
+
+@admin.register(models.Order)
+class OrderAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ['id', 'user', 'status', 'total_amount', 'created_at']
+    list_select_related = ['user']
+    list_filter = ['status']
+    ordering = ['-id']
+    raw_id_fields = ['user']
+    search_fields = ['user__email']
+    inlines = [OrderItemInline]
+
+
+@admin.register(models.CartItem)
+class CartItemAdmin(LargeTableAdminMixin, admin.ModelAdmin):
+    list_display = ['id', 'cart', 'product', 'quantity']
+    list_select_related = ['cart__user', 'product']
+    ordering = ['-id']
+    raw_id_fields = ['cart', 'product']
+    search_fields = ['cart__user__email']
+
+
+@admin.register(models.CatalogImport)
+class CatalogImportAdmin(admin.ModelAdmin):
+    list_display = [
+        'id', 'file', 'status', 'inserted', 'updated', 'rejected', 'created_by', 'created_at', 'finished_at'
+    ]
+    list_select_related = ['created_by']
+    list_filter = ['status']
+    ordering = ['-id']
+    readonly_fields = [
+        'status', 'inserted', 'updated', 'rejected', 'errors', 'created_by', 'created_at', 'finished_at'
+    ]
+    actions = ['run_again']
+
+    def save_model(self, request, obj, form, change):
+        if not change:
+            obj.created_by = request.user
+        super().save_model(request, obj, form, change)
+        if not change:
+            # Importing a large feed takes minutes, so it runs on a Celery worker.
+            transaction.on_commit(partial(run_catalog_import.delay, obj.pk))
+
+    @admin.action(description='Run selected imports again')
+    def run_again(self, request, queryset):
+        for catalog_import in queryset:
+            transaction.on_commit(partial(run_catalog_import.delay, catalog_import.pk))
+        queryset.update(status='pending')
+        self.message_user(request, f'Queued {len(queryset)} imports.')
@@ -6,3 +6,6 @@ class StoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core.store'
     verbose_name = _('Store')
+
+    def ready(self):
+        from core.store import signals
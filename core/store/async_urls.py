@@ -0,0 +1,21 @@
+from django.urls import path
+
+from . import urls
+from .async_views import (
+    AsyncCartView, AsyncCategoryView, AsyncProductDetailView, AsyncProductFeedView, AsyncProductListView
+)
+
+# The store URLs with the async views swapped in, see azubisc/asgi_urls.py.
+ASYNC_VIEWS = {
+    'product-categories': AsyncCategoryView,
+    'product-list': AsyncProductListView,
+    'product-detail': AsyncProductDetailView,
+    'product-feed': AsyncProductFeedView,
+    'cart': AsyncCartView,
+}
+
+urlpatterns = [
+    path(str(pattern.pattern), ASYNC_VIEWS[pattern.name].as_view(), name=pattern.name)
+    if pattern.name in ASYNC_VIEWS else pattern
+    for pattern in urls.urlpatterns
+]
@@ -0,0 +1,152 @@
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from rest_framework import status
+from rest_framework.permissions import IsAuthenticated
+
+from core.common.async_views import AsyncAPIView, apaginate
+from core.common.timing import timed
+from .feed import feed_lines
+from .filters import ProductsFilter
+from .models import Cart, Product, Wishlist
+from . import serializers
+from .views import (
+    CartView, CategoryView, ProductCreateListView, ProductDetailView, ProductFeedView, add_to_cart,
+    annotate_wishlisted, cart_quantities, categories_cache, category_cache_key, category_page, feed_params,
+    product_queryset, products_cache, serialize_product
+)
+
+# Async versions of the catalog and cart endpoints, routed by azubisc/asgi_urls.py.
+# The sync views in views.py serve WSGI and every method not implemented here.
+
+
+class AsyncCategoryView(AsyncAPIView):
+    sync_view = CategoryView
+
+    async def get(self, request):
+        # Almost always served from the in-process tier of the cache.
+        data = await sync_to_async(categories_cache.get_or_set)(
+            category_cache_key(request), partial(category_page, request)
+        )
+        return self.respond(data)
+
+
+# Products Views ////////////////
+class AsyncProductListView(AsyncAPIView):
+    sync_view = ProductCreateListView
+    throttle_scope = 'search'
+    throttle_scope_methods = ['GET']
+
+    async def get(self, request):
+        filterset = ProductsFilter(request.GET, queryset=product_queryset().order_by('id'))
+        # Validating the category filter looks the category up with the sync ORM.
+        queryset = await sync_to_async(lambda: filterset.qs)()
+
+        resPerPage = 50
+        product_count, products = await apaginate(
+            request, annotate_wishlisted(queryset, request.user), resPerPage
+        )
+
+        serializer = serializers.ProductSerializer(products, many=True)
+        with timed('serialize'):
+            products = serializer.data
+        return self.respond({
+            'productCount': product_count,
+            'resPerpage': resPerPage,
+            'Products': products
+        })
+
+
+class AsyncProductDetailView(AsyncAPIView):
+    sync_view = ProductDetailView
+
+    async def get(self, request, pk):
+        try:
+            data = await sync_to_async(products_cache.get_or_set)(str(pk), partial(serialize_product, pk))
+        except Product.DoesNotExist:
+            return self.respond({'error': 'Product not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        if request.user.is_authenticated:
+            data = {
+                **data,
+                'is_wishlisted': await Wishlist.objects.filter(user=request.user, product_id=pk).aexists()
+            }
+        return self.respond(data)
+
+
+class AsyncProductFeedView(AsyncAPIView):
+    """
+    The delta feed under ASGI. Django 4.1 iterates streaming responses on the
+    event loop, where the sync ORM cannot run, so the lines are built in a
+    worker thread and sent as one response of at most PRODUCT_FEED_ASYNC_LIMIT
+    entries. Clients page through with the `next` token as usual.
+    """
+    sync_view = ProductFeedView
+    throttle_scope = 'feed'
+
+    async def get(self, request):
+        try:
+            cursor, limit = feed_params(request)
+        except ValueError:
+            return self.respond({'error': 'Invalid since or limit parameter.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        limit = min(limit or settings.PRODUCT_FEED_ASYNC_LIMIT, settings.PRODUCT_FEED_ASYNC_LIMIT)
+        content = await sync_to_async(lambda: ''.join(feed_lines(cursor, limit)))()
+        return HttpResponse(content, content_type='application/x-ndjson')
+
+
+# Cart Views
+class AsyncCartView(AsyncAPIView):
+    sync_view = CartView
+    permission_classes = [IsAuthenticated]
+    throttle_scope = 'cart'
+    throttle_scope_methods = ['POST', 'DELETE']
+
+    async def get(self, request):
+        cart, created = await Cart.objects.prefetch_related('items__product').aget_or_create(user=request.user)
+        if created or not cart.items.all():
+            return self.respond({'response': 'Shopping cart is empty'})
+
+        # The authenticated user is already loaded with its profile.
+        cart.user = request.user
+        serializer = serializers.CartSerializer(cart)
+        with timed('serialize'):
+            data = serializer.data
+        return self.respond(data)
+
+    async def post(self, request):
+        products = request.data.get("products", [])
+
+        if not isinstance(products, list) or not products:
+            return self.respond(
+                {"error": "Products must be a non-empty list."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        quantities = cart_quantities(products)
+        if quantities is None:
+            return self.respond(
+                {"error": "Each product must have a valid product ID and quantity."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        products_by_id = await Product.objects.ain_bulk(list(quantities))
+        if len(products_by_id) != len(quantities):
+            return self.respond({'error': 'Product not found'}, status=status.HTTP_400_BAD_REQUEST)
+
+        cart, _ = await Cart.objects.aget_or_create(user=request.user)
+        # transaction.atomic() is sync-only, so the locked update runs in a thread.
+        items = await sync_to_async(add_to_cart)(cart, quantities)
+
+        cart_items_response = []
+        for product_id, cart_item in items.items():
+            cart_item.product = products_by_id[product_id]
+            with timed('serialize'):
+                cart_items_response.append(serializers.CartItemSerializer(cart_item).data)
+
+        return self.respond(
+            {"cart_items": cart_items_response},
+            status=status.HTTP_201_CREATED,
+        )
@@ -0,0 +1,128 @@
+from functools import partial
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, DecimalField, Exists, F, IntegerField, OuterRef, Value, When
+from django.db.models.functions import Least, Round
+from django.utils import timezone
+
+from core.common.bulk import batched
+from core.common.cache import get_tiered_cache
+
+from .catalog import MAX_PRICE
+from .models import Product, Wishlist
+from .tasks import BACK_IN_STOCK, PRICE_DROP, enqueue_wishlist_notification
+
+PRICE_FIELD = DecimalField(max_digits=10, decimal_places=2)
+FACTOR_FIELD = DecimalField(max_digits=12, decimal_places=6)
+
+
+def _case(field, values, output_field):
+    return Case(
+        *[When(pk=pk, then=Value(value, output_field=output_field)) for pk, value in values.items()],
+        default=F(field),
+        output_field=output_field,
+    )
+
+
+def _notify(events):
+    """
+    Queue wishlist notifications for the products that are actually wishlisted,
+    once per (product_id, event) pair.
+    """
+    events = list(dict.fromkeys(events))
+    product_ids = {product_id for product_id, _ in events}
+    wishlisted = set(
+        Wishlist.objects.filter(product_id__in=product_ids).values_list('product_id', flat=True).distinct()
+    )
+    for product_id, event in events:
+        if product_id in wishlisted:
+            transaction.on_commit(partial(enqueue_wishlist_notification, product_id, event))
+
+
+def apply_price_rules(rules, now, events):
+    """
+    Change prices by a percentage per category in one UPDATE, e.g.
+    [{'category_id': 3, 'price_percent': Decimal('5')}] raises category 3 by 5%.
+    Prices are capped at MAX_PRICE so they still fit the column. Wishlist
+    events are appended to `events`.
+    """
+    factors = {rule['category_id']: 1 + rule['price_percent'] / 100 for rule in rules}
+    dropped = [category_id for category_id, factor in factors.items() if factor < 1]
+    if dropped:
+        events.extend(
+            (product_id, PRICE_DROP)
+            for product_id in Product.objects.filter(
+                Exists(Wishlist.objects.filter(product=OuterRef('pk'))), category_id__in=dropped
+            ).values_list('id', flat=True)
+        )
+
+    return Product.objects.filter(category_id__in=list(factors)).update(
+        price=Case(
+            *[
+                When(
+                    category_id=category_id,
+                    then=Least(
+                        Round(F('price') * Value(factor, output_field=FACTOR_FIELD), 2),
+                        Value(MAX_PRICE, output_field=PRICE_FIELD),
+                    ),
+                )
+                for category_id, factor in factors.items()
+            ],
+            default=F('price'),
+            output_field=PRICE_FIELD,
+        ),
+        updated_at=now,
+    )
+
+
+def apply_product_values(prices, stock, now, chunk_size, events):
+    """
+    Set explicit prices and stock levels by product ID with one CASE UPDATE per
+    chunk. Returns the IDs updated and the IDs that do not exist; wishlist
+    events are appended to `events`.
+    """
+    updated = []
+    missing = []
+    for chunk in batched(sorted(set(prices) | set(stock)), chunk_size):
+        previous = {
+            pk: (price, product_stock)
+            for pk, price, product_stock in Product.objects.filter(pk__in=chunk)
+            .select_for_update().values_list('id', 'price', 'stock')
+        }
+        missing.extend(pk for pk in chunk if pk not in previous)
+
+        chunk_prices = {pk: prices[pk] for pk in chunk if pk in prices and pk in previous}
+        chunk_stock = {pk: stock[pk] for pk in chunk if pk in stock and pk in previous}
+        changes = {'updated_at': now}
+        if chunk_prices:
+            changes['price'] = _case('price', chunk_prices, PRICE_FIELD)
+        if chunk_stock:
+            changes['stock'] = _case('stock', chunk_stock, IntegerField())
+        Product.objects.filter(pk__in=list(previous)).update(**changes)
+        updated.extend(previous)
+
+        events.extend((pk, PRICE_DROP) for pk, price in chunk_prices.items() if price < previous[pk][0])
+        events.extend(
+            (pk, BACK_IN_STOCK) for pk, level in chunk_stock.items() if previous[pk][1] == 0 and level > 0
+        )
+    return updated, missing
+
+
+def bulk_update_products(prices=None, stock=None, rules=(), chunk_size=None):
+    """
+    Apply price rules, then explicit `{product_id: price}` and
+    `{product_id: stock}` maps, in one transaction. Explicit values win over
+    rules for the same product. `updated_at` is bumped on every changed row
+    and the product cache is invalidated once for the whole batch instead of
+    once per row; wishlist notifications are queued like a save() would.
+    """
+    chunk_size = chunk_size or settings.PRODUCT_BULK_UPDATE_CHUNK_SIZE
+    now = timezone.now()
+    events = []
+    with transaction.atomic():
+        updated_by_rules = apply_price_rules(rules, now, events) if rules else 0
+        updated, missing = apply_product_values(prices or {}, stock or {}, now, chunk_size, events)
+        _notify(events)
+        transaction.on_commit(get_tiered_cache('products').invalidate)
+    return {'updatedByRules': updated_by_rules, 'updatedById': len(updated), 'missing': missing}
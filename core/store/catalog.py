@@ -0,0 +1,235 @@
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+
+from django.db import connections, transaction
+from django.utils import timezone
+
+from core.common.bulk import batched, copy_into
+from core.common.cache import get_tiered_cache
+
+from .models import Category, Product, ProductImage
+
+# Rejected rows kept with their reason, enough to spot a pattern without storing the whole feed.
+MAX_REPORTED_ERRORS = 100
+
+PRODUCT_STAGING_TABLE = 'catalog_import_products'
+IMAGE_STAGING_TABLE = 'catalog_import_images'
+MAX_PRICE = Decimal('99999999.99')
+# Largest value of the integer column behind Product.stock.
+MAX_STOCK = 2147483647
+
+
+def catalog_format(path):
+    return 'jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv'
+
+
+def read_catalog(source, file_format):
+    """
+    Yield rows from an open text file one at a time. JSONL lines that are not
+    valid JSON are yielded as None so they can be rejected individually.
+    """
+    if file_format == 'csv':
+        yield from csv.DictReader(source)
+    else:
+        for line in source:
+            if line.strip():
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield None
+
+
+def clean_row(row, category_ids):
+    """
+    Validate a feed row and return the product values, raising ValueError with
+    the reason otherwise. CSV rows separate image URLs with `|`.
+    """
+    if not isinstance(row, dict):
+        raise ValueError('not a JSON object')
+
+    name = row.get('name') or ''
+    if not isinstance(name, str) or not name.strip() or len(name.strip()) > 255:
+        raise ValueError('name is required and limited to 255 characters')
+    description = row.get('description') or ''
+    if not isinstance(description, str):
+        raise ValueError('description must be a string')
+
+    try:
+        price = Decimal(str(row.get('price'))).quantize(Decimal('0.01'))
+    except (InvalidOperation, ValueError):
+        raise ValueError(f'invalid price {row.get("price")!r}')
+    if not price.is_finite() or not Decimal(0) <= price <= MAX_PRICE:
+        raise ValueError(f'price {price} out of range')
+
+    try:
+        stock = int(row.get('stock'))
+        category_id = int(row.get('category_id'))
+    except (TypeError, ValueError):
+        raise ValueError('stock and category_id must be integers')
+    if not 0 <= stock <= MAX_STOCK:
+        raise ValueError(f'stock {stock} out of range')
+    if category_id not in category_ids:
+        raise ValueError(f'unknown category {category_id}')
+
+    image_urls = row.get('image_urls') or []
+    if isinstance(image_urls, str):
+        image_urls = [url.strip() for url in image_urls.split('|') if url.strip()]
+    if not isinstance(image_urls, list) or any(not isinstance(url, str) or len(url) > 500 for url in image_urls):
+        raise ValueError('image_urls must be a list of URLs up to 500 characters')
+
+    return {
+        'name': name.strip(),
+        'description': description,
+        'price': price,
+        'category_id': category_id,
+        'stock': stock,
+        'image_urls': list(dict.fromkeys(image_urls)),
+    }
+
+
+class CatalogImporter:
+    """
+    Merge a product feed into Product and ProductImage, keyed on the unique
+    product name, one chunk per transaction so memory use does not depend on
+    the feed size.
+
+    On PostgreSQL each chunk is copied into temporary staging tables and merged
+    with INSERT ... ON CONFLICT; elsewhere it is upserted with bulk_create.
+    Rows with image URLs replace the product's images, rows without keep them.
+    Within a chunk the last row for a name wins. Like other bulk writes this
+    skips model signals, so no wishlist notifications are sent.
+    """
+
+    def __init__(self, chunk_size=5000, using='default'):
+        self.chunk_size = chunk_size
+        self.using = using
+        self.inserted = self.updated = self.rejected = 0
+        self.errors = []
+        self.category_ids = set(Category.objects.using(using).values_list('id', flat=True))
+
+    @property
+    def counts(self):
+        return {'inserted': self.inserted, 'updated': self.updated, 'rejected': self.rejected}
+
+    def run(self, rows, progress=None):
+        """
+        Import an iterable of raw rows, calling `progress(importer)` after each chunk.
+        """
+        for chunk in batched(enumerate(rows, start=1), self.chunk_size):
+            self.import_chunk(chunk)
+            if progress:
+                progress(self)
+        get_tiered_cache('products').invalidate()
+        return self.counts
+
+    def reject(self, number, reason):
+        self.rejected += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append(f'row {number}: {reason}')
+
+    def import_chunk(self, chunk):
+        products = {}
+        for number, row in chunk:
+            try:
+                product = clean_row(row, self.category_ids)
+            except ValueError as error:
+                self.reject(number, error)
+                continue
+            products[product['name']] = product
+
+        if not products:
+            return
+        with transaction.atomic(using=self.using):
+            if connections[self.using].vendor == 'postgresql':
+                self.merge_staged(products)
+            else:
+                self.merge_bulk_create(products)
+
+    def merge_staged(self, products):
+        connection = connections[self.using]
+        quote = connection.ops.quote_name
+        product_table = quote(Product._meta.db_table)
+        image_table = quote(ProductImage._meta.db_table)
+        now = timezone.now()
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TEMPORARY TABLE IF NOT EXISTS {PRODUCT_STAGING_TABLE} ('
+                f'name varchar(255), description text, price numeric(10, 2), category_id bigint, stock integer'
+                f') ON COMMIT DELETE ROWS'
+            )
+            cursor.execute(
+                f'CREATE TEMPORARY TABLE IF NOT EXISTS {IMAGE_STAGING_TABLE} ('
+                f'name varchar(255), position integer, url varchar(500)'
+                f') ON COMMIT DELETE ROWS'
+            )
+            copy_into(
+                PRODUCT_STAGING_TABLE, ['name', 'description', 'price', 'category_id', 'stock'],
+                (
+                    (row['name'], row['description'], row['price'], row['category_id'], row['stock'])
+                    for row in products.values()
+                ),
+                using=self.using
+            )
+            copy_into(
+                IMAGE_STAGING_TABLE, ['name', 'position', 'url'],
+                (
+                    (row['name'], position, url)
+                    for row in products.values()
+                    for position, url in enumerate(row['image_urls'])
+                ),
+                using=self.using
+            )
+
+            # xmax is 0 for freshly inserted rows and set for rows updated on conflict.
+            cursor.execute(
+                f'WITH upserted AS ('
+                f'INSERT INTO {product_table} (name, description, price, category_id, stock, created_at, updated_at) '
+                f'SELECT name, description, price, category_id, stock, %s, %s FROM {PRODUCT_STAGING_TABLE} '
+                f'ON CONFLICT (name) DO UPDATE SET description = EXCLUDED.description, price = EXCLUDED.price, '
+                f'category_id = EXCLUDED.category_id, stock = EXCLUDED.stock, updated_at = EXCLUDED.updated_at '
+                f'RETURNING xmax = 0 AS inserted'
+                f') SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM upserted',
+                [now, now]
+            )
+            inserted, updated = cursor.fetchone()
+            cursor.execute(
+                f'DELETE FROM {image_table} image USING {product_table} product '
+                f'WHERE image.product_id = product.id '
+                f'AND product.name IN (SELECT name FROM {IMAGE_STAGING_TABLE})'
+            )
+            cursor.execute(
+                f'INSERT INTO {image_table} (product_id, image, alt_text) '
+                f"SELECT product.id, staged.url, '' FROM {IMAGE_STAGING_TABLE} staged "
+                f'JOIN {product_table} product ON product.name = staged.name '
+                f'ORDER BY product.id, staged.position'
+            )
+
+        self.inserted += inserted
+        self.updated += updated
+
+    def merge_bulk_create(self, products):
+        manager = Product.objects.using(self.using)
+        existing = set(manager.filter(name__in=list(products)).values_list('name', flat=True))
+        manager.bulk_create(
+            [
+                Product(**{field: value for field, value in row.items() if field != 'image_urls'})
+                for row in products.values()
+            ],
+            update_conflicts=True,
+            unique_fields=['name'],
+            update_fields=['description', 'price', 'category', 'stock', 'updated_at'],
+        )
+
+        with_images = [name for name, row in products.items() if row['image_urls']]
+        product_ids = dict(manager.filter(name__in=with_images).values_list('name', 'id'))
+        ProductImage.objects.using(self.using).filter(product_id__in=product_ids.values()).delete()
+        ProductImage.objects.using(self.using).bulk_create([
+            ProductImage(product_id=product_ids[name], image=url)
+            for name in with_images
+            for url in products[name]['image_urls']
+        ])
+
+        self.inserted += len(products) - len(existing)
+        self.updated += len(existing)
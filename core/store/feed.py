@@ -0,0 +1,109 @@
+import base64
+import heapq
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from .models import Product, ProductTombstone
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(timestamp, pk):
+    return base64.urlsafe_b64encode(f'{timestamp.isoformat()}|{pk}'.encode()).decode()
+
+
+def decode_cursor(value):
+    """
+    Return the (timestamp, id) position a `since` value points at. Accepts a
+    resume token from an earlier response or a plain ISO 8601 datetime.
+    """
+    try:
+        timestamp, pk = parse_datetime(value), 0
+        if timestamp is None:
+            raw_timestamp, raw_pk = base64.urlsafe_b64decode(value.encode()).decode().split('|')
+            timestamp, pk = parse_datetime(raw_timestamp), int(raw_pk)
+    except ValueError:
+        raise InvalidCursor(value)
+    if timestamp is None:
+        raise InvalidCursor(value)
+    if timezone.is_naive(timestamp):
+        timestamp = timezone.make_aware(timestamp)
+    return timestamp, pk
+
+
+def _after(timestamp_field, id_field, cursor):
+    if cursor is None:
+        return Q()
+    timestamp, pk = cursor
+    return Q(**{f'{timestamp_field}__gt': timestamp}) | Q(**{timestamp_field: timestamp, f'{id_field}__gt': pk})
+
+
+def product_entry(product):
+    return {
+        'type': 'product',
+        'id': product.id,
+        'name': product.name,
+        'description': product.description,
+        'price': str(product.price),
+        'stock': product.stock,
+        'category_id': product.category_id,
+        'images': [image.image for image in product.images.all()],
+        'created_at': product.created_at.isoformat(),
+        'updated_at': product.updated_at.isoformat(),
+    }
+
+
+def tombstone_entry(tombstone):
+    return {'type': 'deleted', 'id': tombstone.product_id, 'deleted_at': tombstone.deleted_at.isoformat()}
+
+
+def feed_lines(cursor=None, limit=None):
+    """
+    Yield NDJSON lines for products changed and deleted after `cursor`, in
+    (timestamp, id) order, followed by a line holding the resume token.
+
+    Both tables are walked with iterator(), a server-side cursor on
+    PostgreSQL, so memory use is constant. Changes from the last
+    PRODUCT_FEED_SETTLE_TIME seconds are held back: a transaction that saved
+    earlier may still be uncommitted, and skipping past it would lose it.
+    """
+    chunk_size = settings.PRODUCT_FEED_CHUNK_SIZE
+    until = timezone.now() - timedelta(seconds=settings.PRODUCT_FEED_SETTLE_TIME)
+
+    products = (
+        Product.objects.filter(_after('updated_at', 'id', cursor), updated_at__lt=until)
+        .order_by('updated_at', 'id')
+        .prefetch_related('images')
+        .iterator(chunk_size=chunk_size)
+    )
+    tombstones = (
+        ProductTombstone.objects.filter(_after('deleted_at', 'product_id', cursor), deleted_at__lt=until)
+        .order_by('deleted_at', 'product_id')
+        .iterator(chunk_size=chunk_size)
+    )
+    changes = heapq.merge(
+        ((product.updated_at, product.id, product_entry, product) for product in products),
+        ((tombstone.deleted_at, tombstone.product_id, tombstone_entry, tombstone) for tombstone in tombstones),
+        key=lambda change: change[:2],
+    )
+
+    count = 0
+    for timestamp, pk, entry, instance in changes:
+        if limit is not None and count >= limit:
+            break
+        yield json.dumps(entry(instance)) + '\n'
+        cursor = (timestamp, pk)
+        count += 1
+
+    yield json.dumps({
+        'type': 'end',
+        'count': count,
+        'next': encode_cursor(*cursor) if cursor else None,
+    }) + '\n'
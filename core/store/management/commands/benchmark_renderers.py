@@ -0,0 +1,65 @@
+import io
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from core.common.parsers import ORJSONParser
+from core.common.renderers import ORJSONRenderer
+from core.store.serializers import ProductSerializer
+from core.store.views import product_queryset
+
+
+def measure(function, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare JSON rendering and parsing of a real product list page (ProductSerializer output) '
+        'between DRF\'s JSON renderer/parser and the orjson ones. Seed products first, e.g. with seed_store.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--products', type=int, default=50, help='Products on the page.')
+        parser.add_argument('--iterations', type=int, default=500)
+
+    def handle(self, *args, **options):
+        products = list(product_queryset().order_by('id')[:options['products']])
+        if not products:
+            raise CommandError('No products found, seed some with seed_store first.')
+
+        data = {
+            'productCount': len(products),
+            'resPerpage': options['products'],
+            'Products': ProductSerializer(products, many=True).data,
+        }
+        iterations = options['iterations']
+        baseline = JSONRenderer().render(data)
+        self.stdout.write(f'{len(products)} products, {len(baseline)} bytes per page')
+        self.stdout.write(f'{"":<24} {"ms/op":>8} {"MB/s":>8} {"speedup":>8}')
+
+        def report(name, seconds, reference):
+            self.stdout.write(
+                f'{name:<24} {seconds * 1000:>8.3f} {len(baseline) / seconds / 1e6:>8.1f} '
+                f'{reference / seconds:>7.1f}x'
+            )
+
+        json_render = measure(lambda: JSONRenderer().render(data), iterations)
+        report('render json', json_render, json_render)
+        for name, compat in [('render orjson (compat)', True), ('render orjson', False)]:
+            with override_settings(ORJSON_RENDERER_COMPAT=compat):
+                report(name, measure(lambda: ORJSONRenderer().render(data), iterations), json_render)
+
+        identical = ORJSONRenderer().render(data) == baseline
+        json_parse = measure(lambda: JSONParser().parse(io.BytesIO(baseline)), iterations)
+        report('parse json', json_parse, json_parse)
+        report('parse orjson', measure(lambda: ORJSONParser().parse(io.BytesIO(baseline)), iterations), json_parse)
+
+        style = self.style.SUCCESS if identical else self.style.ERROR
+        self.stdout.write(style(f'Compat output identical to JSONRenderer: {"yes" if identical else "no"}'))
@@ -0,0 +1,44 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.store.catalog import CatalogImporter, catalog_format, read_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        'Stream a CSV or JSONL product feed into the catalog, upserting products by name. '
+        'Rows carry name, description, price, category_id, stock and optionally image_urls '
+        '(a list in JSONL, `|`-separated in CSV), which replace the product\'s images.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSONL file to import.')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Defaults to the file extension.')
+        parser.add_argument('--chunk-size', type=int, default=5000, help='Rows merged per transaction.')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or catalog_format(path)
+        importer = CatalogImporter(chunk_size=options['chunk_size'])
+        start = time.perf_counter()
+
+        def progress(importer):
+            processed = importer.inserted + importer.updated + importer.rejected
+            self.stdout.write(
+                f'{importer.inserted} inserted, {importer.updated} updated, {importer.rejected} rejected '
+                f'({processed / (time.perf_counter() - start):.0f} rows/s)'
+            )
+
+        try:
+            with open(path, newline='', encoding='utf-8') as source:
+                importer.run(read_catalog(source, file_format), progress=progress)
+        except (OSError, ValueError) as error:
+            raise CommandError(f'Could not read {path}: {error}')
+
+        for error in importer.errors:
+            self.stderr.write(error)
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported catalog: {importer.inserted} inserted, {importer.updated} updated, '
+            f'{importer.rejected} rejected.'
+        ))
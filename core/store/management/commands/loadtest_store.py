@@ -0,0 +1,267 @@
+import json
+import random
+import subprocess
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from urllib.parse import urlparse
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.common.benchmark import summarize
+from core.store.models import Cart, Category, Product
+
+User = get_user_model()
+
+LOADTEST_EMAIL_PREFIX = 'loadtest'
+
+# Relative weight of each scenario in the mix. There is no checkout endpoint yet,
+# so the purchase funnel ends with adding to and viewing the cart.
+SCENARIOS = {
+    'browse': 45,
+    'product': 20,
+    'search': 15,
+    'categories': 5,
+    'add_to_cart': 10,
+    'view_cart': 5,
+}
+
+
+class Session:
+    """
+    One keep-alive HTTP connection per virtual user.
+    """
+
+    def __init__(self, base_url, token):
+        url = urlparse(base_url)
+        self.connection_class = HTTPSConnection if url.scheme == 'https' else HTTPConnection
+        self.netloc = url.netloc
+        self.prefix = url.path.rstrip('/')
+        self.headers = {'Authorization': f'Bearer {token}', 'Content-Type': 'application/json'}
+        self.connection = None
+
+    def request(self, method, path, body=None):
+        if self.connection is None:
+            self.connection = self.connection_class(self.netloc, timeout=30)
+        try:
+            self.connection.request(
+                method, self.prefix + path, body=json.dumps(body) if body else None, headers=self.headers
+            )
+            response = self.connection.getresponse()
+            response.read()
+            return response.status
+        except (HTTPException, OSError):
+            self.connection.close()
+            self.connection = None
+            return None
+
+
+class Command(BaseCommand):
+    help = (
+        'Seed the store with factory_boy (requirements/local.txt) and drive a browse/search/cart mix '
+        'against a running server, reporting throughput and p50/p95/p99 latency per endpoint. '
+        'e.g. `loadtest_store --seed --base-url http://localhost:8000 --output before.json`, '
+        'then `loadtest_store --base-url http://localhost:8000 --output after.json --compare before.json`. '
+        'Raise the throttle rates on the server under test.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--base-url', default='http://localhost:8000')
+        parser.add_argument('--seed', action='store_true', help='Create the data set before running.')
+        parser.add_argument('--random-seed', type=int, default=42, help='Makes data and request mix reproducible.')
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--products', type=int, default=2000)
+        parser.add_argument('--images', type=int, default=2, help='Images per product.')
+        parser.add_argument('--users', type=int, default=50)
+        parser.add_argument('--cart-items', type=int, default=3, help='Items in each seeded cart.')
+        parser.add_argument('--duration', type=float, default=30, help='Seconds to run the mix.')
+        parser.add_argument('--concurrency', type=int, default=10, help='Virtual users.')
+        parser.add_argument('--output', help='Write the results as JSON to this file.')
+        parser.add_argument('--compare', help='Results JSON of an earlier run to compare against.')
+
+    def handle(self, *args, **options):
+        if options['seed']:
+            self.seed(options)
+
+        users = list(User.objects.filter(email__startswith=LOADTEST_EMAIL_PREFIX).order_by('pkid'))
+        product_ids = list(Product.objects.order_by('id').values_list('id', flat=True))
+        if not users or not product_ids:
+            raise CommandError('No load-test data found, run with --seed first.')
+
+        self.product_ids = product_ids
+        self.search_terms = sorted({
+            name.split()[0] for name in Product.objects.order_by('id').values_list('name', flat=True)[:500]
+        })
+        tokens = [str(AccessToken.for_user(user)) for user in users]
+
+        self.stdout.write(
+            f'Running for {options["duration"]}s with {options["concurrency"]} virtual users '
+            f'against {options["base_url"]}...'
+        )
+        started_at = datetime.now(timezone.utc)
+        deadline = time.monotonic() + options['duration']
+        with ThreadPoolExecutor(max_workers=options['concurrency']) as executor:
+            runs = list(executor.map(
+                lambda index: self.virtual_user(
+                    Session(options['base_url'], tokens[index % len(tokens)]),
+                    random.Random(options['random_seed'] + index),
+                    deadline,
+                ),
+                range(options['concurrency'])
+            ))
+
+        results = self.summarize(runs, options, started_at)
+        self.report(results)
+        if options['compare']:
+            self.compare(results, options['compare'])
+        if options['output']:
+            with open(options['output'], 'w') as output:
+                json.dump(results, output, indent=2)
+            self.stdout.write(f'Results written to {options["output"]}')
+
+    def seed(self, options):
+        try:
+            import factory
+            import factory.random
+            from core.store.tests.factories import (
+                CartFactory, CartItemFactory, CategoryFactory, ProductFactory, ProductImageFactory
+            )
+            from core.users.tests.factories import UserFactory
+        except ImportError:
+            raise CommandError('Seeding needs factory_boy, install requirements/local.txt.')
+
+        factory.random.reseed_random(options['random_seed'])
+        rng = random.Random(options['random_seed'])
+        # Continue sequences after existing rows so unique names and emails don't clash.
+        ProductFactory.reset_sequence(Product.objects.count())
+        UserFactory.reset_sequence(User.objects.count())
+
+        with transaction.atomic():
+            categories = CategoryFactory.create_batch(options['categories'])
+            products = ProductFactory.create_batch(options['products'], category=factory.Iterator(categories))
+            ProductImageFactory.create_batch(
+                options['products'] * options['images'], product=factory.Iterator(products)
+            )
+            users = UserFactory.create_batch(
+                options['users'],
+                email=factory.Sequence(lambda n: f'{LOADTEST_EMAIL_PREFIX}{n}@example.com')
+            )
+            for user in users:
+                cart = CartFactory(user=user)
+                CartItemFactory.create_batch(
+                    options['cart_items'], cart=cart,
+                    product=factory.Iterator(rng.sample(products, min(options['cart_items'], len(products))))
+                )
+
+        self.stdout.write(
+            f'Seeded {Category.objects.count()} categories, {Product.objects.count()} products, '
+            f'{len(users)} users and {Cart.objects.count()} carts.'
+        )
+
+    def next_request(self, scenario, rng):
+        """
+        Return (endpoint label, method, path, body) for a scenario.
+        """
+        if scenario == 'browse':
+            page = rng.randint(1, max(len(self.product_ids) // 50, 1))
+            return 'product-list', 'GET', f'/api/v1/store/products/?page={page}', None
+        if scenario == 'product':
+            return 'product-detail', 'GET', f'/api/v1/store/products/{rng.choice(self.product_ids)}/', None
+        if scenario == 'search':
+            return 'product-search', 'GET', f'/api/v1/store/products/?name={rng.choice(self.search_terms)}', None
+        if scenario == 'categories':
+            return 'product-categories', 'GET', '/api/v1/store/categories/', None
+        if scenario == 'add_to_cart':
+            body = {'products': [{'product': rng.choice(self.product_ids), 'quantity': rng.randint(1, 3)}]}
+            return 'cart-add', 'POST', '/api/v1/store/cart/', body
+        return 'cart', 'GET', '/api/v1/store/cart/', None
+
+    def virtual_user(self, session, rng, deadline):
+        latencies = defaultdict(list)
+        statuses = defaultdict(Counter)
+        names, weights = list(SCENARIOS), list(SCENARIOS.values())
+        while time.monotonic() < deadline:
+            endpoint, method, path, body = self.next_request(rng.choices(names, weights)[0], rng)
+            start = time.perf_counter()
+            status = session.request(method, path, body)
+            elapsed = time.perf_counter() - start
+            statuses[endpoint][status or 'error'] += 1
+            if status is not None and status < 400:
+                latencies[endpoint].append(elapsed)
+        return latencies, statuses
+
+    def summarize(self, runs, options, started_at):
+        latencies = defaultdict(list)
+        statuses = defaultdict(Counter)
+        for run_latencies, run_statuses in runs:
+            for endpoint, samples in run_latencies.items():
+                latencies[endpoint].extend(samples)
+            for endpoint, counts in run_statuses.items():
+                statuses[endpoint].update(counts)
+
+        def endpoint_stats(samples, counts):
+            requests = sum(counts.values())
+            return {
+                'requests': requests,
+                'errors': requests - len(samples),
+                'statuses': {str(status): count for status, count in counts.items()},
+                'throughput': len(samples) / options['duration'],
+                **summarize(samples),
+            }
+
+        all_samples = [sample for samples in latencies.values() for sample in samples]
+        all_counts = sum(statuses.values(), Counter())
+        return {
+            'commit': self.current_commit(),
+            'started_at': started_at.isoformat(),
+            'base_url': options['base_url'],
+            'duration': options['duration'],
+            'concurrency': options['concurrency'],
+            'random_seed': options['random_seed'],
+            'endpoints': {
+                endpoint: endpoint_stats(latencies[endpoint], statuses[endpoint]) for endpoint in sorted(statuses)
+            },
+            'total': endpoint_stats(all_samples, all_counts),
+        }
+
+    def current_commit(self):
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def report(self, results):
+        self.stdout.write(
+            f'{"endpoint":<20} {"requests":>9} {"errors":>7} {"req/s":>8} {"p50 ms":>8} {"p95 ms":>8} {"p99 ms":>8}'
+        )
+        for endpoint, stats in [*results['endpoints'].items(), ('total', results['total'])]:
+            if not stats['count']:
+                self.stdout.write(f'{endpoint:<20} {stats["requests"]:>9} {stats["errors"]:>7}')
+                continue
+            self.stdout.write(
+                f'{endpoint:<20} {stats["requests"]:>9} {stats["errors"]:>7} {stats["throughput"]:>8.1f} '
+                f'{stats["p50"]:>8.2f} {stats["p95"]:>8.2f} {stats["p99"]:>8.2f}'
+            )
+
+    def compare(self, results, path):
+        with open(path) as previous_file:
+            previous = json.load(previous_file)
+
+        self.stdout.write(f'Compared with {previous.get("commit") or path}:')
+        self.stdout.write(f'{"endpoint":<20} {"p95 ms":>17} {"change":>8} {"req/s":>15}')
+        for endpoint, stats in [*results['endpoints'].items(), ('total', results['total'])]:
+            before = previous['total'] if endpoint == 'total' else previous['endpoints'].get(endpoint)
+            if not before or not before['p95'] or not stats['p95']:
+                continue
+            change = (stats['p95'] - before['p95']) / before['p95'] * 100
+            self.stdout.write(
+                f'{endpoint:<20} {before["p95"]:>8.2f} {stats["p95"]:>8.2f} {change:>+7.1f}% '
+                f'{before["throughput"]:>7.1f} {stats["throughput"]:>7.1f}'
+            )
@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from core.store.uploads import purge_stale_chunked_uploads
+
+
+class Command(BaseCommand):
+    help = (
+        'Delete resumable uploads that were abandoned before completion, with their partial files. '
+        'Run it periodically, e.g. daily from cron.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--max-age', type=int, default=settings.CHUNKED_UPLOAD_EXPIRY,
+            help='Seconds since the last chunk after which an unfinished upload is deleted.'
+        )
+
+    def handle(self, *args, **options):
+        deleted = purge_stale_chunked_uploads(timedelta(seconds=options['max_age']))
+        self.stdout.write(self.style.SUCCESS(f'Deleted {deleted} abandoned uploads.'))
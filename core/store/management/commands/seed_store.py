@@ -0,0 +1,208 @@
+import random
+import time
+from datetime import timedelta
+from decimal import Decimal
+from itertools import accumulate
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from core.common.bulk import copy_rows, next_id, reset_sequences
+from core.common.cache import get_tiered_cache
+from core.profiles.models import Profile
+from core.store.models import Category, Order, OrderItem, Product, ProductImage, Review
+
+User = get_user_model()
+
+ADJECTIVES = [
+    'Classic', 'Compact', 'Deluxe', 'Durable', 'Eco', 'Essential', 'Foldable', 'Heavy-Duty', 'Lightweight',
+    'Modern', 'Portable', 'Premium', 'Rugged', 'Smart', 'Vintage', 'Wireless',
+]
+NOUNS = [
+    'Backpack', 'Blender', 'Chair', 'Headphones', 'Kettle', 'Keyboard', 'Lamp', 'Monitor', 'Mug', 'Notebook',
+    'Sneakers', 'Speaker', 'Tent', 'Toaster', 'Watch', 'Wallet',
+]
+ORDER_STATUSES = ['delivered', 'shipped', 'processing', 'pending', 'canceled']
+ORDER_STATUS_WEIGHTS = [60, 15, 10, 10, 5]
+RATING_WEIGHTS = [5, 5, 10, 30, 50]
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate a large synthetic store (users, categories, products, images, reviews, orders) and load it '
+        'with COPY on PostgreSQL, or bulk_create elsewhere. Product popularity follows a Zipf distribution, '
+        'so a few products get most reviews and order items. The same --seed produces the same data. '
+        'Signals are not sent; cached catalog pages are invalidated once at the end.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=42, help='Random seed, makes the data reproducible.')
+        parser.add_argument('--users', type=int, default=10000)
+        parser.add_argument('--categories', type=int, default=20, help='Top-level categories.')
+        parser.add_argument('--fanout', type=int, default=5, help='Subcategories under each top-level category.')
+        parser.add_argument('--products', type=int, default=100000)
+        parser.add_argument('--images', type=int, default=2, help='Images per product.')
+        parser.add_argument('--reviews', type=int, default=200000)
+        parser.add_argument('--orders', type=int, default=50000)
+        parser.add_argument('--items-per-order', type=int, default=3, help='Average items in an order.')
+        parser.add_argument(
+            '--skew', type=float, default=1.1,
+            help='Zipf exponent of product popularity, 0 makes every product equally popular.'
+        )
+        parser.add_argument('--days', type=int, default=365, help='Spread reviews and orders over this many days.')
+        parser.add_argument('--batch-size', type=int, default=50000, help='Rows per COPY or bulk_create.')
+
+    def handle(self, *args, **options):
+        if options['users'] < 1 and (options['reviews'] or options['orders']):
+            raise CommandError('Reviews and orders need at least one user.')
+        if options['categories'] < 1 or options['products'] < 1:
+            raise CommandError('At least one category and one product are needed.')
+
+        self.rng = random.Random(options['seed'])
+        self.options = options
+        self.now = timezone.now()
+        self.total_rows = 0
+        self.total_time = 0
+        loader = 'COPY' if connection.vendor == 'postgresql' else 'bulk_create'
+        self.stdout.write(f'Seeding {connection.vendor} with {loader}...')
+
+        user_ids = self.seed_users()
+        category_ids = self.seed_categories()
+        product_ids, prices = self.seed_products(category_ids)
+        popularity = self.popularity(len(product_ids))
+        self.seed_reviews(user_ids, product_ids, popularity)
+        self.seed_orders(user_ids, product_ids, prices, popularity)
+
+        reset_sequences(User, Category, Product, Order)
+        get_tiered_cache('categories').invalidate()
+        get_tiered_cache('products').invalidate()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {self.total_rows} rows in {self.total_time:.1f}s '
+            f'({self.total_rows / max(self.total_time, 1e-9):.0f} rows/s).'
+        ))
+
+    def load(self, model, fields, rows):
+        start = time.perf_counter()
+        count = copy_rows(model, fields, rows, batch_size=self.options['batch_size'])
+        elapsed = time.perf_counter() - start
+        self.total_rows += count
+        self.total_time += elapsed
+        self.stdout.write(
+            f'{model.__name__:<16} {count:>10} rows {elapsed:>8.1f}s '
+            f'{count / max(elapsed, 1e-9):>10.0f} rows/s'
+        )
+        return count
+
+    def random_time(self):
+        return self.now - timedelta(seconds=self.rng.randrange(self.options['days'] * 86400 or 1))
+
+    def popularity(self, count):
+        """
+        Cumulative Zipf weights over product positions. Ranks are shuffled so
+        the most popular products are not simply the oldest ones.
+        """
+        ranks = list(range(1, count + 1))
+        self.rng.shuffle(ranks)
+        return list(accumulate(1 / rank ** self.options['skew'] for rank in ranks))
+
+    def seed_users(self):
+        first_id = next_id(User)
+        count = self.options['users']
+        user_ids = range(first_id, first_id + count)
+        password = make_password(None)
+        self.load(User, ['pkid', 'email', 'first_name', 'last_name', 'password', 'date_joined'], (
+            (pkid, f'seed{pkid}@example.com', 'Seed', f'User {pkid}', password, self.random_time())
+            for pkid in user_ids
+        ))
+        # Profiles are normally created by the post_save signal, which COPY bypasses.
+        self.load(Profile, ['user_id'], ((pkid,) for pkid in user_ids))
+        return user_ids
+
+    def seed_categories(self):
+        first_id = next_id(Category)
+        roots = self.options['categories']
+        fanout = self.options['fanout']
+        rows = [(first_id + index, f'Category {first_id + index}', None) for index in range(roots)]
+        for root_id in range(first_id, first_id + roots):
+            for _ in range(fanout):
+                category_id = first_id + len(rows)
+                rows.append((category_id, f'Category {category_id}', root_id))
+        self.load(Category, ['id', 'name', 'parent_category_id'], rows)
+        # Products are filed under the leaves.
+        leaves = [row[0] for row in rows if row[2] is not None] or [row[0] for row in rows]
+        return leaves
+
+    def seed_products(self, category_ids):
+        first_id = next_id(Product)
+        count = self.options['products']
+        rng = self.rng
+        product_ids = range(first_id, first_id + count)
+        prices = [Decimal(f'{rng.lognormvariate(3.5, 0.8):.2f}') for _ in product_ids]
+        fields = ['id', 'name', 'description', 'price', 'category_id', 'stock', 'created_at', 'updated_at']
+        self.load(Product, fields, (
+            (
+                product_id,
+                f'{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {product_id}',
+                'Synthetic product generated by seed_store.',
+                price,
+                rng.choice(category_ids),
+                rng.randrange(0, 500),
+                created_at,
+                created_at,
+            )
+            for product_id, price in zip(product_ids, prices)
+            for created_at in [self.random_time()]
+        ))
+        self.load(ProductImage, ['product_id', 'image', 'alt_text'], (
+            (product_id, f'https://cdn.example.com/products/{product_id}-{index}.jpg', '')
+            for product_id in product_ids
+            for index in range(self.options['images'])
+        ))
+        return product_ids, prices
+
+    def seed_reviews(self, user_ids, product_ids, popularity):
+        rng = self.rng
+        count = self.options['reviews']
+        products = rng.choices(product_ids, cum_weights=popularity, k=count)
+        ratings = rng.choices(range(1, 6), weights=RATING_WEIGHTS, k=count)
+        self.load(Review, ['user_id', 'product_id', 'rating', 'comment', 'created_at'], (
+            (rng.choice(user_ids), product_id, rating, None, self.random_time())
+            for product_id, rating in zip(products, ratings)
+        ))
+
+    def seed_orders(self, user_ids, product_ids, prices, popularity):
+        rng = self.rng
+        count = self.options['orders']
+        average = self.options['items_per_order']
+        first_id = next_id(Order)
+        first_product_id = product_ids[0]
+
+        # Item counts vary around the average, between 1 and twice the average.
+        sizes = [rng.randint(1, max(2 * average - 1, 1)) for _ in range(count)]
+        products = rng.choices(product_ids, cum_weights=popularity, k=sum(sizes))
+        items = []
+        totals = []
+        position = 0
+        for order_id, size in zip(range(first_id, first_id + count), sizes):
+            total = Decimal('0.00')
+            for product_id in products[position:position + size]:
+                quantity = rng.randint(1, 3)
+                price = prices[product_id - first_product_id]
+                total += price * quantity
+                items.append((order_id, product_id, quantity, price))
+            position += size
+            totals.append(total)
+
+        self.load(Order, ['id', 'user_id', 'total_amount', 'status', 'created_at', 'updated_at'], (
+            (order_id, rng.choice(user_ids), total, status, created_at, created_at)
+            for order_id, total, status in zip(
+                range(first_id, first_id + count), totals,
+                rng.choices(ORDER_STATUSES, weights=ORDER_STATUS_WEIGHTS, k=count)
+            )
+            for created_at in [self.random_time()]
+        ))
+        self.load(OrderItem, ['order_id', 'product_id', 'quantity', 'price'], items)
@@ -0,0 +1,32 @@
+# Generated by Django 4.1.7 on 2026-10-19 16:56
+
+from django.db import migrations, models
+from django.db.models import Min
+
+
+def remove_duplicate_wishlist_items(apps, schema_editor):
+    Wishlist = apps.get_model("store", "Wishlist")
+    keep_ids = (
+        Wishlist.objects.values("user", "product")
+        .annotate(keep_id=Min("id"))
+        .values_list("keep_id", flat=True)
+    )
+    Wishlist.objects.exclude(id__in=list(keep_ids)).delete()
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("store", "0003_alter_productimage_image"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_wishlist_items, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="wishlist",
+            constraint=models.UniqueConstraint(
+                fields=("user", "product"), name="unique_wishlist_product"
+            ),
+        ),
+    ]
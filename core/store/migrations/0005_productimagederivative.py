@@ -0,0 +1,87 @@
+# Generated by Django 4.1.7 on 2026-10-19 16:58
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("store", "0004_wishlist_unique_product"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productimage",
+            name="upload",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="The uploaded file behind this image, used to serve resized derivatives.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="product_images",
+                to="store.productimageupload",
+            ),
+        ),
+        migrations.CreateModel(
+            name="ProductImageDerivative",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "size",
+                    models.CharField(
+                        choices=[
+                            ("thumb", "Thumbnail"),
+                            ("card", "Card"),
+                            ("zoom", "Zoom"),
+                        ],
+                        help_text="Named size of the derivative.",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "format",
+                    models.CharField(
+                        choices=[("webp", "WebP"), ("jpeg", "JPEG")],
+                        help_text="Encoding of the derivative.",
+                        max_length=10,
+                    ),
+                ),
+                (
+                    "width",
+                    models.PositiveIntegerField(
+                        help_text="Width of the derivative in pixels."
+                    ),
+                ),
+                (
+                    "height",
+                    models.PositiveIntegerField(
+                        help_text="Height of the derivative in pixels."
+                    ),
+                ),
+                ("image", models.ImageField(upload_to="products/derivatives")),
+                (
+                    "upload",
+                    models.ForeignKey(
+                        help_text="The original upload this derivative was generated from.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="derivatives",
+                        to="store.productimageupload",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name="productimagederivative",
+            constraint=models.UniqueConstraint(
+                fields=("upload", "size", "format"), name="unique_image_derivative"
+            ),
+        ),
+    ]
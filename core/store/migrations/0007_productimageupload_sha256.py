@@ -0,0 +1,52 @@
+# Generated by Django 4.1.7 on 2026-10-19 17:01
+
+import core.store.models
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("store", "0006_chunkedupload"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="productimageupload",
+            name="ref_count",
+            field=models.PositiveIntegerField(
+                default=1, help_text="Number of uploads sharing this file."
+            ),
+        ),
+        migrations.AddField(
+            model_name="productimageupload",
+            name="sha256",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="SHA-256 digest of the file contents.",
+                max_length=64,
+                null=True,
+                unique=True,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="chunkedupload",
+            name="upload",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="The stored image once all chunks have been received.",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="chunked_uploads",
+                to="store.productimageupload",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="productimageupload",
+            name="image",
+            field=models.ImageField(
+                upload_to=core.store.models.product_image_upload_to
+            ),
+        ),
+    ]
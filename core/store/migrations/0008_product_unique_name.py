@@ -0,0 +1,35 @@
+# Generated by Django 4.1.7 on 2026-10-19 17:01
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def rename_duplicate_products(apps, schema_editor):
+    Product = apps.get_model("store", "Product")
+    duplicate_names = (
+        Product.objects.values("name")
+        .annotate(total=Count("id"))
+        .filter(total__gt=1)
+        .values_list("name", flat=True)
+    )
+    for name in list(duplicate_names):
+        # Keep the oldest product's name and suffix the rest with their id.
+        for product in Product.objects.filter(name=name).order_by("id")[1:]:
+            product.name = f"{name[:240]} ({product.id})"
+            product.save(update_fields=["name"])
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("store", "0007_productimageupload_sha256"),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_products, migrations.RunPython.noop),
+        migrations.AddConstraint(
+            model_name="product",
+            constraint=models.UniqueConstraint(
+                fields=("name",), name="unique_product_name"
+            ),
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 4.1.7 on 2026-10-19 17:07
+
+from django.db import migrations, models
+
+# Case-insensitive prefix search in the admin runs UPPER(name::text) LIKE 'TERM%'.
+NAME_SEARCH_INDEX = "store_product_name_upper_like"
+
+
+def create_name_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX {NAME_SEARCH_INDEX} ON store_product (UPPER(name) text_pattern_ops)"
+        )
+
+
+def drop_name_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {NAME_SEARCH_INDEX}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("store", "0008_product_unique_name"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="order",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("pending", "Pending"),
+                    ("processing", "Processing"),
+                    ("shipped", "Shipped"),
+                    ("delivered", "Delivered"),
+                    ("canceled", "Canceled"),
+                ],
+                db_index=True,
+                default="pending",
+                help_text="Current status of the order.",
+                max_length=20,
+            ),
+        ),
+        migrations.RunPython(create_name_search_index, drop_name_search_index),
+    ]
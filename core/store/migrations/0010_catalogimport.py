@@ -0,0 +1,98 @@
+# Generated by Django 4.1.7 on 2026-10-19 17:30
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("store", "0009_admin_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CatalogImport",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "file",
+                    models.FileField(
+                        help_text="CSV or JSONL product feed.",
+                        upload_to="catalog/imports",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("running", "Running"),
+                            ("done", "Done"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        help_text="Current state of the import.",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "inserted",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Products created by the import."
+                    ),
+                ),
+                (
+                    "updated",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Existing products updated by the import."
+                    ),
+                ),
+                (
+                    "rejected",
+                    models.PositiveIntegerField(
+                        default=0, help_text="Rows that failed validation."
+                    ),
+                ),
+                (
+                    "errors",
+                    models.TextField(
+                        blank=True,
+                        help_text="The first rejected rows and why they were rejected.",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        auto_now_add=True, help_text="When the feed was uploaded."
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True, help_text="When the import finished.", null=True
+                    ),
+                ),
+                (
+                    "created_by",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Admin who uploaded the feed.",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="catalog_imports",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+        ),
+    ]
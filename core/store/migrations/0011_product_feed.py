@@ -0,0 +1,50 @@
+# Generated by Django 4.1.7 on 2026-10-19 17:32
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("store", "0010_catalogimport"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "product_id",
+                    models.BigIntegerField(help_text="ID of the deleted product."),
+                ),
+                (
+                    "deleted_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="When the product was deleted.",
+                    ),
+                ),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["updated_at", "id"], name="product_updated_at_id"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="producttombstone",
+            index=models.Index(
+                fields=["deleted_at", "product_id"], name="tombstone_deleted_at_id"
+            ),
+        ),
+    ]
@@ -1,4 +1,9 @@
-from django.db import models
+import os
+import uuid
+
+from django.conf import settings
+from django.db import models, transaction
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.contrib.auth import get_user_model
 
@@ -41,9 +46,44 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the product was added.")
     updated_at = models.DateTimeField(auto_now=True, help_text="When the product was last updated.")
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['name'], name='unique_product_name'),
+        ]
+        indexes = [
+            # Walked in order by the delta feed.
+            models.Index(fields=['updated_at', 'id'], name='product_updated_at_id'),
+        ]
+
     def __str__(self):
         return self.name
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored price and stock so saves can detect restocks and price drops.
+        instance._loaded_values = {
+            name: value for name, value in zip(field_names, values) if name in ('price', 'stock')
+        }
+        return instance
+
+
+# Product Tombstone Model /////////////////
+class ProductTombstone(models.Model):
+    """
+    Remembers a deleted product so the delta feed can report the deletion.
+    """
+    product_id = models.BigIntegerField(help_text="ID of the deleted product.")
+    deleted_at = models.DateTimeField(default=timezone.now, help_text="When the product was deleted.")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['deleted_at', 'product_id'], name='tombstone_deleted_at_id'),
+        ]
+
+    def __str__(self):
+        return f"Product {self.product_id} deleted at {self.deleted_at}"
+
 
 # Product Image Model /////////////////
 class ProductImage(models.Model):
@@ -57,13 +97,119 @@ class ProductImage(models.Model):
     alt_text = models.CharField(
         max_length=255, blank=True, help_text="Alternate text for the image (for accessibility)."
     )
+    upload = models.ForeignKey(
+        'ProductImageUpload',
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="product_images",
+        help_text="The uploaded file behind this image, used to serve resized derivatives."
+    )
 
     def __str__(self):
         return f"Image for {self.product.name}"
 
 
+def product_image_upload_to(instance, filename):
+    """
+    Store uploads under their content hash so identical files share one name.
+    """
+    if not instance.sha256:
+        return f'products/images/{filename}'
+    extension = os.path.splitext(filename)[1].lower()
+    return f'products/images/{instance.sha256[:2]}/{instance.sha256}{extension}'
+
+
 class ProductImageUpload(models.Model):
-    image = models.ImageField(upload_to='products/images')
+    """
+    An uploaded product image file. Files are deduplicated by SHA-256 digest;
+    `ref_count` tracks how many uploads resolved to this stored file.
+    """
+    image = models.ImageField(upload_to=product_image_upload_to)
+    sha256 = models.CharField(
+        max_length=64, unique=True, null=True, blank=True, editable=False,
+        help_text="SHA-256 digest of the file contents."
+    )
+    ref_count = models.PositiveIntegerField(default=1, help_text="Number of uploads sharing this file.")
+
+    def release(self):
+        """
+        Drop one reference to the stored file, deleting it with the last one.
+        """
+        with transaction.atomic():
+            upload = ProductImageUpload.objects.select_for_update().get(pk=self.pk)
+            if upload.ref_count > 1:
+                ProductImageUpload.objects.filter(pk=self.pk).update(ref_count=models.F('ref_count') - 1)
+                return False
+            upload.delete()
+            return True
+
+
+# Chunked Upload Model /////////////////
+class ChunkedUpload(models.Model):
+    """
+    A resumable upload in progress. Chunks are appended to a partial file on
+    disk until `offset` reaches `size`, then the file becomes a ProductImageUpload.
+    """
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="chunked_uploads", help_text="User performing the upload."
+    )
+    filename = models.CharField(max_length=255, help_text="Original name of the uploaded file.")
+    size = models.PositiveBigIntegerField(help_text="Total size of the file in bytes.")
+    offset = models.PositiveBigIntegerField(default=0, help_text="Number of bytes received so far.")
+    upload = models.ForeignKey(
+        ProductImageUpload, on_delete=models.SET_NULL, null=True, blank=True, related_name="chunked_uploads",
+        help_text="The stored image once all chunks have been received."
+    )
+    created_at = models.DateTimeField(auto_now_add=True, help_text="When the upload was started.")
+    updated_at = models.DateTimeField(auto_now=True, help_text="When the last chunk was received.")
+
+    def __str__(self):
+        return f"{self.filename} ({self.offset}/{self.size} bytes)"
+
+    @property
+    def partial_path(self):
+        return os.path.join(settings.CHUNKED_UPLOAD_DIR, str(self.id))
+
+    @property
+    def is_complete(self):
+        return self.offset == self.size
+
+
+# Product Image Derivative Model /////////////////
+class ProductImageDerivative(models.Model):
+    """
+    A resized, EXIF-stripped rendition of an uploaded product image.
+    Generated asynchronously after upload.
+    """
+    SIZE_CHOICES = [
+        ('thumb', 'Thumbnail'),
+        ('card', 'Card'),
+        ('zoom', 'Zoom'),
+    ]
+    FORMAT_CHOICES = [
+        ('webp', 'WebP'),
+        ('jpeg', 'JPEG'),
+    ]
+
+    upload = models.ForeignKey(
+        ProductImageUpload, on_delete=models.CASCADE, related_name="derivatives",
+        help_text="The original upload this derivative was generated from."
+    )
+    size = models.CharField(max_length=10, choices=SIZE_CHOICES, help_text="Named size of the derivative.")
+    format = models.CharField(max_length=10, choices=FORMAT_CHOICES, help_text="Encoding of the derivative.")
+    width = models.PositiveIntegerField(help_text="Width of the derivative in pixels.")
+    height = models.PositiveIntegerField(help_text="Height of the derivative in pixels.")
+    image = models.ImageField(upload_to='products/derivatives')
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['upload', 'size', 'format'], name='unique_image_derivative'),
+        ]
+
+    def __str__(self):
+        return f"{self.size} {self.format} derivative of upload {self.upload_id}"
 
 
 # Cart Model ///////////////////////
@@ -78,7 +224,7 @@ class Cart(models.Model):
     updated_at = models.DateTimeField(auto_now=True, help_text="When the cart was last updated.")
 
     def __str__(self):
-        return f"Cart for {self.user.username}"
+        return f"Cart for {self.user.email}"
 
 
 # Cart Item Model ///////////////////////////////////
@@ -116,13 +262,14 @@ class Order(models.Model):
         max_digits=10, decimal_places=2, help_text="Total amount for the order."
     )
     status = models.CharField(
-        max_length=20, choices=STATUS_CHOICES, default='pending', help_text="Current status of the order."
+        max_length=20, choices=STATUS_CHOICES, default='pending', db_index=True,
+        help_text="Current status of the order."
     )
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the order was placed.")
     updated_at = models.DateTimeField(auto_now=True, help_text="When the order was last updated.")
 
     def __str__(self):
-        return f"Order {self.id} for {self.user.username}"
+        return f"Order {self.id} for {self.user.email}"
 
 
 # Order Item Model ///////////////////////////////////
@@ -159,7 +306,7 @@ class Review(models.Model):
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the review was created.")
 
     def __str__(self):
-        return f"Review for {self.product.name} by {self.user.username}"
+        return f"Review for {self.product.name} by {self.user.email}"
 
 
 # Wishlist Model
@@ -175,5 +322,41 @@ class Wishlist(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True, help_text="When the product was added to the wishlist.")
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'product'], name='unique_wishlist_product'),
+        ]
+
+    def __str__(self):
+        return f"{self.product.name} in {self.user.email}'s wishlist"
+
+
+# Catalog Import Model /////////////////
+class CatalogImport(models.Model):
+    """
+    A product feed uploaded through the admin and merged into the catalog by a Celery task.
+    """
+    STATUS_CHOICES = [
+        ('pending', 'Pending'),
+        ('running', 'Running'),
+        ('done', 'Done'),
+        ('failed', 'Failed'),
+    ]
+
+    file = models.FileField(upload_to='catalog/imports', help_text="CSV or JSONL product feed.")
+    status = models.CharField(
+        max_length=20, choices=STATUS_CHOICES, default='pending', help_text="Current state of the import."
+    )
+    inserted = models.PositiveIntegerField(default=0, help_text="Products created by the import.")
+    updated = models.PositiveIntegerField(default=0, help_text="Existing products updated by the import.")
+    rejected = models.PositiveIntegerField(default=0, help_text="Rows that failed validation.")
+    errors = models.TextField(blank=True, help_text="The first rejected rows and why they were rejected.")
+    created_by = models.ForeignKey(
+        User, on_delete=models.SET_NULL, null=True, blank=True, related_name="catalog_imports",
+        help_text="Admin who uploaded the feed."
+    )
+    created_at = models.DateTimeField(auto_now_add=True, help_text="When the feed was uploaded.")
+    finished_at = models.DateTimeField(null=True, blank=True, help_text="When the import finished.")
+
     def __str__(self):
-        return f"{self.product.name} in {self.user.username}'s wishlist"
\ No newline at end of file
+        return f"Catalog import {self.id} ({self.status})"
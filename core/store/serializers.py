@@ -1,6 +1,8 @@
+from django.conf import settings
 from rest_framework import serializers
+from .catalog import MAX_STOCK
 from .models import (
-    Category, Product, ProductImage, Cart, CartItem,
+    Category, Product, ProductImage, Cart, CartItem, ChunkedUpload,
     Order, OrderItem, ProductImageUpload, Review, Wishlist
 )
 from core.users.serializers import UserSerializer
@@ -20,22 +22,45 @@ class CategorySerializer(serializers.ModelSerializer):
         fields = ['id', 'name', 'description']
 
 
+def build_srcset(derivatives):
+    """
+    Group image derivatives into srcset strings per format, e.g.
+    {'webp': '/mediafiles/.../a.webp 200w, /mediafiles/.../b.webp 600w', 'jpeg': '...'}
+    """
+    candidates = {}
+    for derivative in sorted(derivatives, key=lambda derivative: derivative.width):
+        candidates.setdefault(derivative.format, []).append(f'{derivative.image.url} {derivative.width}w')
+    return {fmt: ', '.join(entries) for fmt, entries in candidates.items()}
+
+
 # Product Image Serializer
 class ProductImageSerializer(serializers.ModelSerializer):
     """
     Serializer for the ProductImage model.
+    Exposes resized derivatives of the uploaded file as srcset strings.
     """
+    srcset = serializers.SerializerMethodField()
+
     class Meta:
         model = ProductImage
-        fields = ['id', 'image', 'alt_text']
+        fields = ['id', 'image', 'alt_text', 'srcset']
+
+    def get_srcset(self, obj):
+        if obj.upload_id is None:
+            return {}
+        return build_srcset(obj.upload.derivatives.all())
 
 
 class ProductImageUploadSerializer(serializers.ModelSerializer):
     image = serializers.ImageField(read_only=True)
+    srcset = serializers.SerializerMethodField()
 
     class Meta:
         model = ProductImageUpload
-        fields = ["id", "image"]
+        fields = ["id", "image", "srcset"]
+
+    def get_srcset(self, obj):
+        return build_srcset(obj.derivatives.all())
 
 
 class CreaeteProductImageUploadSerializer(serializers.Serializer):
@@ -49,6 +74,33 @@ class CreaeteProductImageUploadSerializer(serializers.Serializer):
         allow_empty=False
     )
 
+    def validate_images(self, images):
+        max_file_size = settings.PRODUCT_IMAGE_UPLOAD_MAX_FILE_SIZE
+        for image in images:
+            if image.size > max_file_size:
+                raise serializers.ValidationError(f'Each file is limited to {max_file_size} bytes.')
+        return images
+
+
+class ChunkedUploadSerializer(serializers.ModelSerializer):
+    """
+    Serializer for resumable uploads. Clients create one with the file name and
+    total size, then PATCH chunks until `offset` reaches `size`.
+    """
+    upload = ProductImageUploadSerializer(read_only=True)
+
+    class Meta:
+        model = ChunkedUpload
+        fields = ['id', 'filename', 'size', 'offset', 'upload', 'created_at']
+        read_only_fields = ['offset', 'created_at']
+
+    def validate_size(self, size):
+        if size < 1:
+            raise serializers.ValidationError('Size must be at least 1 byte.')
+        if size > settings.CHUNKED_UPLOAD_MAX_SIZE:
+            raise serializers.ValidationError(f'Uploads are limited to {settings.CHUNKED_UPLOAD_MAX_SIZE} bytes.')
+        return size
+
 
 # Product Serializer
 class ProductSerializer(serializers.ModelSerializer):
@@ -68,14 +120,101 @@ class ProductSerializer(serializers.ModelSerializer):
         allow_empty=True,
         required=False
     )
+    is_wishlisted = serializers.SerializerMethodField()
 
     class Meta:
         model = Product
         fields = [
             'id', 'name', 'price', 'category', 'category_id',
-            'stock', 'created_at', 'updated_at', 'images', 'image_urls'
+            'stock', 'created_at', 'updated_at', 'images', 'image_urls',
+            'is_wishlisted'
         ]
 
+    def get_is_wishlisted(self, obj):
+        # Annotated by the views with an Exists() subquery for authenticated users.
+        return getattr(obj, 'is_wishlisted', False)
+
+
+class BulkProductSerializer(serializers.ModelSerializer):
+    """
+    A product row in a bulk create request. The category is validated for the
+    whole batch at once by BulkProductCreateSerializer.
+    """
+    category_id = serializers.IntegerField()
+    image_urls = serializers.ListField(
+        child=serializers.CharField(max_length=500),
+        allow_empty=True,
+        required=False,
+        default=list
+    )
+
+    class Meta:
+        model = Product
+        fields = ['name', 'description', 'price', 'category_id', 'stock', 'image_urls']
+
+
+class BulkProductCreateSerializer(serializers.Serializer):
+    products = serializers.ListField(child=BulkProductSerializer(), allow_empty=False, max_length=1000)
+
+    def validate_products(self, products):
+        names = [product['name'] for product in products]
+        if len(set(names)) != len(names):
+            raise serializers.ValidationError('Product names must be unique within a request.')
+
+        category_ids = {product['category_id'] for product in products}
+        existing_ids = set(Category.objects.filter(pk__in=category_ids).values_list('pk', flat=True))
+        missing_ids = category_ids - existing_ids
+        if missing_ids:
+            raise serializers.ValidationError(f'Categories not found: {sorted(missing_ids)}')
+        return products
+
+
+class PriceRuleSerializer(serializers.Serializer):
+    category_id = serializers.IntegerField()
+    price_percent = serializers.DecimalField(max_digits=6, decimal_places=2, min_value=-99, max_value=1000)
+
+
+class BulkProductUpdateSerializer(serializers.Serializer):
+    """
+    Explicit `{product_id: value}` maps and/or per-category price rules.
+    """
+    prices = serializers.DictField(
+        child=serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0), required=False
+    )
+    stock = serializers.DictField(
+        child=serializers.IntegerField(min_value=0, max_value=MAX_STOCK), required=False
+    )
+    rules = serializers.ListField(child=PriceRuleSerializer(), required=False, max_length=100)
+
+    def _product_ids(self, values):
+        if len(values) > 5000:
+            raise serializers.ValidationError('At most 5000 products can be updated per request.')
+        try:
+            return {int(product_id): value for product_id, value in values.items()}
+        except ValueError:
+            raise serializers.ValidationError('Keys must be product IDs.')
+
+    def validate_prices(self, prices):
+        return self._product_ids(prices)
+
+    def validate_stock(self, stock):
+        return self._product_ids(stock)
+
+    def validate_rules(self, rules):
+        category_ids = [rule['category_id'] for rule in rules]
+        if len(set(category_ids)) != len(category_ids):
+            raise serializers.ValidationError('Only one rule per category is allowed.')
+        existing_ids = Category.objects.filter(pk__in=category_ids).values_list('pk', flat=True)
+        missing_ids = set(category_ids) - set(existing_ids)
+        if missing_ids:
+            raise serializers.ValidationError(f'Categories not found: {sorted(missing_ids)}')
+        return rules
+
+    def validate(self, data):
+        if not any(data.get(field) for field in ('prices', 'stock', 'rules')):
+            raise serializers.ValidationError('Provide prices, stock or rules.')
+        return data
+
 
 class SimpleProductSerializer(serializers.ModelSerializer):
     class Meta:
@@ -161,12 +300,21 @@ class ReviewSerializer(serializers.ModelSerializer):
 class WishlistSerializer(serializers.ModelSerializer):
     """
     Serializer for Wishlist model.
-    Includes product details.
+    Includes a lightweight summary of the product.
     """
-    product = ProductSerializer(read_only=True)
+    product = SimpleProductSerializer(read_only=True)
 
     class Meta:
         model = Wishlist
-        fields = ['id', 'user', 'product', 'created_at']
+        fields = ['id', 'product', 'created_at']
 
 
+class WishlistBulkSerializer(serializers.Serializer):
+    """
+    Validates a list of product ids for bulk wishlist add/remove.
+    """
+    products = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=500
+    )
@@ -0,0 +1,59 @@
+from decimal import Decimal
+from functools import partial
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.common.cache import get_tiered_cache
+
+from .models import (
+    Category, Product, ProductImage, ProductImageDerivative, ProductImageUpload, ProductTombstone
+)
+from .tasks import BACK_IN_STOCK, PRICE_DROP, enqueue_wishlist_notification
+
+
+@receiver(post_save, sender=Product)
+def notify_wishlisters_on_change(sender, instance, created, **kwargs):
+    previous = getattr(instance, '_loaded_values', None)
+    instance._loaded_values = {'price': Decimal(str(instance.price)), 'stock': int(instance.stock)}
+    if created or not previous:
+        return
+
+    events = []
+    if previous.get('stock') == 0 and instance._loaded_values['stock'] > 0:
+        events.append(BACK_IN_STOCK)
+    if 'price' in previous and instance._loaded_values['price'] < previous['price']:
+        events.append(PRICE_DROP)
+
+    for event in events:
+        transaction.on_commit(partial(enqueue_wishlist_notification, instance.pk, event))
+
+
+@receiver(post_delete, sender=Product)
+def record_product_tombstone(sender, instance, **kwargs):
+    ProductTombstone.objects.create(product_id=instance.pk)
+
+
+@receiver(post_delete, sender=ProductImageUpload)
+@receiver(post_delete, sender=ProductImageDerivative)
+def delete_stored_image(sender, instance, **kwargs):
+    # Only remove the file once the row deletion has actually been committed.
+    transaction.on_commit(partial(instance.image.delete, save=False))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_caches(sender, **kwargs):
+    # Product representations embed their category, so both namespaces go.
+    transaction.on_commit(get_tiered_cache('categories').invalidate)
+    transaction.on_commit(get_tiered_cache('products').invalidate)
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(post_save, sender=ProductImageDerivative)
+def invalidate_product_cache(sender, **kwargs):
+    transaction.on_commit(get_tiered_cache('products').invalidate)
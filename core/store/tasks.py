@@ -0,0 +1,193 @@
+import hashlib
+import logging
+from io import BytesIO, TextIOWrapper
+from itertools import islice
+
+import redis
+from celery import shared_task
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.mail import EmailMessage, get_connection
+from django.utils import timezone
+from PIL import Image, ImageOps
+
+from .catalog import CatalogImporter, catalog_format, read_catalog
+from .models import CatalogImport, Product, ProductImageDerivative, ProductImageUpload, Wishlist
+
+logger = logging.getLogger(__name__)
+
+BACK_IN_STOCK = 'back_in_stock'
+PRICE_DROP = 'price_drop'
+
+NOTIFICATION_SUBJECTS = {
+    BACK_IN_STOCK: 'Back in stock: {name}',
+    PRICE_DROP: 'Price drop: {name} is now {price}',
+}
+
+NOTIFICATION_BODIES = {
+    BACK_IN_STOCK: '{name} from your wishlist is back in stock.',
+    PRICE_DROP: '{name} from your wishlist has dropped in price to {price}.',
+}
+
+
+def enqueue_wishlist_notification(product_id, event):
+    """
+    Queue a wishlist notification unless one was already queued for this
+    product and event within WISHLIST_NOTIFICATION_THROTTLE seconds.
+    """
+    throttle_key = f'wishlist-notification:{event}:{product_id}'
+    try:
+        first = cache.add(throttle_key, True, settings.WISHLIST_NOTIFICATION_THROTTLE)
+    except redis.RedisError as error:
+        # Fail open like the API throttles: a duplicate email beats a lost one.
+        logger.warning(f'Wishlist notification throttle unavailable: {error}')
+        first = True
+    if not first:
+        logger.info(f'Skipping {event} notification for product {product_id}, already sent recently.')
+        return False
+
+    notify_wishlisters.delay(product_id, event)
+    return True
+
+
+def _batched(iterable, size):
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+@shared_task
+def notify_wishlisters(product_id, event):
+    """
+    Email every active user who has the product in their wishlist.
+    Recipients are streamed in chunks and sent in batches over one connection.
+    """
+    try:
+        product = Product.objects.get(pk=product_id)
+    except Product.DoesNotExist:
+        return 0
+
+    # The product may have sold out again between the save and this task running.
+    if event == BACK_IN_STOCK and product.stock == 0:
+        return 0
+
+    chunk_size = settings.WISHLIST_NOTIFICATION_CHUNK_SIZE
+    recipients = (
+        Wishlist.objects.filter(product_id=product_id, user__is_active=True)
+        .order_by('pk')
+        .values_list('user__email', flat=True)
+        .iterator(chunk_size=chunk_size)
+    )
+    subject = NOTIFICATION_SUBJECTS[event].format(name=product.name, price=product.price)
+    body = NOTIFICATION_BODIES[event].format(name=product.name, price=product.price)
+
+    sent = 0
+    connection = get_connection(settings.WISHLIST_NOTIFICATION_EMAIL_BACKEND)
+    connection.open()
+    try:
+        for batch in _batched(recipients, chunk_size):
+            messages = [EmailMessage(subject, body, to=[email], connection=connection) for email in batch]
+            result = connection.send_messages(messages)
+            # CeleryEmailBackend queues the batch and returns task results instead of a count.
+            sent += result if isinstance(result, int) else len(messages)
+    finally:
+        connection.close()
+
+    logger.info(f'Sent {sent} {event} notifications for product {product_id}.')
+    return sent
+
+
+DERIVATIVE_FORMATS = {
+    'webp': ('WEBP', 'webp'),
+    'jpeg': ('JPEG', 'jpg'),
+}
+
+
+def _encode_derivative(image, fmt):
+    pil_format, extension = DERIVATIVE_FORMATS[fmt]
+    if fmt == 'jpeg' and image.mode != 'RGB':
+        image = image.convert('RGB')
+
+    # No exif/icc arguments are passed, so metadata from the original is dropped.
+    buffer = BytesIO()
+    image.save(buffer, format=pil_format, quality=settings.PRODUCT_IMAGE_DERIVATIVE_QUALITY, optimize=True)
+    content = buffer.getvalue()
+
+    # Content-hashed names keep derivative URLs immutable and cacheable.
+    digest = hashlib.sha256(content).hexdigest()[:32]
+    return ContentFile(content, name=f'{digest}.{extension}')
+
+
+@shared_task
+def generate_image_derivatives(upload_id):
+    """
+    Build resized WebP/JPEG derivatives of an uploaded product image.
+    """
+    try:
+        upload = ProductImageUpload.objects.get(pk=upload_id)
+    except ProductImageUpload.DoesNotExist:
+        return 0
+
+    with upload.image.open('rb') as original:
+        source = Image.open(original)
+        # Apply the EXIF orientation before it is stripped from the derivatives.
+        source = ImageOps.exif_transpose(source)
+        source.load()
+
+    if source.mode not in ('RGB', 'RGBA'):
+        source = source.convert('RGBA' if 'transparency' in source.info else 'RGB')
+
+    created = 0
+    for size, max_edge in settings.PRODUCT_IMAGE_DERIVATIVE_SIZES.items():
+        rendition = source.copy()
+        rendition.thumbnail((max_edge, max_edge), Image.LANCZOS)
+
+        for fmt in DERIVATIVE_FORMATS:
+            ProductImageDerivative.objects.update_or_create(
+                upload=upload, size=size, format=fmt,
+                defaults={
+                    'width': rendition.width,
+                    'height': rendition.height,
+                    'image': _encode_derivative(rendition, fmt),
+                }
+            )
+            created += 1
+
+    logger.info(f'Generated {created} derivatives for product image upload {upload_id}.')
+    return created
+
+
+@shared_task
+def run_catalog_import(import_id):
+    """
+    Merge an uploaded product feed into the catalog, saving the counts after every chunk.
+    """
+    try:
+        catalog_import = CatalogImport.objects.get(pk=import_id)
+    except CatalogImport.DoesNotExist:
+        return None
+
+    def save_progress(importer, status='running'):
+        CatalogImport.objects.filter(pk=import_id).update(
+            status=status, errors='\n'.join(importer.errors),
+            finished_at=None if status == 'running' else timezone.now(), **importer.counts
+        )
+
+    importer = CatalogImporter()
+    save_progress(importer)
+    try:
+        with catalog_import.file.open('rb') as feed:
+            rows = read_catalog(
+                TextIOWrapper(feed, encoding='utf-8', newline=''), catalog_format(catalog_import.file.name)
+            )
+            importer.run(rows, progress=save_progress)
+    except Exception as error:
+        logger.exception(f'Catalog import {import_id} failed.')
+        importer.errors.append(f'Import stopped: {error}')
+        save_progress(importer, 'failed')
+        return None
+
+    save_progress(importer, 'done')
+    logger.info(f'Catalog import {import_id} finished: {importer.counts}.')
+    return importer.counts
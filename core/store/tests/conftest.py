@@ -60,4 +60,10 @@ def cart(user):
 
 @pytest.fixture
 def cart_item(cart, product):
-    return CartItem.objects.create(cart=cart, product=product, quantity=1)
\ No newline at end of file
+    return CartItem.objects.create(cart=cart, product=product, quantity=1)
+
+
+@pytest.fixture(autouse=True)
+def raise_on_query_problems(settings):
+    # Fail store tests on N+1 patterns and views going over their max_queries.
+    settings.QUERY_INSPECTION = 'raise'
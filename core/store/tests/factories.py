@@ -0,0 +1,53 @@
+import factory
+from factory.django import DjangoModelFactory
+
+from core.users.tests.factories import UserFactory
+from ..models import Cart, CartItem, Category, Product, ProductImage
+
+
+class CategoryFactory(DjangoModelFactory):
+    class Meta:
+        model = Category
+
+    name = factory.Sequence(lambda n: f'Category {n}')
+    description = factory.Faker('sentence')
+
+
+class ProductFactory(DjangoModelFactory):
+    class Meta:
+        model = Product
+
+    class Params:
+        word = factory.Faker('word')
+
+    # Product names are unique, the real word keeps ?name= searches realistic.
+    name = factory.LazyAttributeSequence(lambda product, n: f'{product.word.title()} {n}')
+    description = factory.Faker('paragraph')
+    price = factory.Faker('pydecimal', left_digits=4, right_digits=2, positive=True)
+    category = factory.SubFactory(CategoryFactory)
+    stock = factory.Faker('random_int', min=0, max=500)
+
+
+class ProductImageFactory(DjangoModelFactory):
+    class Meta:
+        model = ProductImage
+
+    product = factory.SubFactory(ProductFactory)
+    image = factory.Sequence(lambda n: f'/mediafiles/products/images/{n}.jpg')
+    alt_text = factory.Faker('sentence', nb_words=4)
+
+
+class CartFactory(DjangoModelFactory):
+    class Meta:
+        model = Cart
+
+    user = factory.SubFactory(UserFactory)
+
+
+class CartItemFactory(DjangoModelFactory):
+    class Meta:
+        model = CartItem
+
+    cart = factory.SubFactory(CartFactory)
+    product = factory.SubFactory(ProductFactory)
+    quantity = factory.Faker('random_int', min=1, max=5)
@@ -0,0 +1,39 @@
+import pytest
+from django.test import Client
+
+from core.store.models import Order
+
+
+@pytest.fixture
+def admin_client(admin_user):
+    client = Client()
+    client.force_login(admin_user)
+    return client
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("path", [
+    "/dashboard/users/user/",
+    "/dashboard/profiles/profile/",
+    "/dashboard/store/product/",
+    "/dashboard/store/order/",
+    "/dashboard/store/cartitem/",
+])
+def test_changelist_query_count_is_constant(admin_client, path, cart_item, django_assert_max_num_queries):
+    Order.objects.create(user=cart_item.cart.user, total_amount=100)
+    with django_assert_max_num_queries(12):
+        response = admin_client.get(path)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_changelist_prefix_search(admin_client, product):
+    response = admin_client.get("/dashboard/store/product/", {"q": "Test"})
+    assert response.status_code == 200
+    assert list(response.context["cl"].result_list) == [product]
+
+    response = admin_client.get("/dashboard/store/product/", {"q": "test prod"})
+    assert list(response.context["cl"].result_list) == [product]
+
+    response = admin_client.get("/dashboard/store/product/", {"q": "Product"})
+    assert list(response.context["cl"].result_list) == []
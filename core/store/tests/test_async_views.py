@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient, Client
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.store.models import CartItem, Wishlist
+
+
+@pytest.fixture(autouse=True)
+def asgi_urls(settings):
+    settings.ROOT_URLCONF = 'azubisc.asgi_urls'
+
+
+@pytest.fixture
+def client():
+    return AsyncClient()
+
+
+def auth(user):
+    # AsyncClient takes raw header names, without the HTTP_ prefix.
+    return {'AUTHORIZATION': f'Bearer {AccessToken.for_user(user)}'}
+
+
+@pytest.mark.django_db
+def test_async_product_list(client, product, user):
+    Wishlist.objects.create(user=user, product=product)
+
+    response = async_to_sync(client.get)("http://localhost:9090/api/v1/store/products/", **auth(user))
+    assert response.status_code == 200
+    data = response.json()
+    assert data['productCount'] == 1
+    assert data['Products'][0]['name'] == product.name
+    assert data['Products'][0]['is_wishlisted'] is True
+
+    response = async_to_sync(client.get)("http://localhost:9090/api/v1/store/products/?page=3")
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_async_product_detail_and_categories(client, product):
+    response = async_to_sync(client.get)(f"http://localhost:9090/api/v1/store/products/{product.id}/")
+    assert response.status_code == 200
+    assert response.json()['is_wishlisted'] is False
+
+    response = async_to_sync(client.get)("http://localhost:9090/api/v1/store/products/0/")
+    assert response.status_code == 404
+
+    response = async_to_sync(client.get)("http://localhost:9090/api/v1/store/categories/")
+    assert response.json()['categoryCount'] == 1
+
+
+@pytest.mark.django_db
+def test_async_cart(client, user, product):
+    response = async_to_sync(client.get)("http://localhost:9090/api/v1/store/cart/")
+    assert response.status_code == 401
+
+    response = async_to_sync(client.get)("http://localhost:9090/api/v1/store/cart/", **auth(user))
+    assert response.json() == {'response': 'Shopping cart is empty'}
+
+    body = json.dumps({'products': [{'product': product.id, 'quantity': 2}]})
+    for _ in range(2):
+        response = async_to_sync(client.post)(
+            "http://localhost:9090/api/v1/store/cart/", body, content_type='application/json', **auth(user)
+        )
+        assert response.status_code == 201
+    assert response.json()['cart_items'][0]['quantity'] == 4
+    assert CartItem.objects.get(cart__user=user).quantity == 4
+
+    response = async_to_sync(client.get)("http://localhost:9090/api/v1/store/cart/", **auth(user))
+    assert response.json()['items'][0]['product']['name'] == product.name
+
+
+@pytest.mark.django_db
+def test_methods_without_async_handler_use_sync_view(client, user, product):
+    response = async_to_sync(client.delete)(
+        f"http://localhost:9090/api/v1/store/products/{product.id}/", **auth(user)
+    )
+    assert response.status_code == 403
+    assert response.json() == {'error': 'Only admins can delete products.'}
+
+
+@pytest.mark.django_db
+def test_async_cart_post_with_bearer_token_skips_csrf_middleware(user, cart, product):
+    client = Client(enforce_csrf_checks=True)
+    response = client.post(
+        "http://localhost:9090/api/v1/store/cart/",
+        json.dumps({'products': [{'product': product.id, 'quantity': 1}]}),
+        content_type='application/json',
+        HTTP_AUTHORIZATION=f'Bearer {AccessToken.for_user(user)}',
+    )
+    assert response.status_code == 201
+    assert CartItem.objects.get(cart__user=user).quantity == 1
@@ -0,0 +1,171 @@
+from decimal import Decimal
+
+import pytest
+
+from core.store import tasks
+from core.store.models import Category, Product, ProductImage, Wishlist
+
+
+def product_rows(category, count):
+    return [
+        {
+            "name": f"Bulk Product {index}",
+            "description": "Bulk description",
+            "price": "10.00",
+            "stock": index,
+            "category_id": category.id,
+            "image_urls": [f"https://cdn.example.com/{index}-a.jpg", f"https://cdn.example.com/{index}-b.jpg"],
+        }
+        for index in range(count)
+    ]
+
+
+@pytest.mark.django_db
+def test_bulk_create_products_in_fixed_queries(api_client, admin_user, category, django_assert_max_num_queries):
+    api_client.force_authenticate(user=admin_user)
+    with django_assert_max_num_queries(12):
+        response = api_client.post(
+            "http://localhost:9090/api/v1/store/products/bulk/",
+            {"products": product_rows(category, 100)},
+            format="json"
+        )
+
+    assert response.status_code == 201
+    assert response.data["productCount"] == 100
+    assert Product.objects.count() == 100
+    assert ProductImage.objects.count() == 200
+
+
+@pytest.mark.django_db
+def test_bulk_create_rolls_back_on_duplicate_name(api_client, admin_user, category, product):
+    rows = product_rows(category, 3)
+    rows[2]["name"] = product.name
+    api_client.force_authenticate(user=admin_user)
+    response = api_client.post(
+        "http://localhost:9090/api/v1/store/products/bulk/", {"products": rows}, format="json"
+    )
+
+    assert response.status_code == 400
+    assert Product.objects.count() == 1
+    assert not ProductImage.objects.exists()
+
+
+@pytest.mark.django_db
+def test_create_product_with_duplicate_name(api_client, admin_user, category, product):
+    api_client.force_authenticate(user=admin_user)
+    data = {
+        "name": product.name,
+        "description": "Duplicate",
+        "price": "5.00",
+        "stock": 1,
+        "category_id": category.id,
+        "image_urls": ["https://cdn.example.com/dup.jpg"],
+    }
+    response = api_client.post("http://localhost:9090/api/v1/store/products/", data, format="json")
+
+    assert response.status_code == 400
+    assert response.data["error"].startswith("A product with same details exists")
+    assert not ProductImage.objects.exists()
+
+
+@pytest.mark.django_db
+def test_bulk_update_prices_and_stock(api_client, admin_user, category, django_assert_max_num_queries):
+    products = Product.objects.bulk_create([
+        Product(name=f"Update {index}", description="d", price=10, stock=0, category=category) for index in range(20)
+    ])
+    before = products[0].updated_at
+    api_client.force_authenticate(user=admin_user)
+    with django_assert_max_num_queries(12):
+        response = api_client.patch(
+            "http://localhost:9090/api/v1/store/products/bulk/",
+            {
+                "prices": {str(product.id): "12.50" for product in products},
+                "stock": {str(products[0].id): 7, "999999": 1},
+            },
+            format="json"
+        )
+
+    assert response.status_code == 200
+    assert response.data == {"updatedByRules": 0, "updatedById": 20, "missing": [999999]}
+    assert set(Product.objects.values_list("price", flat=True)) == {Decimal("12.50")}
+    products[0].refresh_from_db()
+    assert products[0].stock == 7
+    assert products[0].updated_at > before
+
+
+@pytest.mark.django_db
+def test_bulk_update_price_rule_and_explicit_override(api_client, admin_user, category):
+    other = Category.objects.create(name="Other")
+    ruled = Product.objects.create(name="Ruled", description="d", price=100, stock=1, category=category)
+    overridden = Product.objects.create(name="Overridden", description="d", price=100, stock=1, category=category)
+    untouched = Product.objects.create(name="Untouched", description="d", price=100, stock=1, category=other)
+    api_client.force_authenticate(user=admin_user)
+    response = api_client.patch(
+        "http://localhost:9090/api/v1/store/products/bulk/",
+        {
+            "rules": [{"category_id": category.id, "price_percent": "-12.5"}],
+            "prices": {str(overridden.id): "50.00"},
+        },
+        format="json"
+    )
+
+    assert response.status_code == 200
+    assert response.data["updatedByRules"] == 2
+    prices = dict(Product.objects.values_list("id", "price"))
+    assert prices[ruled.id] == Decimal("87.50")
+    assert prices[overridden.id] == Decimal("50.00")
+    assert prices[untouched.id] == Decimal("100.00")
+
+
+@pytest.mark.django_db
+def test_bulk_update_notifies_wishlisters(
+    api_client, admin_user, user, product, monkeypatch, django_capture_on_commit_callbacks
+):
+    Wishlist.objects.create(user=user, product=product)
+    queued = []
+    monkeypatch.setattr(tasks.notify_wishlisters, "delay", lambda *args: queued.append(args))
+    api_client.force_authenticate(user=admin_user)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.patch(
+            "http://localhost:9090/api/v1/store/products/bulk/",
+            {
+                "rules": [{"category_id": product.category_id, "price_percent": "-10"}],
+                "prices": {str(product.id): "1.00"},
+            },
+            format="json"
+        )
+
+    assert response.status_code == 200
+    # The rule and the explicit price both lower it, but the drop is queued once.
+    assert queued == [(product.id, tasks.PRICE_DROP)]
+
+
+@pytest.mark.django_db
+def test_bulk_update_price_rule_is_capped(api_client, admin_user, category):
+    expensive = Product.objects.create(
+        name="Expensive", description="d", price="50000000.00", stock=1, category=category
+    )
+    api_client.force_authenticate(user=admin_user)
+    response = api_client.patch(
+        "http://localhost:9090/api/v1/store/products/bulk/",
+        {"rules": [{"category_id": category.id, "price_percent": 1000}]},
+        format="json"
+    )
+
+    assert response.status_code == 200
+    expensive.refresh_from_db()
+    assert expensive.price == Decimal("99999999.99")
+
+
+@pytest.mark.django_db
+def test_bulk_update_validation(api_client, admin_user, user, product):
+    api_client.force_authenticate(user=user)
+    url = "http://localhost:9090/api/v1/store/products/bulk/"
+    assert api_client.patch(url, {"stock": {str(product.id): 1}}, format="json").status_code == 403
+
+    api_client.force_authenticate(user=admin_user)
+    assert api_client.patch(url, {}, format="json").status_code == 400
+    assert api_client.patch(url, {"stock": {"abc": 1}}, format="json").status_code == 400
+    assert api_client.patch(url, {"stock": {str(product.id): 3000000000}}, format="json").status_code == 400
+    rules = [{"category_id": 999, "price_percent": 5}]
+    assert api_client.patch(url, {"rules": rules}, format="json").status_code == 400
@@ -0,0 +1,51 @@
+import pytest
+
+from core.store.models import Cart, CartItem, Product
+
+
+@pytest.fixture
+def products(category):
+    return Product.objects.bulk_create([
+        Product(name=f"Product {index}", price=10, category=category, stock=5) for index in range(8)
+    ])
+
+
+@pytest.mark.django_db
+def test_cart_queries_do_not_grow_with_items(api_client, user, products):
+    api_client.force_authenticate(user=user)
+    cart = Cart.objects.create(user=user)
+    CartItem.objects.bulk_create([CartItem(cart=cart, product=product) for product in products[:4]])
+
+    # Half of the products are already in the cart, half are new.
+    response = api_client.post(
+        "http://localhost:9090/api/v1/store/cart/",
+        {'products': [{'product': product.id, 'quantity': 2} for product in products]},
+        format="json"
+    )
+    assert response.status_code == 201
+    assert [item['quantity'] for item in response.data['cart_items']] == [3] * 4 + [2] * 4
+
+    response = api_client.get("http://localhost:9090/api/v1/store/cart/")
+    assert response.status_code == 200
+    assert len(response.data['items']) == 8
+
+
+@pytest.mark.django_db
+def test_cart_rejects_unknown_products(api_client, user, products):
+    api_client.force_authenticate(user=user)
+    response = api_client.post(
+        "http://localhost:9090/api/v1/store/cart/",
+        {'products': [{'product': products[0].id}, {'product': 0}]},
+        format="json"
+    )
+    assert response.status_code == 400
+    assert not CartItem.objects.exists()
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('entry', [{'product': 1, 'quantity': 'two'}, {'product': 1, 'quantity': None}, 7, 'x'])
+def test_cart_rejects_malformed_entries(api_client, user, products, entry):
+    api_client.force_authenticate(user=user)
+    response = api_client.post("http://localhost:9090/api/v1/store/cart/", {'products': [entry]}, format="json")
+    assert response.status_code == 400
+    assert not CartItem.objects.exists()
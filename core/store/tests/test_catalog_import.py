@@ -0,0 +1,102 @@
+import json
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.test import Client
+
+from core.store import tasks
+from core.store.models import CatalogImport, Product, ProductImage
+
+CSV_FEED = (
+    "name,description,price,category_id,stock,image_urls\n"
+    "Test Product,Updated description,80.00,1,10,https://cdn.example.com/a.jpg|https://cdn.example.com/b.jpg\n"
+    "New Product,Fresh,12.5,1,4,\n"
+    "Broken Price,Bad,abc,1,4,\n"
+    "Unknown Category,Bad,1.00,99,4,\n"
+    ",No name,1.00,1,4,\n"
+)
+
+
+@pytest.fixture(autouse=True)
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path / 'media')
+
+
+@pytest.mark.django_db
+def test_import_catalog_command_upserts_by_name(product, tmp_path, capsys):
+    ProductImage.objects.create(product=product, image='https://cdn.example.com/old.jpg')
+    path = tmp_path / 'feed.csv'
+    path.write_text(CSV_FEED)
+
+    call_command('import_catalog', str(path), '--chunk-size', '2')
+
+    out = capsys.readouterr()
+    assert '1 inserted, 1 updated, 3 rejected' in out.out
+    assert 'row 3: invalid price' in out.err
+    product.refresh_from_db()
+    assert product.description == 'Updated description'
+    assert product.stock == 10
+    assert sorted(product.images.values_list('image', flat=True)) == [
+        'https://cdn.example.com/a.jpg', 'https://cdn.example.com/b.jpg'
+    ]
+    new_product = Product.objects.get(name='New Product')
+    assert str(new_product.price) == '12.50'
+    assert not new_product.images.exists()
+
+
+@pytest.mark.django_db
+def test_import_catalog_jsonl_keeps_last_duplicate(category, tmp_path, capsys):
+    path = tmp_path / 'feed.jsonl'
+    path.write_text('\n'.join([
+        json.dumps({'name': 'Lamp', 'price': '5.00', 'category_id': 1, 'stock': 1, 'image_urls': ['https://x/1.jpg']}),
+        json.dumps({'name': 'Lamp', 'price': '6.00', 'category_id': 1, 'stock': 2}),
+        '{not json',
+        json.dumps({'name': 123, 'price': '1.00', 'category_id': 1, 'stock': 1}),
+        json.dumps({'name': 'Desk', 'description': ['oak'], 'price': '1.00', 'category_id': 1, 'stock': 1}),
+        json.dumps({'name': 'Shelf', 'price': '1.00', 'category_id': 1, 'stock': 10 ** 20}),
+    ]))
+
+    call_command('import_catalog', str(path))
+
+    lamp = Product.objects.get(name='Lamp')
+    assert (str(lamp.price), lamp.stock) == ('6.00', 2)
+    assert Product.objects.count() == 1
+    out = capsys.readouterr()
+    assert '1 inserted, 0 updated, 4 rejected' in out.out
+    assert 'row 4: name is required' in out.err
+    assert 'row 5: description must be a string' in out.err
+    assert f'row 6: stock {10 ** 20} out of range' in out.err
+
+
+@pytest.mark.django_db
+def test_run_catalog_import_task_records_counts(product):
+    catalog_import = CatalogImport.objects.create(file=ContentFile(CSV_FEED.encode(), name='feed.csv'))
+
+    assert tasks.run_catalog_import(catalog_import.pk) == {'inserted': 1, 'updated': 1, 'rejected': 3}
+
+    catalog_import.refresh_from_db()
+    assert catalog_import.status == 'done'
+    assert (catalog_import.inserted, catalog_import.updated, catalog_import.rejected) == (1, 1, 3)
+    assert catalog_import.errors.count('\n') == 2
+    assert catalog_import.finished_at is not None
+
+
+@pytest.mark.django_db
+def test_admin_upload_queues_import(admin_user, monkeypatch, django_capture_on_commit_callbacks):
+    queued = []
+    monkeypatch.setattr(tasks.run_catalog_import, 'delay', queued.append)
+    client = Client()
+    client.force_login(admin_user)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(
+            '/dashboard/store/catalogimport/add/',
+            {'file': SimpleUploadedFile('feed.csv', CSV_FEED.encode(), content_type='text/csv')}
+        )
+
+    assert response.status_code == 302
+    catalog_import = CatalogImport.objects.get()
+    assert catalog_import.created_by == admin_user
+    assert queued == [catalog_import.pk]
@@ -0,0 +1,123 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+from django.core.handlers.asgi import ASGIHandler
+
+from core.store.models import Product, ProductImage
+
+FEED_URL = "http://localhost:9090/api/v1/store/products/feed/"
+
+
+@pytest.fixture(autouse=True)
+def no_settle_time(settings):
+    settings.PRODUCT_FEED_SETTLE_TIME = 0
+
+
+def read_feed(api_client, **params):
+    response = api_client.get(FEED_URL, params)
+    assert response.status_code == 200
+    assert response['Content-Type'] == 'application/x-ndjson'
+    lines = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+    return lines[:-1], lines[-1]
+
+
+@pytest.fixture
+def products(category):
+    products = [
+        Product.objects.create(name=f"Feed Product {index}", description="d", price=10, category=category, stock=1)
+        for index in range(3)
+    ]
+    ProductImage.objects.create(product=products[0], image="https://cdn.example.com/0.jpg")
+    return products
+
+
+@pytest.mark.django_db
+def test_feed_streams_catalog_and_resumes(api_client, products):
+    entries, end = read_feed(api_client)
+
+    assert [entry['id'] for entry in entries] == [product.id for product in products]
+    assert entries[0]['images'] == ["https://cdn.example.com/0.jpg"]
+    assert entries[0]['price'] == '10.00'
+    assert end['type'] == 'end' and end['count'] == 3
+
+    entries, next_end = read_feed(api_client, since=end['next'])
+    assert entries == []
+    assert next_end['next'] == end['next']
+
+
+@pytest.mark.django_db
+def test_feed_reports_updates_and_deletions(api_client, products):
+    _, end = read_feed(api_client)
+
+    products[0].stock = 5
+    products[0].save()
+    deleted_id = products[1].id
+    products[1].delete()
+
+    entries, _ = read_feed(api_client, since=end['next'])
+    assert [(entry['type'], entry['id']) for entry in entries] == [
+        ('product', products[0].id), ('deleted', deleted_id)
+    ]
+    assert entries[0]['stock'] == 5
+
+
+@pytest.mark.django_db
+def test_feed_limit_returns_resume_token(api_client, products):
+    entries, end = read_feed(api_client, limit=2)
+    assert [entry['id'] for entry in entries] == [products[0].id, products[1].id]
+
+    entries, end = read_feed(api_client, since=end['next'], limit=2)
+    assert [entry['id'] for entry in entries] == [products[2].id]
+    assert end['count'] == 1
+
+
+@pytest.mark.django_db
+def test_feed_accepts_datetime_and_rejects_bad_cursor(api_client, products):
+    entries, _ = read_feed(api_client, since=products[1].updated_at.isoformat())
+    assert [entry['id'] for entry in entries] == [products[1].id, products[2].id]
+
+    response = api_client.get(FEED_URL, {'since': 'not-a-cursor'})
+    assert response.status_code == 400
+
+
+def asgi_get(path, query_string=b''):
+    """
+    Send a GET through Django's ASGIHandler, the way uvicorn serves azubisc.asgi.
+    """
+    async def request():
+        scope = {
+            'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': 'GET',
+            'scheme': 'http', 'path': path, 'query_string': query_string,
+            'headers': [(b'host', b'testserver')], 'server': ('testserver', 80),
+        }
+        communicator = ApplicationCommunicator(ASGIHandler(), scope)
+        await communicator.send_input({'type': 'http.request', 'body': b''})
+        start = await communicator.receive_output(5)
+        body = b''
+        while True:
+            message = await communicator.receive_output(5)
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                return start['status'], body
+
+    return async_to_sync(request)()
+
+
+# ASGIHandler runs each request's sync code in its own thread, with its own connection.
+@pytest.mark.django_db(transaction=True)
+def test_feed_under_asgi_returns_pages(settings, products):
+    settings.ROOT_URLCONF = 'azubisc.asgi_urls'
+    settings.PRODUCT_FEED_ASYNC_LIMIT = 2
+
+    status, body = asgi_get('/api/v1/store/products/feed/')
+    assert status == 200
+    lines = [json.loads(line) for line in body.splitlines()]
+    assert [entry['id'] for entry in lines[:-1]] == [products[0].id, products[1].id]
+
+    status, body = asgi_get('/api/v1/store/products/feed/', f'since={lines[-1]["next"]}'.encode())
+    lines = [json.loads(line) for line in body.splitlines()]
+    assert [entry['id'] for entry in lines[:-1]] == [products[2].id]
+
+    assert asgi_get('/api/v1/store/products/feed/', b'limit=0')[0] == 400
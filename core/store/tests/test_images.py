@@ -0,0 +1,53 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from core.store import tasks
+from core.store.models import ProductImageDerivative, ProductImageUpload
+
+
+def make_jpeg(name='photo.jpg', size=(2000, 1000)):
+    exif = Image.Exif()
+    exif[0x010F] = 'Supplier Camera'
+    buffer = BytesIO()
+    Image.new('RGB', size, color='red').save(buffer, format='JPEG', exif=exif)
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/jpeg')
+
+
+@pytest.fixture(autouse=True)
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+
+
+@pytest.mark.django_db
+def test_upload_queues_derivatives(api_client, user, monkeypatch, django_capture_on_commit_callbacks):
+    queued = []
+    monkeypatch.setattr(tasks.generate_image_derivatives, 'delay', queued.append)
+    api_client.force_authenticate(user=user)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.post(
+            "http://localhost:9090/api/v1/store/product_images/", {"images": [make_jpeg()]}, format="multipart"
+        )
+
+    assert response.status_code == 201
+    assert response.data[0]["srcset"] == {}
+    assert queued == [response.data[0]["id"]]
+
+
+@pytest.mark.django_db
+def test_generate_image_derivatives():
+    upload = ProductImageUpload.objects.create(image=make_jpeg())
+
+    assert tasks.generate_image_derivatives(upload.pk) == 6
+
+    derivatives = ProductImageDerivative.objects.filter(upload=upload)
+    thumb = derivatives.get(size='thumb', format='webp')
+    assert (thumb.width, thumb.height) == (200, 100)
+    assert derivatives.get(size='zoom', format='jpeg').width == 1600
+
+    with Image.open(derivatives.get(size='card', format='jpeg').image) as card:
+        assert card.format == 'JPEG'
+        assert not card.getexif()
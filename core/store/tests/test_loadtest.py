@@ -0,0 +1,31 @@
+import json
+
+import pytest
+from django.core.management import call_command
+
+from core.store.models import Cart, Product, ProductImage
+
+
+@pytest.mark.slow
+@pytest.mark.django_db(transaction=True)
+def test_loadtest_store(live_server, tmp_path, capsys):
+    output = tmp_path / 'results.json'
+    call_command(
+        'loadtest_store', '--seed', '--categories', '3', '--products', '30', '--images', '1',
+        '--users', '2', '--cart-items', '2', '--duration', '1', '--concurrency', '2',
+        '--base-url', live_server.url, '--output', str(output)
+    )
+    assert Product.objects.count() == 30
+    assert ProductImage.objects.count() == 30
+    assert Cart.objects.count() == 2
+
+    results = json.loads(output.read_text())
+    assert results['total']['requests'] > 0
+    assert results['total']['errors'] == 0
+    assert {'p50', 'p95', 'p99', 'throughput'} <= set(results['endpoints']['product-list'])
+
+    call_command(
+        'loadtest_store', '--duration', '0.5', '--concurrency', '1',
+        '--base-url', live_server.url, '--compare', str(output)
+    )
+    assert 'Compared with' in capsys.readouterr().out
@@ -0,0 +1,63 @@
+import pytest
+from django.core import mail
+from djcelery_email.tasks import send_emails
+
+from core.store import tasks
+from core.store.models import Product, Wishlist
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    calls = []
+    monkeypatch.setattr(tasks.notify_wishlisters, 'delay', lambda *args: calls.append(args))
+    return calls
+
+
+@pytest.mark.django_db
+def test_restock_queues_notification(product, queued, django_capture_on_commit_callbacks):
+    Product.objects.filter(pk=product.pk).update(stock=0)
+    product = Product.objects.get(pk=product.pk)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.stock = 4
+        product.save()
+
+    assert queued == [(product.pk, tasks.BACK_IN_STOCK)]
+
+
+@pytest.mark.django_db
+def test_repeated_price_drops_are_throttled(product, queued, django_capture_on_commit_callbacks):
+    product = Product.objects.get(pk=product.pk)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        product.price = 90
+        product.save()
+        product.price = 80
+        product.save()
+        product.name = 'Renamed'
+        product.save()
+
+    assert queued == [(product.pk, tasks.PRICE_DROP)]
+
+
+@pytest.mark.django_db
+def test_notify_wishlisters_sends_in_batches(settings, product, user, admin_user):
+    settings.WISHLIST_NOTIFICATION_EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+    settings.WISHLIST_NOTIFICATION_CHUNK_SIZE = 1
+    Wishlist.objects.create(user=user, product=product)
+    Wishlist.objects.create(user=admin_user, product=product)
+
+    assert tasks.notify_wishlisters(product.pk, tasks.PRICE_DROP) == 2
+    assert sorted(message.to[0] for message in mail.outbox) == sorted([user.email, admin_user.email])
+
+
+@pytest.mark.django_db
+def test_notify_wishlisters_with_default_backend(settings, monkeypatch, product, user):
+    # The project backend queues each batch as a Celery task; run it inline into the outbox.
+    monkeypatch.setattr(send_emails, 'delay', lambda *args: send_emails(*args))
+    settings.CELERY_EMAIL_BACKEND = 'django.core.mail.backends.locmem.EmailBackend'
+    assert settings.WISHLIST_NOTIFICATION_EMAIL_BACKEND == 'djcelery_email.backends.CeleryEmailBackend'
+    Wishlist.objects.create(user=user, product=product)
+
+    assert tasks.notify_wishlisters(product.pk, tasks.PRICE_DROP) == 1
+    assert [message.to for message in mail.outbox] == [[user.email]]
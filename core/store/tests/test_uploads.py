@@ -0,0 +1,135 @@
+import os
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from core.store import tasks
+from core.store.models import ChunkedUpload, ProductImageUpload
+from .test_images import make_jpeg
+
+
+@pytest.fixture(autouse=True)
+def queued(settings, tmp_path, monkeypatch):
+    settings.MEDIA_ROOT = str(tmp_path / 'media')
+    settings.CHUNKED_UPLOAD_DIR = str(tmp_path / 'chunked')
+    calls = []
+    monkeypatch.setattr(tasks.generate_image_derivatives, 'delay', calls.append)
+    return calls
+
+
+@pytest.mark.django_db
+def test_oversized_upload_is_rejected(api_client, user, settings):
+    settings.PRODUCT_IMAGE_UPLOAD_MAX_FILE_SIZE = 1024
+    api_client.force_authenticate(user=user)
+    response = api_client.post(
+        "http://localhost:9090/api/v1/store/product_images/", {"images": [make_jpeg()]}, format="multipart"
+    )
+    assert response.status_code == 413
+    assert not ProductImageUpload.objects.exists()
+
+
+@pytest.mark.django_db
+def test_resumable_chunked_upload(api_client, user, django_capture_on_commit_callbacks):
+    content = make_jpeg().read()
+    api_client.force_authenticate(user=user)
+    response = api_client.post(
+        "http://localhost:9090/api/v1/store/product_images/chunked/",
+        {"filename": "large.jpg", "size": len(content)},
+        format="json"
+    )
+    assert response.status_code == 201
+    url = f"http://localhost:9090/api/v1/store/product_images/chunked/{response.data['id']}/"
+
+    middle = len(content) // 2
+    response = api_client.patch(
+        url, content[:middle], content_type="application/offset+octet-stream", HTTP_UPLOAD_OFFSET="0"
+    )
+    assert response.status_code == 200
+    assert response.data["offset"] == middle
+
+    # Resending from a stale offset is refused and reports where to resume.
+    response = api_client.patch(
+        url, content[middle:], content_type="application/offset+octet-stream", HTTP_UPLOAD_OFFSET="0"
+    )
+    assert response.status_code == 409
+    assert response.data["offset"] == middle
+
+    with django_capture_on_commit_callbacks(execute=True):
+        response = api_client.patch(
+            url, content[middle:], content_type="application/offset+octet-stream", HTTP_UPLOAD_OFFSET=str(middle)
+        )
+    assert response.status_code == 200
+    chunked_upload = ChunkedUpload.objects.get()
+    assert response.data["upload"]["id"] == chunked_upload.upload_id
+    assert ProductImageUpload.objects.get().image.size == len(content)
+    assert not os.path.exists(chunked_upload.partial_path)
+
+    # A retried final request does not complete the upload a second time.
+    response = api_client.patch(
+        url, b"", content_type="application/offset+octet-stream", HTTP_UPLOAD_OFFSET=str(len(content))
+    )
+    assert response.status_code == 409
+    assert ProductImageUpload.objects.get().ref_count == 1
+
+
+@pytest.mark.django_db
+def test_duplicate_uploads_share_storage(
+    api_client, user, admin_user, queued, django_capture_on_commit_callbacks
+):
+    api_client.force_authenticate(user=user)
+    with django_capture_on_commit_callbacks(execute=True):
+        first = api_client.post(
+            "http://localhost:9090/api/v1/store/product_images/", {"images": [make_jpeg('a.jpg')]}, format="multipart"
+        )
+        second = api_client.post(
+            "http://localhost:9090/api/v1/store/product_images/", {"images": [make_jpeg('b.jpg')]}, format="multipart"
+        )
+
+    assert first.data[0]["id"] == second.data[0]["id"]
+    upload = ProductImageUpload.objects.get()
+    assert upload.ref_count == 2
+    assert upload.image.name == f"products/images/{upload.sha256[:2]}/{upload.sha256}.jpg"
+    assert queued == [upload.pk]
+
+    # The shared file survives until the last reference is released.
+    api_client.force_authenticate(user=admin_user)
+    url = f"http://localhost:9090/api/v1/store/product_images/{upload.pk}/"
+    with django_capture_on_commit_callbacks(execute=True):
+        assert api_client.delete(url).status_code == 204
+    assert os.path.exists(upload.image.path)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        assert api_client.delete(url).status_code == 204
+    assert not ProductImageUpload.objects.exists()
+    assert not os.path.exists(upload.image.path)
+
+
+@pytest.mark.django_db
+def test_chunked_upload_of_invalid_image_is_discarded(api_client, user):
+    api_client.force_authenticate(user=user)
+    response = api_client.post(
+        "http://localhost:9090/api/v1/store/product_images/chunked/", {"filename": "a.jpg", "size": 4}, format="json"
+    )
+    url = f"http://localhost:9090/api/v1/store/product_images/chunked/{response.data['id']}/"
+    response = api_client.patch(url, b"1234", content_type="application/offset+octet-stream", HTTP_UPLOAD_OFFSET="0")
+    assert response.status_code == 400
+    assert not ChunkedUpload.objects.exists()
+
+
+@pytest.mark.django_db
+def test_purge_abandoned_chunked_uploads(user, settings):
+    stale = ChunkedUpload.objects.create(user=user, filename="stale.jpg", size=10, offset=4)
+    fresh = ChunkedUpload.objects.create(user=user, filename="fresh.jpg", size=10, offset=4)
+    os.makedirs(settings.CHUNKED_UPLOAD_DIR)
+    for chunked_upload in (stale, fresh):
+        with open(chunked_upload.partial_path, "wb") as partial_file:
+            partial_file.write(b"1234")
+    ChunkedUpload.objects.filter(pk=stale.pk).update(updated_at=timezone.now() - timedelta(days=2))
+
+    call_command("purge_chunked_uploads")
+
+    assert list(ChunkedUpload.objects.all()) == [fresh]
+    assert not os.path.exists(stale.partial_path)
+    assert os.path.exists(fresh.partial_path)
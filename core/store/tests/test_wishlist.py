@@ -0,0 +1,60 @@
+import pytest
+
+from core.store.models import Product, Wishlist
+
+
+@pytest.mark.django_db
+def test_bulk_add_to_wishlist(api_client, user, product, category):
+    other = Product.objects.create(
+        name="Other Product", description="Other", price=20.00, category=category, stock=5
+    )
+    api_client.force_authenticate(user=user)
+    response = api_client.post(
+        "http://localhost:9090/api/v1/store/wishlist/",
+        {"products": [product.id, other.id, product.id]},
+        format="json"
+    )
+    assert response.status_code == 201
+    assert Wishlist.objects.filter(user=user).count() == 2
+
+    # Adding again is idempotent thanks to the unique constraint.
+    response = api_client.post(
+        "http://localhost:9090/api/v1/store/wishlist/", {"products": [product.id]}, format="json"
+    )
+    assert response.status_code == 201
+    assert Wishlist.objects.filter(user=user).count() == 2
+
+
+@pytest.mark.django_db
+def test_add_unknown_product_to_wishlist(api_client, user):
+    api_client.force_authenticate(user=user)
+    response = api_client.post(
+        "http://localhost:9090/api/v1/store/wishlist/", {"products": [999]}, format="json"
+    )
+    assert response.status_code == 400
+    assert response.data["products"] == [999]
+
+
+@pytest.mark.django_db
+def test_bulk_remove_from_wishlist(api_client, user, product):
+    Wishlist.objects.create(user=user, product=product)
+    api_client.force_authenticate(user=user)
+    response = api_client.delete(
+        "http://localhost:9090/api/v1/store/wishlist/", {"products": [product.id]}, format="json"
+    )
+    assert response.status_code == 200
+    assert response.data["removed"] == 1
+    assert not Wishlist.objects.filter(user=user).exists()
+
+
+@pytest.mark.django_db
+def test_product_list_is_wishlisted_flag(api_client, user, product):
+    Wishlist.objects.create(user=user, product=product)
+    api_client.force_authenticate(user=user)
+    response = api_client.get("http://localhost:9090/api/v1/store/products/")
+    assert response.status_code == 200
+    assert response.data["Products"][0]["is_wishlisted"] is True
+
+    api_client.force_authenticate(user=None)
+    response = api_client.get("http://localhost:9090/api/v1/store/products/")
+    assert response.data["Products"][0]["is_wishlisted"] is False
@@ -0,0 +1,169 @@
+import hashlib
+import os
+from functools import partial
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.uploadhandler import TemporaryFileUploadHandler
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+from PIL import Image
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from .models import ChunkedUpload, ProductImageUpload
+from .tasks import generate_image_derivatives
+
+READ_SIZE = 64 * 1024
+
+
+class UploadTooLarge(APIException):
+    status_code = status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    default_detail = 'Upload is too large.'
+    default_code = 'upload_too_large'
+
+
+class BoundedTemporaryFileUploadHandler(TemporaryFileUploadHandler):
+    """
+    Streams each uploaded file to a temporary file on disk and aborts as soon as
+    the per-file or per-request byte limits are exceeded, instead of after the
+    whole body has been read. The SHA-256 digest is computed along the way.
+    """
+
+    def __init__(self, request=None, max_file_size=None, max_request_size=None):
+        super().__init__(request)
+        self.max_file_size = max_file_size or settings.PRODUCT_IMAGE_UPLOAD_MAX_FILE_SIZE
+        self.max_request_size = max_request_size or settings.PRODUCT_IMAGE_UPLOAD_MAX_REQUEST_SIZE
+        self.request_size = 0
+
+    def handle_raw_input(self, input_data, META, content_length, boundary, encoding=None):
+        if content_length > self.max_request_size:
+            raise UploadTooLarge(f'Uploads are limited to {self.max_request_size} bytes per request.')
+
+    def new_file(self, *args, **kwargs):
+        super().new_file(*args, **kwargs)
+        self.file_size = 0
+        self.hasher = hashlib.sha256()
+
+    def receive_data_chunk(self, raw_data, start):
+        self.file_size += len(raw_data)
+        self.request_size += len(raw_data)
+        if self.file_size > self.max_file_size:
+            raise UploadTooLarge(f'Each file is limited to {self.max_file_size} bytes.')
+        if self.request_size > self.max_request_size:
+            raise UploadTooLarge(f'Uploads are limited to {self.max_request_size} bytes per request.')
+        self.hasher.update(raw_data)
+        return super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size):
+        file = super().file_complete(file_size)
+        file.sha256 = self.hasher.hexdigest()
+        return file
+
+
+def hash_file(file):
+    hasher = hashlib.sha256()
+    for chunk in file.chunks(READ_SIZE):
+        hasher.update(chunk)
+    file.seek(0)
+    return hasher.hexdigest()
+
+
+def _reference_existing(digest):
+    if ProductImageUpload.objects.filter(sha256=digest).update(ref_count=F('ref_count') + 1):
+        return ProductImageUpload.objects.get(sha256=digest)
+    return None
+
+
+def save_product_image(file):
+    """
+    Store an uploaded image, or reuse the stored file with the same content.
+    Derivatives are only queued for files that were not stored before.
+    """
+    digest = getattr(file, 'sha256', None) or hash_file(file)
+    existing = _reference_existing(digest)
+    if existing:
+        return existing
+
+    product_image = ProductImageUpload(sha256=digest)
+    product_image.image.save(os.path.basename(file.name), file, save=False)
+    try:
+        with transaction.atomic():
+            product_image.save()
+    except IntegrityError:
+        # A concurrent upload of the same content was stored first.
+        product_image.image.delete(save=False)
+        return _reference_existing(digest)
+
+    # Derivatives are built by a Celery worker so the upload returns right away.
+    transaction.on_commit(partial(generate_image_derivatives.delay, product_image.pk))
+    return product_image
+
+
+def append_chunk(chunked_upload, stream, length):
+    """
+    Append up to `length` bytes from `stream` to the partial file, reading in
+    small pieces so memory use does not depend on the chunk size.
+    """
+    os.makedirs(settings.CHUNKED_UPLOAD_DIR, exist_ok=True)
+
+    received = 0
+    with open(chunked_upload.partial_path, 'ab') as partial_file:
+        # Drop bytes from an interrupted request that were never acknowledged.
+        partial_file.truncate(chunked_upload.offset)
+        while received < length:
+            data = stream.read(min(READ_SIZE, length - received))
+            if not data:
+                break
+            partial_file.write(data)
+            received += len(data)
+
+    chunked_upload.offset += received
+    chunked_upload.save(update_fields=['offset', 'updated_at'])
+    return received
+
+
+def _remove_partial_file(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def complete_chunked_upload(chunked_upload):
+    """
+    Turn a fully received partial file into a ProductImageUpload. Call it with
+    the ChunkedUpload row locked, so a retried final chunk cannot complete the
+    upload twice. Returns None, after discarding the upload, if the file is
+    not a valid image. The partial file is removed once the transaction commits.
+    """
+    path = chunked_upload.partial_path
+    transaction.on_commit(partial(_remove_partial_file, path))
+    with open(path, 'rb') as partial_file:
+        try:
+            Image.open(partial_file).verify()
+        except Exception:
+            chunked_upload.delete()
+            return None
+
+        partial_file.seek(0)
+        product_image = save_product_image(File(partial_file, name=os.path.basename(chunked_upload.filename)))
+
+    chunked_upload.upload = product_image
+    chunked_upload.save(update_fields=['upload', 'updated_at'])
+    return product_image
+
+
+def purge_stale_chunked_uploads(max_age):
+    """
+    Delete unfinished uploads that have not received a chunk for `max_age`,
+    together with their partial files. Returns the number of uploads deleted.
+    """
+    stale = ChunkedUpload.objects.filter(upload__isnull=True, updated_at__lt=timezone.now() - max_age)
+    deleted = 0
+    for chunked_upload in stale.iterator():
+        _remove_partial_file(chunked_upload.partial_path)
+        chunked_upload.delete()
+        deleted += 1
+    return deleted
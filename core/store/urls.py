@@ -1,18 +1,27 @@
 from django.urls import path
 from .views import (
-    ProductCreateListView, ProductDetailView,
-    CartView, CartItemView, CategoryView, UploadProductImagesView
+    ProductCreateListView, ProductDetailView, ProductBulkView, ProductFeedView,
+    CartView, CartItemView, CategoryView, UploadProductImagesView,
+    WishlistView, ChunkedUploadView, ChunkedUploadDetailView, ProductImageUploadDetailView
 )
 
 urlpatterns = [
     # Product Endpoints ////////////////////
     path('categories/', CategoryView.as_view(), name='product-categories'),
     path('product_images/', UploadProductImagesView.as_view(), name='upload-prpduct-images'),
+    path('product_images/<int:pk>/', ProductImageUploadDetailView.as_view(), name='product-image-detail'),
+    path('product_images/chunked/', ChunkedUploadView.as_view(), name='chunked-upload'),
+    path('product_images/chunked/<uuid:pk>/', ChunkedUploadDetailView.as_view(), name='chunked-upload-detail'),
     path('products/', ProductCreateListView.as_view(), name='product-list'),
+    path('products/bulk/', ProductBulkView.as_view(), name='product-bulk'),
+    path('products/feed/', ProductFeedView.as_view(), name='product-feed'),
     path('products/<int:pk>/', ProductDetailView.as_view(), name='product-detail'),
 
     # Cart Endpoints /////////////////////
     path('cart/', CartView.as_view(), name='cart'),
     path('cart/<int:pk>/', CartItemView.as_view(), name='cart-items'),
     # path('cart/items/<int:pk>/', CartItemView.as_view(), name='cart-items'),
+
+    # Wishlist Endpoints /////////////////////
+    path('wishlist/', WishlistView.as_view(), name='wishlist'),
 ]
@@ -1,33 +1,150 @@
+from functools import partial
+from urllib.parse import urlencode, urlparse
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import prefetch_related_objects
+from django.db.models import Exists, OuterRef
+from django.http import StreamingHttpResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework import permissions
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
+from rest_framework.exceptions import ValidationError
 from rest_framework.pagination import PageNumberPagination
-from .models import Product, Cart, CartItem, Category, ProductImageUpload, ProductImage
+from core.common.cache import get_tiered_cache
+from core.common.timing import timed
+from .models import Product, Cart, CartItem, Category, ChunkedUpload, ProductImageUpload, ProductImage, Wishlist
 from . import serializers
+from .bulk_updates import bulk_update_products
+from .feed import decode_cursor, feed_lines
 from .filters import ProductsFilter, CategoryFilter
+from .uploads import (
+    BoundedTemporaryFileUploadHandler, UploadTooLarge, append_chunk,
+    complete_chunked_upload, save_product_image
+)
+
+
+categories_cache = get_tiered_cache('categories')
+products_cache = get_tiered_cache('products')
+
+
+def product_queryset():
+    return Product.objects.select_related('category').prefetch_related('images__upload__derivatives')
+
+
+def uploads_by_url(image_urls):
+    """
+    Map image URLs pointing at our own media storage to their ProductImageUpload rows.
+    """
+    names = {}
+    for url in image_urls:
+        path = urlparse(url).path
+        if path.startswith(settings.MEDIA_URL):
+            path = path[len(settings.MEDIA_URL):]
+        names[url] = path.lstrip('/')
+
+    uploads = {upload.image.name: upload for upload in ProductImageUpload.objects.filter(image__in=names.values())}
+    return {url: uploads.get(name) for url, name in names.items()}
+
+
+def annotate_wishlisted(queryset, user):
+    """
+    Flag products in the user's wishlist with a single Exists() subquery,
+    evaluated as part of the page query instead of once per product.
+    """
+    if not user.is_authenticated:
+        return queryset
+    return queryset.annotate(
+        is_wishlisted=Exists(Wishlist.objects.filter(user=user, product=OuterRef('pk')))
+    )
+
+
+def cart_quantities(products):
+    """
+    Sum the requested quantity per product ID, or return None if an entry is
+    not an object or has no valid product ID or quantity.
+    """
+    quantities = {}
+    for product_data in products:
+        if not isinstance(product_data, dict):
+            return None
+        try:
+            product_id = int(product_data.get("product"))
+            quantity = int(product_data.get("quantity", 1))
+        except (TypeError, ValueError):
+            return None
+        quantities[product_id] = quantities.get(product_id, 0) + quantity
+    return quantities
+
+
+def add_to_cart(cart, quantities):
+    """
+    Add quantities to the cart with one query for the existing items and one
+    bulk write each for updated and new items. Returns the items by product ID.
+    """
+    with transaction.atomic():
+        items = {
+            item.product_id: item
+            for item in CartItem.objects.select_for_update().filter(cart=cart, product_id__in=quantities)
+        }
+        for item in items.values():
+            item.quantity += quantities[item.product_id]
+        CartItem.objects.bulk_update(items.values(), ['quantity'])
+
+        new_items = CartItem.objects.bulk_create([
+            CartItem(cart=cart, product_id=product_id, quantity=quantity)
+            for product_id, quantity in quantities.items() if product_id not in items
+        ])
+        items.update({item.product_id: item for item in new_items})
+    return {product_id: items[product_id] for product_id in quantities}
+
+
+def category_page(request):
+    filterset = CategoryFilter(request.GET, queryset=Category.objects.all().order_by('id'))
+    category_count = filterset.qs.count()
+
+    # Pagination ///////////////////////
+    resPerPage = 20
+    paginator = PageNumberPagination()
+    paginator.page_size = resPerPage
+    queryset = paginator.paginate_queryset(filterset.qs, request)
+
+    serializer = serializers.CategorySerializer(queryset, many=True)
+    with timed('serialize'):
+        categories = serializer.data
+    return {
+        'categoryCount': category_count,
+        'resPerpage': resPerPage,
+        'Categories': categories
+    }
+
+
+def category_cache_key(request):
+    """
+    Cache key for a category page, built only from the parameters CategoryFilter
+    and the paginator read, in a fixed order. Unknown parameters cannot create
+    new keys, and reordering the known ones still hits the cache.
+    """
+    names = sorted([*CategoryFilter.base_filters, PageNumberPagination.page_query_param])
+    return urlencode([(name, request.GET[name]) for name in names if name in request.GET])
+
+
+def serialize_product(pk):
+    serializer = serializers.ProductSerializer(product_queryset().get(pk=pk))
+    with timed('serialize'):
+        return serializer.data
 
 
 class CategoryView(APIView):
     permission_classes = [permissions.AllowAny]
+    max_queries = {'GET': 3}
 
     def get(self, request):
-        filterset = CategoryFilter(request.GET, queryset=Category.objects.all().order_by('id'))
-        category_count = filterset.qs.count()
-
-        # Pagination ///////////////////////
-        resPerPage = 20
-        paginator = PageNumberPagination()
-        paginator.page_size = resPerPage
-        queryset = paginator.paginate_queryset(filterset.qs, request)
-
-        serializer = serializers.CategorySerializer(queryset, many=True)
-        return Response({
-            'categoryCount': category_count,
-            'resPerpage': resPerPage,
-            'Categories': serializer.data
-        })
+        # Invalidated by the Category signals, see signals.py.
+        data = categories_cache.get_or_set(category_cache_key(request), partial(category_page, request))
+        return Response(data)
 
 
 # Products Views ////////////////
@@ -35,6 +152,10 @@ class ProductCreateListView(APIView):
     """
     Retrieve a list of all products or add a new product (admin functionality).
     """
+    throttle_scope = 'search'
+    throttle_scope_methods = ['GET']
+    max_queries = {'GET': 6, 'POST': 8}
+
     def get_permissions(self):
         # Allow any unauthenticated user access
         if self.request.method == 'GET':
@@ -46,20 +167,22 @@ class ProductCreateListView(APIView):
         return super().get_permissions()
 
     def get(self, request):
-        filterset = ProductsFilter(request.GET, queryset=Product.objects.all().order_by('id'))
+        filterset = ProductsFilter(request.GET, queryset=product_queryset().order_by('id'))
         product_count = filterset.qs.count()
 
         # Pagination ///////////////////////
         resPerPage = 50
         paginator = PageNumberPagination()
         paginator.page_size = resPerPage
-        queryset = paginator.paginate_queryset(filterset.qs, request)
+        queryset = paginator.paginate_queryset(annotate_wishlisted(filterset.qs, request.user), request)
 
         serializer = serializers.ProductSerializer(queryset, many=True)
+        with timed('serialize'):
+            products = serializer.data
         return Response({
             'productCount': product_count,
             'resPerpage': resPerPage,
-            'Products': serializer.data
+            'Products': products
         })
 
     def post(self, request):
@@ -70,24 +193,99 @@ class ProductCreateListView(APIView):
         if serializer.is_valid():
             image_urls = serializer.validated_data.pop('image_urls', [])
 
-            product_name = serializer.validated_data['name']
-
-            if Product.objects.filter(name=product_name).exists():
+            # Name uniqueness is enforced by the unique_product_name constraint.
+            try:
+                with transaction.atomic():
+                    product = serializer.save()
+                    ProductImage.objects.bulk_create([
+                        ProductImage(product=product, image=image, upload=upload)
+                        for image, upload in uploads_by_url(image_urls).items()
+                    ])
+            except IntegrityError:
                 return Response({'error': 'A product with same details exists, please choose another name'}, status=status.HTTP_400_BAD_REQUEST)
 
-            product = serializer.save()
-
-            for image in image_urls:
-                ProductImage.objects.create(product=product, image=image)
-
+            prefetch_related_objects([product], 'images__upload__derivatives')
             return Response(serializer.data, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 
+class ProductBulkView(APIView):
+    """
+    Create many products and their images, or update prices and stock, in a
+    fixed number of queries (admin functionality).
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def post(self, request):
+        serializer = serializers.BulkProductCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        rows = serializer.validated_data['products']
+
+        try:
+            with transaction.atomic():
+                products = Product.objects.bulk_create([
+                    Product(**{field: value for field, value in row.items() if field != 'image_urls'})
+                    for row in rows
+                ])
+                uploads = uploads_by_url([url for row in rows for url in row['image_urls']])
+                ProductImage.objects.bulk_create([
+                    ProductImage(product=product, image=url, upload=uploads[url])
+                    for product, row in zip(products, rows)
+                    for url in dict.fromkeys(row['image_urls'])
+                ])
+        except IntegrityError:
+            return Response(
+                {'error': 'A product with same details exists, please choose another name'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        queryset = product_queryset().filter(pk__in=[product.pk for product in products]).order_by('id')
+        serializer = serializers.ProductSerializer(queryset, many=True)
+        return Response({
+            'productCount': len(products),
+            'Products': serializer.data
+        }, status=status.HTTP_201_CREATED)
+
+    def patch(self, request):
+        serializer = serializers.BulkProductUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(bulk_update_products(**serializer.validated_data))
+
+
+def feed_params(request):
+    """
+    Return the (cursor, limit) a feed request asks for, raising ValueError if
+    either parameter is invalid.
+    """
+    cursor = decode_cursor(request.GET['since']) if request.GET.get('since') else None
+    limit = int(request.GET['limit']) if request.GET.get('limit') else None
+    if limit is not None and limit < 1:
+        raise ValueError(limit)
+    return cursor, limit
+
+
+class ProductFeedView(APIView):
+    """
+    Stream products changed or deleted after the `since` resume token as NDJSON,
+    so partners can sync the catalog incrementally. The last line holds the next token.
+    """
+    permission_classes = [permissions.AllowAny]
+    throttle_scope = 'feed'
+
+    def get(self, request):
+        try:
+            cursor, limit = feed_params(request)
+        except ValueError:
+            return Response({'error': 'Invalid since or limit parameter.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        return StreamingHttpResponse(feed_lines(cursor, limit), content_type='application/x-ndjson')
+
+
 class ProductDetailView(APIView):
     """
     Retrieve, update, or delete a specific product by ID (admin functionality for PUT and DELETE).
     """
+    max_queries = {'GET': 5, 'PUT': 8}
 
     def get_permissions(self):
         if self.request.method == 'GET':
@@ -99,12 +297,15 @@ class ProductDetailView(APIView):
 
     def get(self, request, pk):
         try:
-            product = Product.objects.get(pk=pk)
-            serializer = serializers.ProductSerializer(product)
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # The shared representation is cached; only the per-user flag is queried.
+            data = products_cache.get_or_set(str(pk), partial(serialize_product, pk))
         except Product.DoesNotExist:
             return Response({'error': 'Product not found.'}, status=status.HTTP_404_NOT_FOUND)
 
+        if request.user.is_authenticated:
+            data = {**data, 'is_wishlisted': Wishlist.objects.filter(user=request.user, product_id=pk).exists()}
+        return Response(data, status=status.HTTP_200_OK)
+
     def put(self, request, pk):
         if not request.user.is_staff:
             return Response({'error': 'Only admins can update products.'}, status=status.HTTP_403_FORBIDDEN)
@@ -112,7 +313,14 @@ class ProductDetailView(APIView):
             product = Product.objects.get(pk=pk)
             serializer = serializers.ProductSerializer(product, data=request.data, partial=True)
             if serializer.is_valid():
-                serializer.save()
+                try:
+                    with transaction.atomic():
+                        serializer.save()
+                except IntegrityError:
+                    return Response(
+                        {'error': 'A product with same details exists, please choose another name'},
+                        status=status.HTTP_400_BAD_REQUEST
+                    )
                 return Response(serializer.data, status=status.HTTP_200_OK)
             return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
         except Product.DoesNotExist:
@@ -132,6 +340,11 @@ class ProductDetailView(APIView):
 class UploadProductImagesView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
+    def initialize_request(self, request, *args, **kwargs):
+        # Stream files to disk and enforce size limits before DRF parses the body.
+        request.upload_handlers = [BoundedTemporaryFileUploadHandler(request)]
+        return super().initialize_request(request, *args, **kwargs)
+
     def post(self, request, *args, **kwargs):
         serializer = serializers.CreaeteProductImageUploadSerializer(
             data=request.data)
@@ -140,22 +353,112 @@ class UploadProductImagesView(APIView):
 
         product_images_list = []
         for image in images:
-            product_image = ProductImageUpload.objects.create(
-                image=image,
-            )
+            product_image = save_product_image(image)
+            # Release the temporary file as soon as it has been stored.
+            image.close()
 
             product_images_list.append(product_image)
 
-        serializer = serializers.ProductImageSerializer(
+        serializer = serializers.ProductImageUploadSerializer(
             product_images_list, many=True)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+class ProductImageUploadDetailView(APIView):
+    """
+    Delete an uploaded image. Files shared by identical uploads are only
+    removed from storage when the last reference is released.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def delete(self, request, pk):
+        try:
+            product_image = ProductImageUpload.objects.get(pk=pk)
+        except ProductImageUpload.DoesNotExist:
+            return Response({'error': 'Image not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        product_image.release()
+        return Response({'message': 'Image deleted successfully.'}, status=status.HTTP_204_NO_CONTENT)
+
+
+class ChunkedUploadView(APIView):
+    """
+    Start a resumable upload for a large product image.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def post(self, request):
+        serializer = serializers.ChunkedUploadSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        serializer.save(user=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+
+class ChunkedUploadDetailView(APIView):
+    """
+    Report the progress of a resumable upload, or append the next chunk.
+    Chunks are sent as the raw request body with an `Upload-Offset` header.
+    """
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, pk):
+        try:
+            chunked_upload = ChunkedUpload.objects.select_related('upload').get(pk=pk, user=request.user)
+        except ChunkedUpload.DoesNotExist:
+            return Response({'error': 'Upload not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+        serializer = serializers.ChunkedUploadSerializer(chunked_upload)
+        return Response(serializer.data, headers={'Upload-Offset': str(chunked_upload.offset)})
+
+    def patch(self, request, pk):
+        try:
+            offset = int(request.headers['Upload-Offset'])
+            length = int(request.META.get('CONTENT_LENGTH') or 0)
+        except (KeyError, ValueError):
+            return Response({'error': 'A valid Upload-Offset header is required.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        if length > settings.CHUNKED_UPLOAD_MAX_CHUNK_SIZE:
+            raise UploadTooLarge(f'Chunks are limited to {settings.CHUNKED_UPLOAD_MAX_CHUNK_SIZE} bytes.')
+
+        invalid_image = False
+        with transaction.atomic():
+            try:
+                chunked_upload = ChunkedUpload.objects.select_for_update().get(pk=pk, user=request.user)
+            except ChunkedUpload.DoesNotExist:
+                return Response({'error': 'Upload not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+            if offset != chunked_upload.offset or chunked_upload.upload_id:
+                return Response(
+                    {'error': 'Upload offset does not match.', 'offset': chunked_upload.offset},
+                    status=status.HTTP_409_CONFLICT
+                )
+            if offset + length > chunked_upload.size:
+                return Response(
+                    {'error': 'Chunk exceeds the declared upload size.'}, status=status.HTTP_400_BAD_REQUEST
+                )
+
+            # Read the raw body straight from the WSGI stream, bypassing DRF's parsers.
+            append_chunk(chunked_upload, request._request, length)
+
+            # Still under the row lock, so a retried final chunk gets the 409 above.
+            if chunked_upload.is_complete:
+                invalid_image = complete_chunked_upload(chunked_upload) is None
+
+        if invalid_image:
+            raise ValidationError({'error': 'Uploaded file is not a valid image.'})
+
+        serializer = serializers.ChunkedUploadSerializer(chunked_upload)
+        return Response(serializer.data, headers={'Upload-Offset': str(chunked_upload.offset)})
+
+
 # Cart Views
 class CartView(APIView):
     """
     Retrieve the current state of the shopping cart or add a product to the cart.
     """
+    throttle_scope = 'cart'
+    throttle_scope_methods = ['POST', 'DELETE']
+    max_queries = {'GET': 5, 'POST': 8}
 
     def get_permissions(self):
         if self.request.method == 'GET':
@@ -164,13 +467,17 @@ class CartView(APIView):
             return [permissions.IsAuthenticated()]
 
     def get(self, request):
-        cart, _ = Cart.objects.get_or_create(user=request.user)
+        cart, _ = Cart.objects.select_related('user__profile').prefetch_related('items__product').get_or_create(
+            user=request.user
+        )
 
         if not cart.items.exists():
             return Response({'response': 'Shopping cart is empty'}, status=status.HTTP_200_OK)
 
         serializer = serializers.CartSerializer(cart)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        with timed('serialize'):
+            data = serializer.data
+        return Response(data, status=status.HTTP_200_OK)
 
     def post(self, request):
         user = request.user
@@ -182,38 +489,27 @@ class CartView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
+        quantities = cart_quantities(products)
+        if quantities is None:
+            return Response(
+                {"error": "Each product must have a valid product ID and quantity."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        # Check that every product exists with a single query
+        products_by_id = Product.objects.in_bulk(list(quantities))
+        if len(products_by_id) != len(quantities):
+            return Response({'error': 'Product not found'}, status=status.HTTP_400_BAD_REQUEST)
+
         # Get or create the user's cart
         cart, _ = Cart.objects.get_or_create(user=user)
+        items = add_to_cart(cart, quantities)
 
         cart_items_response = []
-        for product_data in products:
-            product_id = product_data.get("product")
-            quantity = product_data.get("quantity", 1)
-
-            if not product_id:
-                return Response(
-                    {"error": "Each product must have a valid product ID."},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-            # Check if the product exists
-            try:
-                product = Product.objects.get(id=product_id)
-            except Product.DoesNotExist:
-                return Response({'error': 'Product not found'}, status=status.HTTP_400_BAD_REQUEST)
-
-            # Check if the product already exists in the cart
-            cart_item, created = CartItem.objects.get_or_create(cart=cart, product=product)
-
-            if created:
-                # If a new CartItem was created, set its quantity
-                cart_item.quantity = quantity
-            else:
-                # If the CartItem exists, update the quantity
-                cart_item.quantity += int(quantity)
-
-            cart_item.save()
-            cart_items_response.append(serializers.CartItemSerializer(cart_item).data)
+        for product_id, cart_item in items.items():
+            cart_item.product = products_by_id[product_id]
+            with timed('serialize'):
+                cart_items_response.append(serializers.CartItemSerializer(cart_item).data)
 
         return Response(
             {"cart_items": cart_items_response},
@@ -226,6 +522,8 @@ class CartItemView(APIView):
     Update the quantity of a product in the cart or remove a product from the cart.
     """
     permission_classes = [IsAuthenticated]
+    throttle_scope = 'cart'
+    max_queries = {'PUT': 4, 'DELETE': 3}
 
     def put(self, request, pk):
         try:
@@ -245,3 +543,60 @@ class CartItemView(APIView):
             return Response({'message': 'Item removed from cart.'}, status=status.HTTP_204_NO_CONTENT)
         except CartItem.DoesNotExist:
             return Response({'error': 'Cart item not found.'}, status=status.HTTP_404_NOT_FOUND)
+
+
+# Wishlist Views
+class WishlistView(APIView):
+    """
+    List the user's wishlist, or add/remove products in bulk.
+    """
+    permission_classes = [IsAuthenticated]
+    max_queries = {'GET': 3, 'POST': 3, 'DELETE': 2}
+
+    def get(self, request):
+        queryset = Wishlist.objects.filter(user=request.user).select_related('product').order_by('-created_at')
+        wishlist_count = queryset.count()
+
+        # Pagination ///////////////////////
+        resPerPage = 50
+        paginator = PageNumberPagination()
+        paginator.page_size = resPerPage
+        page = paginator.paginate_queryset(queryset, request)
+
+        serializer = serializers.WishlistSerializer(page, many=True)
+        with timed('serialize'):
+            wishlist = serializer.data
+        return Response({
+            'wishlistCount': wishlist_count,
+            'resPerpage': resPerPage,
+            'Wishlist': wishlist
+        })
+
+    def post(self, request):
+        serializer = serializers.WishlistBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        product_ids = set(serializer.validated_data['products'])
+
+        existing_ids = set(Product.objects.filter(pk__in=product_ids).values_list('pk', flat=True))
+        missing_ids = product_ids - existing_ids
+        if missing_ids:
+            return Response(
+                {'error': 'Product not found', 'products': sorted(missing_ids)},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # Products already in the wishlist are skipped by the unique constraint.
+        Wishlist.objects.bulk_create(
+            [Wishlist(user=request.user, product_id=product_id) for product_id in existing_ids],
+            ignore_conflicts=True
+        )
+        return Response({'products': sorted(existing_ids)}, status=status.HTTP_201_CREATED)
+
+    def delete(self, request):
+        serializer = serializers.WishlistBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        removed, _ = Wishlist.objects.filter(
+            user=request.user, product_id__in=serializer.validated_data['products']
+        ).delete()
+        return Response({'removed': removed}, status=status.HTTP_200_OK)
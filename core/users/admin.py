@@ -1,10 +1,11 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.utils.translation import gettext_lazy as _
+from core.common.admin import LargeTableAdminMixin
 from .forms import UserChangeForm, UserCreationForm
 from .models import User
 
-class UserAdmin(BaseUserAdmin):
+class UserAdmin(LargeTableAdminMixin, BaseUserAdmin):
     ordering = ['email']
     form = UserChangeForm
     add_form = UserCreationForm
@@ -12,7 +13,7 @@ class UserAdmin(BaseUserAdmin):
 
     list_display = ['pkid', 'id', 'email', 'first_name', 'last_name', 'is_staff', 'is_active']
     list_display_links = ['pkid', 'id', 'email']
-    list_filter = ['email', 'is_staff', 'is_active']
+    list_filter = ['is_staff', 'is_active']
     fieldsets = (
         (_('Login Credentials'), {'fields': ('email', 'password')}),
         (_('Personal Info'), {'fields': ('first_name', 'last_name')}),
@@ -26,6 +27,6 @@ class UserAdmin(BaseUserAdmin):
             'fields': ('email', 'first_name', 'last_name', 'password1', 'password2')
         })
     )
-    search_fields = ['email', 'first_name', 'last_name']
+    search_fields = ['email']
 
 admin.site.register(User, UserAdmin)
@@ -6,3 +6,6 @@ class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core.users'
     verbose_name = _('Users')
+
+    def ready(self):
+        from core.users import signals
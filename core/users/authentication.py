@@ -0,0 +1,38 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.utils.translation import gettext_lazy as _
+from dj_rest_auth.jwt_auth import JWTCookieAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+from .cache import cache_get, cache_set, user_cache_key
+
+User = get_user_model()
+
+
+class CachedJWTCookieAuthentication(JWTCookieAuthentication):
+    """
+    JWT cookie/header authentication that resolves the user, with its profile,
+    from a short-TTL cache instead of querying the database on every request.
+    Cached entries are versioned per user and invalidated on User/Profile saves.
+    """
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken(_('Token contained no recognizable user identification'))
+
+        key = user_cache_key('auth-user', user_id)
+        user = cache_get(key)
+        if user is None:
+            try:
+                user = User.objects.select_related('profile').get(**{api_settings.USER_ID_FIELD: user_id})
+            except User.DoesNotExist:
+                raise AuthenticationFailed(_('User not found'), code='user_not_found')
+            cache_set(key, user, settings.AUTH_USER_CACHE_TIMEOUT)
+
+        if not user.is_active:
+            raise AuthenticationFailed(_('User is inactive'), code='user_inactive')
+
+        return user
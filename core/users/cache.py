@@ -0,0 +1,63 @@
+import logging
+import uuid
+
+import redis
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+USER_CACHE_VERSION_KEY = 'user-cache-version:{user_id}'
+
+
+def get_user_cache_version(user_id):
+    """
+    Return the current cache version for a user. Every cached value derived from
+    the user embeds this version, so bumping it invalidates all of them at once.
+    Returns None when Redis is unavailable.
+    """
+    key = USER_CACHE_VERSION_KEY.format(user_id=user_id)
+    try:
+        version = cache.get(key)
+        if version is None:
+            cache.add(key, uuid.uuid4().hex, None)
+            version = cache.get(key)
+    except redis.RedisError as error:
+        logger.warning(f'User cache unavailable: {error}')
+        return None
+    return version
+
+
+def user_cache_key(prefix, user_id):
+    """
+    Return the versioned key for a value derived from the user, or None when
+    Redis is unavailable, which cache_get() and cache_set() treat as a miss.
+    """
+    version = get_user_cache_version(user_id)
+    return None if version is None else f'{prefix}:{user_id}:{version}'
+
+
+def cache_get(key):
+    if key is None:
+        return None
+    try:
+        return cache.get(key)
+    except redis.RedisError as error:
+        logger.warning(f'User cache unavailable: {error}')
+        return None
+
+
+def cache_set(key, value, timeout):
+    if key is None:
+        return
+    try:
+        cache.set(key, value, timeout)
+    except redis.RedisError as error:
+        logger.warning(f'User cache unavailable: {error}')
+
+
+def invalidate_user_cache(user_id):
+    try:
+        cache.set(USER_CACHE_VERSION_KEY.format(user_id=user_id), uuid.uuid4().hex, None)
+    except redis.RedisError as error:
+        # Entries cached before the outage expire with their own timeout.
+        logger.warning(f'Could not invalidate cached data for user {user_id}: {error}')
@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.contrib.auth.hashers import Argon2PasswordHasher
+
+
+def get_hashing_profile():
+    return settings.PASSWORD_HASHING_PROFILES[settings.PASSWORD_HASHING_PROFILE]
+
+
+class ProfiledArgon2PasswordHasher(Argon2PasswordHasher):
+    """
+    Argon2 hasher whose cost parameters come from the active
+    PASSWORD_HASHING_PROFILE. Hashes made with other parameters report
+    `must_update`, so they are transparently rehashed on the next login.
+    """
+
+    @property
+    def time_cost(self):
+        return get_hashing_profile()['time_cost']
+
+    @property
+    def memory_cost(self):
+        return get_hashing_profile()['memory_cost']
+
+    @property
+    def parallelism(self):
+        return get_hashing_profile()['parallelism']
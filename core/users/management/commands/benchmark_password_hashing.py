@@ -0,0 +1,53 @@
+import os
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import check_password, make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+
+
+class Command(BaseCommand):
+    help = 'Measure password verification throughput for each PASSWORD_HASHING_PROFILES entry.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'profiles', nargs='*',
+            help='Profiles to benchmark (defaults to all configured profiles).'
+        )
+        parser.add_argument(
+            '--iterations', type=int, default=20,
+            help='Number of password checks per profile.'
+        )
+
+    def handle(self, *args, **options):
+        profiles = options['profiles'] or list(settings.PASSWORD_HASHING_PROFILES)
+        unknown = set(profiles) - set(settings.PASSWORD_HASHING_PROFILES)
+        if unknown:
+            raise CommandError(f'Unknown hashing profiles: {", ".join(sorted(unknown))}')
+
+        iterations = options['iterations']
+        cpu_count = os.cpu_count() or 1
+        self.stdout.write(
+            f'{"profile":<12} {"t":>3} {"m (KiB)":>9} {"p":>3} {"ms/login":>10} {"logins/s":>10} {"logins/s/core":>14}'
+        )
+
+        for name in profiles:
+            params = settings.PASSWORD_HASHING_PROFILES[name]
+            with override_settings(PASSWORD_HASHING_PROFILE=name):
+                encoded = make_password('benchmark-password')
+
+                start = time.perf_counter()
+                for _ in range(iterations):
+                    check_password('benchmark-password', encoded)
+                elapsed = time.perf_counter() - start
+
+            per_second = iterations / elapsed
+            # Argon2 runs one thread per lane, so a login occupies up to `parallelism` cores.
+            cores_used = min(params['parallelism'], cpu_count)
+            self.stdout.write(
+                f'{name:<12} {params["time_cost"]:>3} {params["memory_cost"]:>9} {params["parallelism"]:>3} '
+                f'{elapsed / iterations * 1000:>10.1f} {per_second:>10.1f} {per_second / cores_used:>14.1f}'
+            )
+
+        self.stdout.write(f'Active profile: {settings.PASSWORD_HASHING_PROFILE} ({cpu_count} CPUs available)')
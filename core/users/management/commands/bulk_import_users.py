@@ -0,0 +1,162 @@
+import csv
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import django
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import identify_hasher, make_password
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.profiles.models import Profile
+
+User = get_user_model()
+
+PROFILE_FIELDS = ['phone_number', 'gender', 'country', 'city', 'about_me']
+
+
+def _init_worker():
+    # Needed when worker processes are spawned rather than forked.
+    django.setup()
+
+
+def read_rows(path, file_format):
+    """
+    Yield rows one at a time. JSONL lines that are not valid JSON are yielded
+    as None so they can be rejected individually.
+    """
+    with open(path, newline='', encoding='utf-8') as source:
+        if file_format == 'csv':
+            yield from csv.DictReader(source)
+        else:
+            for line in source:
+                if line.strip():
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        yield None
+
+
+class Command(BaseCommand):
+    help = (
+        'Stream users from a CSV or JSONL file and insert them with their profiles using bulk_create. '
+        'Rows carry either a plaintext `password` (hashed in parallel worker processes) or a '
+        '`password_hash` in Django format. Existing emails are skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='CSV or JSONL file to import.')
+        parser.add_argument('--format', choices=['csv', 'jsonl'], help='Defaults to the file extension.')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Rows inserted per transaction.')
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help='Processes used to hash plaintext passwords (defaults to the CPU count, 1 hashes inline).'
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('jsonl' if path.endswith(('.jsonl', '.ndjson')) else 'csv')
+        chunk_size = options['chunk_size']
+        self.created = self.skipped = self.rejected = 0
+
+        start = time.perf_counter()
+        executor = None if options['workers'] == 1 else ProcessPoolExecutor(
+            max_workers=options['workers'], initializer=_init_worker
+        )
+        try:
+            rows = enumerate(read_rows(path, file_format), start=1)
+            while chunk := list(islice(rows, chunk_size)):
+                self.import_chunk(chunk, executor)
+                elapsed = time.perf_counter() - start
+                self.stdout.write(
+                    f'{self.created} created, {self.skipped} skipped, {self.rejected} rejected '
+                    f'({self.created / elapsed:.0f} users/s)'
+                )
+        except (OSError, ValueError) as error:
+            raise CommandError(f'Could not read {path}: {error}')
+        finally:
+            if executor:
+                executor.shutdown()
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Imported {self.created} users ({self.skipped} skipped, {self.rejected} rejected).'
+        ))
+
+    def reject(self, number, reason):
+        self.rejected += 1
+        self.stderr.write(f'row {number}: {reason}')
+
+    def build(self, row):
+        """
+        Return unsaved (user, profile) instances for a row, raising
+        ValidationError if it breaks the model field constraints.
+        """
+        if not isinstance(row, dict):
+            raise ValidationError('not a JSON object')
+        email = row.get('email') or ''
+        if not isinstance(email, str) or not email.strip() or not row.get('first_name') or not row.get('last_name'):
+            raise ValidationError('email, first_name and last_name are required')
+        password = row.get('password')
+        password_hash = row.get('password_hash')
+        if not isinstance(password or '', str) or not isinstance(password_hash or '', str):
+            raise ValidationError('password and password_hash must be strings')
+        if password_hash:
+            try:
+                identify_hasher(password_hash)
+            except ValueError:
+                raise ValidationError('unknown password_hash format')
+
+        # The same checks as create_user, plus the column lengths and choices bulk_create skips.
+        user = User(
+            email=User.objects.normalize_email(email.strip()), first_name=row['first_name'],
+            last_name=row['last_name'], password=password_hash or ''
+        )
+        user.clean_fields(exclude=[] if password_hash else ['password'])
+        values = {field: row[field] for field in PROFILE_FIELDS if row.get(field)}
+        profile = Profile(**values)
+        # Only the given values: the model's own phone_number default does not validate.
+        profile.clean_fields(exclude=[field.name for field in Profile._meta.fields if field.name not in values])
+        return user, profile
+
+    def import_chunk(self, chunk, executor):
+        rows = {}
+        for number, row in chunk:
+            try:
+                user, profile = self.build(row)
+            except ValidationError as error:
+                if hasattr(error, 'error_dict'):
+                    self.reject(number, '; '.join(
+                        f'{field}: {" ".join(messages)}' for field, messages in error.message_dict.items()
+                    ))
+                else:
+                    self.reject(number, ' '.join(error.messages))
+                continue
+            if user.email in rows:
+                self.skipped += 1
+                continue
+            rows[user.email] = (user, profile, row.get('password') or None)
+
+        existing = set(User.objects.filter(email__in=list(rows)).values_list('email', flat=True))
+        self.skipped += len(existing)
+        rows = {email: entry for email, entry in rows.items() if email not in existing}
+
+        plaintext = [(user, password) for user, _, password in rows.values() if not user.password]
+        raw_passwords = [password for _, password in plaintext]
+        hashed = executor.map(make_password, raw_passwords, chunksize=64) if executor else map(
+            make_password, raw_passwords
+        )
+        for (user, _), password in zip(plaintext, hashed):
+            user.password = password
+
+        # bulk_create skips post_save, so profiles are created here instead of by the signal.
+        with transaction.atomic():
+            users = User.objects.bulk_create([user for user, _, _ in rows.values()])
+            profiles = []
+            for user, (_, profile, _) in zip(users, rows.values()):
+                profile.user = user
+                profiles.append(profile)
+            Profile.objects.bulk_create(profiles)
+        self.created += len(users)
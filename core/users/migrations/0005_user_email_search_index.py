@@ -0,0 +1,28 @@
+# Generated by Django 4.1.7 on 2026-10-19 18:02
+
+from django.db import migrations
+
+# Case-insensitive prefix search in the admin runs UPPER(email::text) LIKE 'TERM%'.
+EMAIL_SEARCH_INDEX = "users_user_email_upper_like"
+
+
+def create_email_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(
+            f"CREATE INDEX {EMAIL_SEARCH_INDEX} ON users_user (UPPER(email) text_pattern_ops)"
+        )
+
+
+def drop_email_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {EMAIL_SEARCH_INDEX}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("users", "0004_remove_user_priviledge"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_email_search_index, drop_email_search_index),
+    ]
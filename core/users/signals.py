@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from azubisc.settings.base import AUTH_USER_MODEL
+from core.users.cache import invalidate_user_cache
+
+
+@receiver(post_save, sender=AUTH_USER_MODEL)
+@receiver(post_delete, sender=AUTH_USER_MODEL)
+def invalidate_cached_user(sender, instance, **kwargs):
+    # Covers password changes and deactivation, which both save the user.
+    invalidate_user_cache(instance.id)
@@ -0,0 +1,21 @@
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+
+User = get_user_model()
+
+
+@pytest.fixture
+def api_client():
+    return APIClient()
+
+
+@pytest.fixture
+def user():
+    return User.objects.create_user(
+        first_name="John",
+        last_name='Doe',
+        email='cobblaheyram@yahoo.com',
+        password="password"
+    )
@@ -0,0 +1,19 @@
+import factory
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from factory.django import DjangoModelFactory
+
+User = get_user_model()
+
+# Hashing a real password per user would dominate seeding time.
+UNUSABLE_PASSWORD = make_password(None)
+
+
+class UserFactory(DjangoModelFactory):
+    class Meta:
+        model = User
+
+    first_name = factory.Faker('first_name')
+    last_name = factory.Faker('last_name')
+    email = factory.Sequence(lambda n: f'user{n}@example.com')
+    password = UNUSABLE_PASSWORD
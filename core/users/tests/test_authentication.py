@@ -0,0 +1,69 @@
+import pytest
+import redis
+from django.contrib.auth import get_user_model
+from django.core.cache.backends.locmem import LocMemCache
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from core.store import tasks
+
+
+def auth_header(user):
+    return {'HTTP_AUTHORIZATION': f'Bearer {RefreshToken.for_user(user).access_token}'}
+
+
+@pytest.mark.django_db
+def test_authenticated_user_is_cached(api_client, user, django_assert_num_queries):
+    headers = auth_header(user)
+    with django_assert_num_queries(1):
+        response = api_client.get("http://localhost:9090/api/v1/auth/user/", **headers)
+    assert response.status_code == 200
+    assert response.data["city"] == user.profile.city
+
+    with django_assert_num_queries(0):
+        response = api_client.get("http://localhost:9090/api/v1/auth/user/", **headers)
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_profile_change_invalidates_cached_user(api_client, user):
+    headers = auth_header(user)
+    api_client.get("http://localhost:9090/api/v1/auth/user/", **headers)
+
+    user.profile.city = 'Kumasi'
+    user.profile.save()
+
+    response = api_client.get("http://localhost:9090/api/v1/auth/user/", **headers)
+    assert response.data["city"] == 'Kumasi'
+
+
+@pytest.mark.django_db
+def test_deactivation_revokes_cached_user(api_client, user):
+    headers = auth_header(user)
+    assert api_client.get("http://localhost:9090/api/v1/auth/user/", **headers).status_code == 200
+
+    user.is_active = False
+    user.save()
+
+    assert api_client.get("http://localhost:9090/api/v1/auth/user/", **headers).status_code == 401
+
+
+@pytest.mark.django_db
+def test_redis_outage_falls_back_to_database(api_client, monkeypatch):
+    def unavailable(*args, **kwargs):
+        raise redis.exceptions.ConnectionError('Connection refused.')
+
+    for method in ('get', 'add', 'set'):
+        monkeypatch.setattr(LocMemCache, method, unavailable)
+    queued = []
+    monkeypatch.setattr(tasks.notify_wishlisters, 'delay', lambda *args: queued.append(args))
+
+    user = get_user_model().objects.create_user(
+        first_name="Ama", last_name="Mensah", email="ama@example.com", password="password"
+    )
+    response = api_client.get("http://localhost:9090/api/v1/auth/user/", **auth_header(user))
+    assert response.status_code == 200
+    assert response.data["email"] == "ama@example.com"
+
+    # The notification throttle fails open.
+    assert tasks.enqueue_wishlist_notification(1, tasks.PRICE_DROP)
+    assert queued == [(1, tasks.PRICE_DROP)]
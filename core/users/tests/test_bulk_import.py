@@ -0,0 +1,64 @@
+import json
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management import call_command
+
+from core.profiles.models import Profile
+
+User = get_user_model()
+
+
+@pytest.mark.django_db
+def test_bulk_import_users(tmp_path, user):
+    rows = [
+        {"email": "ama@example.com", "first_name": "Ama", "last_name": "Mensah", "password": "secret-1",
+         "city": "Kumasi"},
+        {"email": "kofi@example.com", "first_name": "Kofi", "last_name": "Boateng",
+         "password_hash": make_password("secret-2")},
+        {"email": user.email, "first_name": "John", "last_name": "Doe", "password": "password"},
+        {"email": "", "first_name": "No", "last_name": "Email"},
+    ]
+    path = tmp_path / "users.jsonl"
+    path.write_text("\n".join(json.dumps(row) for row in rows))
+
+    out = StringIO()
+    call_command("bulk_import_users", str(path), "--workers", "1", "--chunk-size", "2", stdout=out)
+
+    assert "Imported 2 users (1 skipped, 1 rejected)." in out.getvalue()
+    ama = User.objects.get(email="ama@example.com")
+    assert ama.check_password("secret-1")
+    assert ama.profile.city == "Kumasi"
+    assert User.objects.get(email="kofi@example.com").check_password("secret-2")
+    assert Profile.objects.count() == 3
+
+
+@pytest.mark.django_db
+def test_bulk_import_users_rejects_malformed_lines(tmp_path):
+    path = tmp_path / "users.jsonl"
+    path.write_text("\n".join([
+        '{"email": "ama@example.com", "first_name": "Ama",',
+        json.dumps(["not", "an", "object"]),
+        json.dumps({"email": 123, "first_name": "No", "last_name": "Email"}),
+        json.dumps({"email": "kofi@example.com", "first_name": "Kofi", "last_name": "Boateng", "password": "x"}),
+        json.dumps({"email": "not-an-email", "first_name": "No", "last_name": "Email"}),
+        json.dumps({"email": "long@example.com", "first_name": "A" * 256, "last_name": "Long"}),
+        json.dumps({"email": "gender@example.com", "first_name": "G", "last_name": "G", "gender": "Unknown"}),
+        json.dumps({"email": "country@example.com", "first_name": "C", "last_name": "C", "country": "Atlantis"}),
+        json.dumps({"email": "hash@example.com", "first_name": "H", "last_name": "H", "password_hash": 42}),
+    ]))
+
+    out, err = StringIO(), StringIO()
+    call_command("bulk_import_users", str(path), "--workers", "1", stdout=out, stderr=err)
+
+    assert "Imported 1 users (0 skipped, 8 rejected)." in out.getvalue()
+    assert "row 5: email: Enter a valid email address." in err.getvalue()
+    assert "row 6: first_name: Ensure this value has at most 255 characters" in err.getvalue()
+    assert "row 7: gender:" in err.getvalue()
+    assert "row 8: country:" in err.getvalue()
+    assert "row 9: password and password_hash must be strings" in err.getvalue()
+    assert "row 1: not a JSON object" in err.getvalue()
+    assert "row 3: email, first_name and last_name are required" in err.getvalue()
+    assert User.objects.filter(email="kofi@example.com").exists()
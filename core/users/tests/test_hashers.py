@@ -0,0 +1,23 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+
+@pytest.mark.django_db
+def test_password_is_rehashed_when_profile_changes(settings, user):
+    settings.PASSWORD_HASHING_PROFILE = 'interactive'
+    user.set_password('password')
+    user.save()
+    assert 'm=19456,t=2,p=1' in user.password
+
+    settings.PASSWORD_HASHING_PROFILE = 'balanced'
+    assert user.check_password('password')
+    user.refresh_from_db()
+    assert 'm=65536,t=2,p=2' in user.password
+
+
+def test_benchmark_password_hashing():
+    out = StringIO()
+    call_command('benchmark_password_hashing', 'interactive', '--iterations', '1', stdout=out)
+    assert 'interactive' in out.getvalue()
@@ -0,0 +1,29 @@
+import pytest
+
+
+@pytest.mark.django_db
+def test_user_details_single_query_then_cached(api_client, user, django_assert_num_queries):
+    # A freshly loaded user without its profile, as other authenticators return it.
+    user = type(user).objects.get(pk=user.pk)
+    api_client.force_authenticate(user=user)
+
+    with django_assert_num_queries(1):
+        response = api_client.get("http://localhost:9090/api/v1/auth/user/")
+    assert response.status_code == 200
+    assert response.data["email"] == user.email
+
+    with django_assert_num_queries(0):
+        cached = api_client.get("http://localhost:9090/api/v1/auth/user/")
+    assert cached.data == response.data
+
+
+@pytest.mark.django_db
+def test_user_details_invalidated_on_change(api_client, user):
+    api_client.force_authenticate(user=user)
+    api_client.get("http://localhost:9090/api/v1/auth/user/")
+
+    user.first_name = "Jane"
+    user.save()
+
+    response = api_client.get("http://localhost:9090/api/v1/auth/user/")
+    assert response.data["first_name"] == "Jane"
@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib.auth import get_user_model
 
 from rest_framework.permissions import IsAuthenticated, AllowAny
@@ -8,6 +9,7 @@ from rest_framework.response import Response
 from rest_framework import status
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework.throttling import UserRateThrottle
+from .cache import cache_get, cache_set, user_cache_key
 
 
 User = get_user_model()
@@ -18,7 +20,20 @@ class CustomUserDetailsView(RetrieveUpdateAPIView):
     permission_classes = [IsAuthenticated]
 
     def get_object(self):
-        return self.request.user
+        user = self.request.user
+        # CachedJWTCookieAuthentication loads the profile already; other authenticators may not.
+        if not User.profile.is_cached(user):
+            user = User.objects.select_related('profile').get(pk=user.pk)
+        return user
+
+    def retrieve(self, request, *args, **kwargs):
+        # Invalidated with the user's cache version whenever the User or Profile changes.
+        key = user_cache_key('user-detail', request.user.id)
+        data = cache_get(key)
+        if data is None:
+            data = dict(self.get_serializer(self.get_object()).data)
+            cache_set(key, data, settings.USER_DETAIL_CACHE_TIMEOUT)
+        return Response(data)
 
     def get_queryset(self):
         return get_user_model().objects.none()
@@ -38,6 +53,7 @@ class RegisterAdminUserView(APIView):
 
 class AdminLoginView(APIView):
     permission_classes = [AllowAny]
+    throttle_scope = 'login'
 
     def post(self, request):
         serrializer = AdminLoginSerializer(data=request.data)
@@ -1,5 +1,32 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from rest_framework.pagination import PageNumberPagination
 
 
 class AzubiPagination(PageNumberPagination):
     page_size = 50
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator for admin changelists on large tables. Unfiltered querysets on
+    PostgreSQL use the planner's row estimate instead of a full COUNT(*) once
+    the table is larger than `estimate_threshold` rows.
+    """
+    estimate_threshold = 100000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is not None and not query.where and connections[queryset.db].vendor == 'postgresql':
+            with connections[queryset.db].cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass',
+                    [queryset.model._meta.db_table]
+                )
+                row = cursor.fetchone()
+            if row and row[0] > self.estimate_threshold:
+                return row[0]
+        return super().count